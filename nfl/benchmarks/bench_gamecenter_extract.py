@@ -0,0 +1,79 @@
+"""
+Per-page gamecenter extraction: the old per-field parsers vs extract_gamecenter.
+
+    cd nfl && python -m benchmarks.bench_gamecenter_extract
+"""
+from __future__ import annotations
+
+import time
+
+from bs4 import BeautifulSoup as BS
+
+from benchmarks.legacy_gamecenter import (
+    get_roster_names,
+    get_roster_points,
+    get_starter_slots,
+    parse_bench_len,
+    parse_opponent_owner,
+    parse_opponent_total,
+    parse_owner,
+    parse_rank,
+    parse_team_name,
+    parse_team_projected_total,
+    parse_team_total,
+)
+from benchmarks.synthetic import gamecenter_html
+from src.page_parser import parse_html
+from src.utils.gamecenterCsvUtils import build_row, compute_diff, compute_result, compute_starter_extremes
+from src.utils.parse_gamecenter import extract_gamecenter
+
+
+def legacy_row(soup: BS, starter_slots: list[str], longest_bench_len: int) -> list[str]:
+    """build_row as it was before the single-pass extractor: one tree search per field."""
+    expected = len(starter_slots) + longest_bench_len
+    roster = (get_roster_names(soup, longest_bench_len) + ["-"] * expected)[:expected]
+    points = (get_roster_points(soup) + ["-"] * expected)[:expected]
+    extremes = compute_starter_extremes(roster=roster, points=points, starter_count=len(starter_slots))
+    total, opp_owner, opp_total = parse_team_total(soup), parse_opponent_owner(soup), parse_opponent_total(soup)
+    flat = [x for pair in zip(roster, points) for x in pair]
+    return (
+        [parse_owner(soup), parse_team_name(soup), parse_rank(soup),
+         compute_result(total, opp_total, opp_owner), compute_diff(total, opp_total), *extremes]
+        + flat
+        + [total, parse_team_projected_total(soup), opp_owner, opp_total]
+    )
+
+
+def legacy(soup: BS) -> list[str]:
+    bench_len = parse_bench_len(soup)
+    return legacy_row(soup, get_starter_slots(soup), bench_len)
+
+
+def single_pass(soup: BS) -> list[str]:
+    page = extract_gamecenter(soup)[0]
+    return build_row(page, list(page.starter_slots), page.bench_len)
+
+
+def _time_per_page(fn, soups: list[BS], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for soup in soups:
+            fn(soup)
+    return (time.perf_counter() - start) / (repeat * len(soups))
+
+
+def main(pages: int = 24, repeat: int = 20) -> dict[str, float]:
+    html = [gamecenter_html(team_id=t % 12 + 1, week=t // 12 + 1).encode() for t in range(pages)]
+    soups = [parse_html(h, page_type="gamecenter", strain=True) for h in html]
+
+    for soup in soups:
+        assert legacy(soup) == single_pass(soup), "extractor output differs from legacy parsers"
+
+    before = _time_per_page(legacy, soups, repeat)
+    after = _time_per_page(single_pass, soups, repeat)
+    print(f"per-page extraction: before={before * 1e6:.0f}us after={after * 1e6:.0f}us ({before / after:.1f}x)")
+    return {"before_s": before, "after_s": after}
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Gamecenter parsing throughput: on the calling thread vs a process pool
+(what Scheduler(parse_processes=N) does: HTML bytes out, records back).
+
+    cd nfl && python -m benchmarks.bench_parse_pool
+"""
+from __future__ import annotations
+
+import os
+import time
+
+from benchmarks.synthetic import gamecenter_html
+from src.scheduler import new_parse_pool
+from src.scrapeWeek import parse_gamecenter_page
+
+
+def _serial(html: list[bytes]) -> float:
+    start = time.perf_counter()
+    for h in html:
+        parse_gamecenter_page(h, "utf-8")
+    return len(html) / (time.perf_counter() - start)
+
+
+def _pooled(html: list[bytes], processes: int) -> float:
+    with new_parse_pool(processes) as pool:
+        # Warm the workers up (imports) outside the timed region
+        list(pool.map(parse_gamecenter_page, html[:processes], ["utf-8"] * processes))
+        start = time.perf_counter()
+        list(pool.map(parse_gamecenter_page, html, ["utf-8"] * len(html), chunksize=1))
+        return len(html) / (time.perf_counter() - start)
+
+
+def main(pages: int = 192) -> dict[str, float]:
+    html = [gamecenter_html(team_id=t % 12 + 1, week=t // 12 + 1).encode() for t in range(pages)]
+    with new_parse_pool(1) as pool:
+        shipped = pool.submit(parse_gamecenter_page, html[0], "utf-8").result()
+    assert shipped == parse_gamecenter_page(html[0], "utf-8"), "records differ across the process boundary"
+
+    results = {"serial_pages_per_s": _serial(html)}
+    print(f"serial: {results['serial_pages_per_s']:.0f} pages/s")
+
+    cores = os.cpu_count() or 1
+    processes = 1
+    while processes <= cores:
+        rate = _pooled(html, processes)
+        results[f"pool{processes}_pages_per_s"] = rate
+        print(f"{processes} process(es): {rate:.0f} pages/s ({rate / results['serial_pages_per_s']:.1f}x serial)")
+        processes *= 2
+    return results
+
+
+if __name__ == "__main__":
+    main()
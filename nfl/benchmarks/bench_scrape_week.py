@@ -0,0 +1,77 @@
+"""
+scrape_week end to end (fetch, parse, CSV write) against the local stand-in
+site, with no network. The host limiter is opened up so the numbers are the
+scraper's own cost, not its politeness.
+
+    cd nfl && python -m benchmarks.bench_scrape_week [--teams 16] [--weeks 4] [--latency 0.01] [--json]
+
+src reads BASE_URL when it is first imported, so this must run in a fresh
+interpreter (benchmarks.suite starts it as a subprocess).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.fake_site import FakeSite, FakeSiteConfig
+
+
+def main(argv: list[str] | None = None) -> dict[str, float]:
+    parser = argparse.ArgumentParser(description="Benchmark scrape_week against the local stand-in site.")
+    parser.add_argument("--teams", type=int, default=16)
+    parser.add_argument("--weeks", type=int, default=4, help="Weeks scraped (one scrape_week call each).")
+    parser.add_argument("--latency", type=float, default=0.0, help="Stand-in response latency in seconds.")
+    parser.add_argument("--rate", type=float, default=1000.0, help="Host limiter requests/second.")
+    parser.add_argument("--json", action="store_true", help="Print only the results, as JSON.")
+    args = parser.parse_args(argv)
+
+    if "src.config" in sys.modules:
+        raise RuntimeError("bench_scrape_week must run before src is imported (BASE_URL is read at import)")
+
+    config = FakeSiteConfig(teams=args.teams, weeks=max(args.weeks, 1), latency=args.latency)
+    with tempfile.TemporaryDirectory() as tmp, FakeSite(config) as site:
+        os.environ["FANTASY_BASE_URL"] = site.base_url
+        # Archive, cookie jar and CSVs all go under output/ in the cwd
+        os.chdir(tmp)
+
+        from src.rate_limit import limiter_for
+        from src.scrapeWeek import scrape_week
+
+        limiter = limiter_for(site.base_url)
+        limiter.rate = limiter.max_rate = args.rate
+
+        start = time.perf_counter()
+        for week in range(1, args.weeks + 1):
+            scrape_week(
+                league_id="1",
+                season=2020,
+                week=week,
+                number_of_owners=args.teams,
+                cookie_string="bench=1",
+                out_csv_path=Path(tmp) / f"2020-{week}.csv",
+            )
+        elapsed = time.perf_counter() - start
+
+    results = {
+        "seconds_per_week": elapsed / args.weeks,
+        "pages_per_s": site.stats.pages / elapsed,
+        "requests_per_week": site.stats.requests / args.weeks,
+    }
+    if args.json:
+        print(json.dumps(results))
+    else:
+        print(site.stats.describe())
+        print(
+            f"scrape_week: {results['seconds_per_week'] * 1e3:.0f}ms/week, "
+            f"{results['pages_per_s']:.0f} pages/s, {results['requests_per_week']:.1f} requests/week"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    main()
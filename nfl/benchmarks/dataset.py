@@ -0,0 +1,110 @@
+"""
+A synthetic league history on disk, laid out like a real scrape (week CSVs
+and standings CSVs under output/), for the combine/aggregate/JSON benchmarks.
+Rows are built from GamecenterPage/TeamSeasonRow records and written with
+the scraper's own writers, so the files match what a scrape produces.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from benchmarks.synthetic import STARTER_SLOTS, bench_len, opponent, points, team_total
+from src.models import TeamSeasonRow
+from src.output_paths import ensure_output_paths
+from src.scrapeWeek import write_week_csv
+from src.utils.parse_gamecenter import GamecenterPage
+from src.writer import write_standings_csv
+
+FIRST_SEASON = 2006
+
+
+@dataclass(frozen=True)
+class Dataset:
+    root: Path
+    league_id: str
+    seasons: int
+    teams: int
+    weeks: int
+
+    @property
+    def output_dir(self) -> Path:
+        return self.root / "output"
+
+    @property
+    def gamecenter_root(self) -> Path:
+        return self.output_dir / f"{self.league_id}-history-teamgamecenter"
+
+    @property
+    def standings_dir(self) -> Path:
+        return self.output_dir / f"{self.league_id}-history-standings"
+
+    @property
+    def week_csvs(self) -> int:
+        return self.seasons * self.weeks
+
+
+def _manager(team_id: int, season_index: int, teams: int) -> str:
+    # Managers come and go: a pool a bit larger than the league rotates through
+    return f"Manager {(team_id - 1 + season_index) % (teams + 4) + 1}"
+
+
+def _page(team_id: int, week: int, season_index: int, teams: int) -> GamecenterPage:
+    opp = opponent(team_id, week, teams)
+    bench = tuple(f"Bench {team_id}-{j}" for j in range(bench_len(team_id, week)))
+    return GamecenterPage(
+        side=1,
+        team_id=team_id,
+        owner=_manager(team_id, season_index, teams),
+        team_name=f"Team {team_id} Name",
+        rank=f"({team_id})",
+        starter_slots=tuple(STARTER_SLOTS),
+        starters=tuple(f"Player {team_id}-{i}" for i in range(len(STARTER_SLOTS))),
+        bench=bench,
+        points=tuple(points(team_id, week, i) for i in range(len(STARTER_SLOTS)))
+        + tuple(points(team_id, week, 20 + j) for j in range(len(bench))),
+        total=f"{team_total(team_id, week):.2f}",
+        projected=f"{100 + team_id}.50",
+        opponent=_manager(opp, season_index, teams) if opp else "",
+        opponent_total=f"{team_total(opp, week):.2f}" if opp else "",
+        opponent_id=opp,
+    )
+
+
+def _standings(season_index: int, teams: int) -> list[TeamSeasonRow]:
+    return [
+        TeamSeasonRow(
+            team_id=str(t),
+            team_name=f"Team {t} Name",
+            regular_season_rank=str((t + season_index) % teams + 1),
+            wins=(t * 3 + season_index) % 14,
+            losses=13 - (t * 3 + season_index) % 14,
+            ties=0,
+            points_for=f"{1400 + (t * 37 + season_index * 11) % 300}.50",
+            points_against=f"{1400 + (t * 53 + season_index * 7) % 300}.25",
+            playoff_rank=str((t * 5 + season_index) % teams + 1),
+            manager_name=_manager(t, season_index, teams),
+            moves=str((t + season_index) % 20),
+            trades=str((t * season_index) % 4),
+        )
+        for t in range(1, teams + 1)
+    ]
+
+
+def build_dataset(root: Path, *, league_id: str, seasons: int = 20, teams: int = 16, weeks: int = 18) -> Dataset:
+    """Write the dataset under root/output (root is typically a temporary directory)."""
+    dataset = Dataset(root=root, league_id=league_id, seasons=seasons, teams=teams, weeks=weeks)
+    team_ids = list(range(1, teams + 1))
+    for season_index in range(seasons):
+        season = FIRST_SEASON + season_index
+        paths = ensure_output_paths(league_id=league_id, season=season, base_output_dir=dataset.output_dir)
+        for week in range(1, weeks + 1):
+            write_week_csv(
+                season=season,
+                week=week,
+                team_ids=team_ids,
+                pages={t: _page(t, week, season_index, teams) for t in team_ids},
+                out_csv_path=paths.gamecenter_dir / f"{season}-{week}.csv",
+            )
+        write_standings_csv(paths.standings_csv, _standings(season_index, teams))
+    return dataset
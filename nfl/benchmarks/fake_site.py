@@ -0,0 +1,259 @@
+"""
+Local stand-in for fantasy.nfl.com: serves synthetic (or recorded) owners,
+standings and teamgamecenter pages, with optional latency, 429s and block
+pages, so scrapers and benchmarks run reproducibly with no network and no
+real cookie (any cookie_string is accepted).
+
+    cd nfl && python -m benchmarks.fake_site --port 8000 --latency 0.05 --rate-429 0.05
+    FANTASY_BASE_URL=http://127.0.0.1:8000 python -m src.scrapeAll
+
+Pages support ETag / If-None-Match, so live mode gets 304s.
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks.synthetic import (
+    block_html,
+    final_standings_html,
+    gamecenter_html,
+    owners_html,
+    regular_standings_html,
+)
+from src.html_archive import HtmlArchive
+
+# Recorded pages are looked up under the URL they were archived with
+RECORDED_BASE_URL = "https://fantasy.nfl.com"
+
+
+@dataclass
+class FakeSiteConfig:
+    teams: int = 12
+    weeks: int = 17
+    # Per-request delay: latency + uniform(0, jitter) seconds
+    latency: float = 0.0
+    jitter: float = 0.0
+    # Share of page requests answered 429 (with Retry-After) or with a block page
+    rate_429: float = 0.0
+    retry_after: float = 1.0
+    block_rate: float = 0.0
+    # Serve pages from this HTML archive when it has them (else synthetic)
+    archive_dir: Optional[Path] = None
+    gzip: bool = True
+    seed: int = 0
+
+
+@dataclass
+class FakeSiteStats:
+    requests: int = 0
+    pages: int = 0
+    throttled: int = 0
+    blocked: int = 0
+    not_modified: int = 0
+    bytes_sent: int = 0
+    # Most requests the server was answering at once
+    peak_concurrency: int = 0
+
+    def describe(self) -> str:
+        return (
+            f"fake site: requests={self.requests} pages={self.pages} 429s={self.throttled} "
+            f"blocks={self.blocked} 304s={self.not_modified} bytes={self.bytes_sent} "
+            f"peak_concurrency={self.peak_concurrency}"
+        )
+
+
+class FakeSite:
+    """
+    The stand-in server, on a background thread:
+
+        with FakeSite(FakeSiteConfig(latency=0.02)) as site:
+            ...  # point BASE_URL at site.base_url
+        print(site.stats.describe())
+    """
+
+    def __init__(self, config: Optional[FakeSiteConfig] = None, *, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.config = config or FakeSiteConfig()
+        self.stats = FakeSiteStats()
+        self.archive = HtmlArchive(self.config.archive_dir) if self.config.archive_dir else None
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._active = 0
+        self._server = ThreadingHTTPServer((host, port), _handler_for(self))
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> FakeSite:
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-site", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def _roll(self, rate: float) -> bool:
+        with self._lock:
+            return rate > 0 and self._random.random() < rate
+
+    def _enter(self) -> None:
+        with self._lock:
+            self.stats.requests += 1
+            self._active += 1
+            self.stats.peak_concurrency = max(self.stats.peak_concurrency, self._active)
+
+    def _leave(self, *, sent: int = 0, **counters: int) -> None:
+        with self._lock:
+            self._active -= 1
+            self.stats.bytes_sent += sent
+            for name, n in counters.items():
+                setattr(self.stats, name, getattr(self.stats, name) + n)
+
+    def page(self, path_and_query: str) -> Optional[str]:
+        """HTML for a site path, or None for a 404."""
+        if self.archive is not None:
+            entry = self.archive.latest(RECORDED_BASE_URL + path_and_query)
+            if entry is not None:
+                return self.archive.read(entry).decode(entry.encoding or "utf-8", errors="replace")
+
+        url = urlsplit(path_and_query)
+        query = parse_qs(url.query)
+        teams, weeks = self.config.teams, self.config.weeks
+        if url.path in ("", "/"):
+            return "<html><body>home</body></html>"
+        if url.path.endswith("/teamgamecenter"):
+            return gamecenter_html(int(query["teamId"][0]), int(query["week"][0]), teams=teams, weeks=weeks)
+        if url.path.endswith("/owners"):
+            return owners_html(teams=teams)
+        if url.path.endswith("/standings"):
+            if query.get("historyStandingsType") == ["final"]:
+                return final_standings_html(teams=teams)
+            return regular_standings_html(teams=teams)
+        return None
+
+
+def _handler_for(site: FakeSite) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            site._enter()
+            counters: dict[str, int] = {}
+            sent = 0
+            try:
+                config = site.config
+                if config.latency or config.jitter:
+                    time.sleep(config.latency + random.uniform(0, config.jitter))
+
+                is_page = self.path not in ("", "/")
+                if is_page:
+                    counters["pages"] = 1
+                if is_page and site._roll(config.rate_429):
+                    counters["throttled"] = 1
+                    sent = self._send(429, b"Too Many Requests", {"Retry-After": f"{config.retry_after:g}"})
+                    return
+                if is_page and site._roll(config.block_rate):
+                    counters["blocked"] = 1
+                    sent = self._send(200, block_html().encode("utf-8"))
+                    return
+
+                html = site.page(self.path)
+                if html is None:
+                    sent = self._send(404, b"Not Found")
+                    return
+                body = html.encode("utf-8")
+                etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+                if self.headers.get("If-None-Match") == etag:
+                    counters["not_modified"] = 1
+                    sent = self._send(304, b"", {"ETag": etag})
+                    return
+                headers = {"ETag": etag}
+                if not is_page:
+                    headers["Set-Cookie"] = "fake_session=1; Path=/"
+                sent = self._send(200, body, headers)
+            finally:
+                site._leave(sent=sent, **counters)
+
+        def _send(self, status: int, body: bytes, headers: Optional[dict[str, str]] = None) -> int:
+            if site.config.gzip and body and "gzip" in self.headers.get("Accept-Encoding", ""):
+                body = gzip.compress(body, compresslevel=5)
+                headers = {**(headers or {}), "Content-Encoding": "gzip"}
+            self.send_response(status)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            if status != 304:
+                self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if status != 304:
+                self.wfile.write(body)
+            return len(body)
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a local stand-in for fantasy.nfl.com.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--teams", type=int, default=FakeSiteConfig.teams)
+    parser.add_argument("--weeks", type=int, default=FakeSiteConfig.weeks)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra uniform(0, jitter) seconds.")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="Share of page requests answered 429.")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After sent with each 429.")
+    parser.add_argument("--block-rate", type=float, default=0.0, help="Share of page requests answered with a block page.")
+    parser.add_argument("--archive", type=Path, help="Serve recorded pages from this HTML archive when present.")
+    parser.add_argument("--no-gzip", action="store_true", help="Never compress responses.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    site = FakeSite(
+        FakeSiteConfig(
+            teams=args.teams,
+            weeks=args.weeks,
+            latency=args.latency,
+            jitter=args.jitter,
+            rate_429=args.rate_429,
+            retry_after=args.retry_after,
+            block_rate=args.block_rate,
+            archive_dir=args.archive,
+            gzip=not args.no_gzip,
+            seed=args.seed,
+        ),
+        host=args.host,
+        port=args.port,
+    )
+    print(f"Serving on {site.base_url}; run the scrapers with FANTASY_BASE_URL={site.base_url}")
+    try:
+        site.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(site.stats.describe())
+
+
+if __name__ == "__main__":
+    main()
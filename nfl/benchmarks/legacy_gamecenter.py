@@ -0,0 +1,141 @@
+"""
+The per-field gamecenter parsers extract_gamecenter replaced, kept as the
+reference its output is checked against. Each helper searches the page
+from the top; none of this is used by the scrapers.
+"""
+from __future__ import annotations
+
+import re
+
+from bs4 import BeautifulSoup
+
+
+def find_team_wrap(soup: BeautifulSoup, side: int = 1):
+    matchup = soup.find("div", id="teamMatchupBoxScore")
+    if not matchup:
+        return None
+    return matchup.find("div", class_=re.compile(rf"\bteamWrap\b.*\bteamWrap-{side}\b"))
+
+
+def _nth(items: list, side: int):
+    return items[side - 1] if len(items) >= side else None
+
+
+def parse_owner(soup: BeautifulSoup, side: int = 1) -> str:
+    owner_span = _nth(soup.find_all("span", class_=re.compile(r"userName\s+userId")), side)
+    return owner_span.get_text(strip=True) if owner_span else "-"
+
+
+def parse_team_total(soup: BeautifulSoup, side: int = 1) -> str:
+    total = _nth(soup.find_all("div", class_=re.compile(r"teamTotal\s+teamId-")), side)
+    return total.get_text(strip=True) if total else "-"
+
+
+def parse_bench_len(soup: BeautifulSoup, side: int = 1) -> int:
+    bench_wrap = soup.find("div", id=f"tableWrapBN-{side}")
+    if not bench_wrap:
+        return 0
+    return len(bench_wrap.find_all("td", class_="playerNameAndInfo"))
+
+
+def parse_rank(soup: BeautifulSoup, side: int = 1) -> str:
+    # rank_text looks like "... (3) ..." -> extract inside parentheses
+    rank_span = _nth(soup.find_all("span", class_=re.compile(r"teamRank\s+teamId-")), side)
+    rank_text = rank_span.get_text(strip=True) if rank_span else ""
+    m = re.search(r"\((\d+)\)", rank_text)
+    return m.group(1) if m else "-"
+
+
+def parse_opponent_owner(soup: BeautifulSoup, side: int = 1) -> str:
+    team_wrap_2 = find_team_wrap(soup, 3 - side)
+    if not team_wrap_2:
+        return "-"
+
+    # Primary: opponent team name appears in <h4>...</h4>
+    h4 = team_wrap_2.find("h4")
+    if h4:
+        text = h4.get_text(" ", strip=True)
+        return text or "-"
+
+    # Fallback: some pages might show a username element
+    tag = team_wrap_2.select_one(".userName")
+    if tag:
+        text = tag.get_text(" ", strip=True)
+        return text or "-"
+
+    return "-"
+
+
+def parse_opponent_total(soup: BeautifulSoup, side: int = 1) -> str:
+    team_totals = soup.find_all("div", class_=re.compile(r"teamTotal\s+teamId-"))
+    return team_totals[2 - side].get_text(strip=True) if len(team_totals) >= 2 else "-"
+
+
+def parse_team_projected_total(soup: BeautifulSoup, side: int = 1) -> str:
+    matchup = soup.find("div", id="teamMatchupBoxScore")
+    if not matchup:
+        return "-"
+
+    team_wrap = find_team_wrap(soup, side)
+    scope = team_wrap or matchup
+
+    projected_div = scope.find(class_="teamTotalProjected")
+    if not projected_div:
+        return "-"
+
+    text = projected_div.get_text(" ", strip=True)  # e.g. "Proj 111.65"
+    m = re.search(r"([\d.]+)", text)
+    return m.group(1) if m else "-"
+
+
+def parse_team_name(soup: BeautifulSoup, side: int = 1) -> str:
+    """Team name for the given side (teamWrap-1 is the current team)."""
+    team_wrap = find_team_wrap(soup, side)
+    if not team_wrap:
+        return "-"
+
+    h4 = team_wrap.find("h4")
+    return h4.get_text(" ", strip=True) if h4 else "-"
+
+
+def get_starter_slots(soup: BeautifulSoup, side: int = 1) -> list[str]:
+    """Slot labels (QB/RB/WR/...) from player rows; non-BN slots are starters."""
+    team_wrap = find_team_wrap(soup, side)
+    if not team_wrap:
+        return []
+
+    slots: list[str] = []
+    for tr in team_wrap.find_all("tr", class_=re.compile(r"player-")):
+        span = tr.find("span")
+        slot = span.get_text(strip=True) if span else ""
+        if slot and slot != "BN":
+            slots.append(slot)
+    return slots
+
+
+def get_roster_points(soup: BeautifulSoup, side: int = 1) -> list[str]:
+    """Points cells, in page order."""
+    team_wrap = find_team_wrap(soup, side)
+    if not team_wrap:
+        return []
+
+    totals_tds = team_wrap.find_all("td", class_=re.compile(r"\bstatTotal\b"))
+    return [td.get_text(strip=True) for td in totals_tds]
+
+
+def get_roster_names(soup: BeautifulSoup, longest_bench_len: int, side: int = 1) -> list[str]:
+    """Starters (tableWrap-N) + bench (tableWrapBN-N), padded to longest_bench_len."""
+    starters_wrap = soup.find("div", id=f"tableWrap-{side}")
+    starters = []
+    if starters_wrap:
+        starters = [td.get_text(" ", strip=True) for td in starters_wrap.find_all("td", class_="playerNameAndInfo")]
+
+    bench_wrap = soup.find("div", id=f"tableWrapBN-{side}")
+    bench = []
+    if bench_wrap:
+        bench = [td.get_text(" ", strip=True) for td in bench_wrap.find_all("td", class_="playerNameAndInfo")]
+
+    while len(bench) < longest_bench_len:
+        bench.append("-")
+
+    return starters + bench
@@ -0,0 +1,390 @@
+"""
+The benchmark suite: parse cost, per-page extraction, scrape_week end to
+end (local stand-in), combineWeeks, combineStandings, aggregate_stats and
+the JSON converters, on a synthetic 20-season/16-team/18-week history and
+on recorded pages from an HTML archive if one is given.
+
+    cd nfl && python -m benchmarks.suite                       # compare with benchmarks/baseline.json
+    cd nfl && python -m benchmarks.suite --check               # exit 1 on a regression
+    cd nfl && python -m benchmarks.suite --update-baseline     # after an intended change
+    cd nfl && python -m benchmarks.suite --fixtures output/.archive
+
+Results are written as JSON (--out). Each benchmark reports the best of
+--repeat timed batches in seconds per unit (page, week, run), and the spread
+between its fastest and slowest batch. A result is flagged when it is slower
+than the baseline by more than --tolerance (or the benchmark's own, in
+TOLERANCES) plus the larger spread of the two runs. The baseline records the
+machine it was made on; against another machine's, --check only reports.
+The strainer section shows parse_strained / parse_full per page set, so a
+strainer that costs more than it saves is visible.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Optional
+
+from benchmarks.dataset import Dataset, build_dataset
+from benchmarks.synthetic import final_standings_html, gamecenter_html, owners_html, regular_standings_html
+
+NFL_DIR = Path(__file__).resolve().parents[1]
+BASELINE_PATH = NFL_DIR / "benchmarks" / "baseline.json"
+CONVERTERS_DIR = NFL_DIR / "src" / "utils" / "json-converters"
+# Per-benchmark allowed slowdown where the default --tolerance is too tight:
+# scrape_week times threads, sockets and a local HTTP server, not just our code
+TOLERANCES = {"scrape_week[stand-in]": 0.5}
+CONVERTERS = (
+    "aggregateToJson",
+    "all_seasons_standings_to_json",
+    "standings_to_season_team_json",
+    "weeks_to_season_week_owner_json",
+)
+
+
+def _batches(fn: Callable[[], object], repeat: int, min_time: float = 0.2) -> list[float]:
+    """
+    Seconds per fn() call in each of repeat timed batches: fn runs in batches
+    of at least min_time (like timeit's autorange), which keeps sub-millisecond
+    benchmarks stable. fn's prints are swallowed.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        number = 1
+        while True:
+            start = time.perf_counter()
+            for _ in range(number):
+                fn()
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+            number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+        samples = [elapsed / number]
+        for _ in range(repeat - 1):
+            start = time.perf_counter()
+            for _ in range(number):
+                fn()
+            samples.append((time.perf_counter() - start) / number)
+    return samples
+
+
+def _per(samples: list[float], n: int, unit: str) -> dict:
+    """
+    The fastest batch per unit, and how far the slowest one was above it
+    (spread, as a fraction of the fastest): the run-to-run noise on this machine.
+    """
+    best = min(samples)
+    return {
+        "seconds": best / max(n, 1),
+        "spread": (max(samples) - best) / best if best else 0.0,
+        "samples": len(samples),
+        "unit": unit,
+    }
+
+
+@contextlib.contextmanager
+def _cwd(path: Path):
+    # combine*/aggregate/converters all work on output/ relative to the cwd
+    previous = Path.cwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def _converter(name: str) -> ModuleType:
+    # json-converters isn't an importable package name (hyphen), so load by path;
+    # the converters import their json_stream sibling as scripts do
+    if str(CONVERTERS_DIR) not in sys.path:
+        sys.path.insert(0, str(CONVERTERS_DIR))
+    spec = importlib.util.spec_from_file_location(f"json_converters_{name}", CONVERTERS_DIR / f"{name}.py")
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _recorded_pages(archive_dir: Path, limit: int) -> list[tuple[str, bytes, Optional[str]]]:
+    """(kind, content, encoding) of up to limit good gamecenter/standings pages from an HTML archive."""
+    from src.check_parsers import page_kind
+    from src.html_archive import HtmlArchive
+
+    archive = HtmlArchive(archive_dir)
+    pages: list[tuple[str, bytes, Optional[str]]] = []
+    for entry in archive.entries():
+        kind = page_kind(entry.url)
+        if not entry.ok or kind is None:
+            continue
+        pages.append((kind, archive.read(entry), entry.encoding or None))
+        if len(pages) >= limit:
+            break
+    return pages
+
+
+def bench_parsing(results: dict, *, pages: list[tuple[str, bytes, Optional[str]]], label: str, repeat: int) -> None:
+    """parse_html (get_soup's parse step) full and strained, and extract_gamecenter + build_row."""
+    from src.page_parser import parse_html
+    from src.utils.gamecenterCsvUtils import build_row
+    from src.utils.parse_gamecenter import extract_gamecenter
+
+    for kind in sorted({kind for kind, _, _ in pages}):
+        of_kind = [(content, encoding) for k, content, encoding in pages if k == kind]
+
+        def parse(page_type: Optional[str]) -> Callable[[], None]:
+            return lambda: [parse_html(c, encoding=e, page_type=page_type, strain=True) for c, e in of_kind]
+
+        results[f"parse_full[{label}:{kind}]"] = _per(_batches(parse(None), repeat), len(of_kind), "page")
+        results[f"parse_strained[{label}:{kind}]"] = _per(_batches(parse(kind), repeat), len(of_kind), "page")
+
+        if kind == "gamecenter":
+            soups = [parse_html(c, encoding=e, page_type="gamecenter", strain=True) for c, e in of_kind]
+
+            def extract() -> None:
+                for soup in soups:
+                    page = extract_gamecenter(soup)[0]
+                    build_row(page, list(page.starter_slots), page.bench_len)
+
+            results[f"extract_build_row[{label}]"] = _per(_batches(extract, repeat), len(soups), "page")
+
+
+def bench_offline(results: dict, dataset: Dataset, *, repeat: int) -> None:
+    """combine/aggregate/JSON conversion over the synthetic history (cwd = dataset root)."""
+    import src.combineStandings as combine_standings
+    from src.aggregate import aggregate_stats, write_aggregated_csv
+    from src.combineWeeks import combine_weeks
+
+    with _cwd(dataset.root):
+        results["aggregate_stats"] = _per(
+            _batches(lambda: aggregate_stats(dataset.standings_dir, cache=False), repeat), 1, "run"
+        )
+        # Every season's partial cached: hash the files and merge
+        aggregate_stats(dataset.standings_dir)
+        results["aggregate_stats[cached]"] = _per(_batches(lambda: aggregate_stats(dataset.standings_dir), repeat), 1, "run")
+        write_aggregated_csv(dataset.output_dir / "aggregated_standings_data.csv", aggregate_stats(dataset.standings_dir))
+
+        results["combineStandings.main"] = _per(_batches(combine_standings.main, repeat), 1, "run")
+        results["combineWeeks.combine_weeks"] = _per(
+            _batches(lambda: combine_weeks(dataset.league_id, rebuild=True), repeat), 1, "run"
+        )
+
+        # The live-mode case: one week file appears (or goes), the rest is already combined
+        last_week = max(dataset.gamecenter_root.glob(f"*/*-{dataset.weeks}.csv"))
+        last_week_bytes = last_week.read_bytes()
+
+        def toggle_last_week() -> None:
+            if last_week.exists():
+                last_week.unlink()
+            else:
+                last_week.write_bytes(last_week_bytes)
+            combine_weeks(dataset.league_id)
+
+        results["combineWeeks.update_one_week"] = _per(_batches(toggle_last_week, repeat), 1, "run")
+        if not last_week.exists():
+            last_week.write_bytes(last_week_bytes)
+        combine_weeks(dataset.league_id)
+
+        # The converters read the combined files from output/ itself
+        shutil.copy(dataset.standings_dir / "all_seasons_standings.csv", dataset.output_dir)
+        shutil.copy(dataset.gamecenter_root / "all_seasons_combined.csv", dataset.output_dir)
+        for name in CONVERTERS:
+            convert = _converter(name).main
+            results[f"json:{name}"] = _per(_batches(lambda: convert([]), repeat), 1, "run")
+
+        # Frontend shards after a rebuild where nothing changed: read and hash only
+        shard_weeks = _converter("weeks_to_season_week_owner_json").main
+        shard_weeks(["--shard-by", "week"])
+        results["json:weeks_to_season_week_owner_json[shards,unchanged]"] = _per(
+            _batches(lambda: shard_weeks(["--shard-by", "week"]), repeat), 1, "run"
+        )
+
+
+def bench_scrape_week(results: dict, *, weeks: int, repeat: int) -> None:
+    samples: list[float] = []
+    for _ in range(repeat):
+        # Fresh interpreter: src reads BASE_URL at import time
+        out = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_scrape_week", "--json", "--weeks", str(weeks)],
+            cwd=NFL_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        samples.append(json.loads(out.stdout.strip().splitlines()[-1])["seconds_per_week"])
+    results["scrape_week[stand-in]"] = _per(samples, 1, "week")
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=NFL_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def _machine() -> dict:
+    """What the timings depend on; a baseline from a different machine isn't comparable."""
+    return {
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+    }
+
+
+def allowed_slowdown(name: str, result: dict, baseline: dict, tolerance: float) -> float:
+    """
+    tolerance (or the benchmark's own, if larger) plus the noise seen on
+    either side: the larger spread of this run's and the baseline's batches.
+    """
+    noise = max(result.get("spread", 0.0), baseline.get("spread", 0.0))
+    return max(tolerance, TOLERANCES.get(name, 0.0)) + noise
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Print results next to the baseline; returns the names that regressed."""
+    regressed: list[str] = []
+    print(f"{'benchmark':48} {'now':>12} {'baseline':>12} {'ratio':>7} {'allowed':>8}")
+    for name, result in results.items():
+        now = result["seconds"]
+        base = baseline.get(name, {}).get("seconds")
+        if base is None:
+            print(f"{name:48} {_fmt(now):>12} {'-':>12} {'new':>7} {'':>8}  /{result['unit']}")
+            continue
+        ratio = now / base if base else float("inf")
+        allowed = allowed_slowdown(name, result, baseline[name], tolerance)
+        flag = ""
+        if ratio > 1 + allowed:
+            flag = "  REGRESSION"
+            regressed.append(name)
+        print(f"{name:48} {_fmt(now):>12} {_fmt(base):>12} {ratio:>6.2f}x {1 + allowed:>7.2f}x  /{result['unit']}{flag}")
+    return regressed
+
+
+def strainer_ratios(results: dict) -> dict[str, dict]:
+    """
+    parse_strained / parse_full per page set (above 1, the strainer costs more
+    than it saves), with the larger spread of the two as its noise.
+    """
+    ratios: dict[str, dict] = {}
+    for name, result in results.items():
+        if name.startswith("parse_strained["):
+            pages = name[len("parse_strained["):-1]
+            full = results.get(f"parse_full[{pages}]")
+            if full and full["seconds"]:
+                ratios[pages] = {
+                    "ratio": result["seconds"] / full["seconds"],
+                    "noise": max(result.get("spread", 0.0), full.get("spread", 0.0)),
+                }
+    return ratios
+
+
+def report_strainers(ratios: dict[str, dict]) -> None:
+    print("\nStrainers (HTML_STRAINERS) vs the full tree:")
+    for pages, r in ratios.items():
+        ratio = r["ratio"]
+        if abs(ratio - 1) <= r["noise"]:
+            verdict = "no difference beyond the noise"
+        elif ratio > 1:
+            verdict = "SLOWER than the full tree"
+        else:
+            verdict = f"{1 / ratio:.1f}x faster"
+        print(f"  {pages:40} {ratio:>6.2f}x  {verdict}")
+
+
+def _fmt(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f}s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds * 1e6:.0f}us"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the benchmark suite and compare with the stored baseline.")
+    parser.add_argument("--out", type=Path, default=Path("output") / "benchmarks" / "results.json")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="Store these results as the new baseline.")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if anything regressed past --tolerance.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown vs baseline (0.25 = 25%%).")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seasons", type=int, default=20)
+    parser.add_argument("--teams", type=int, default=16)
+    parser.add_argument("--weeks", type=int, default=18)
+    parser.add_argument("--fixtures", type=Path, help="HTML archive with recorded pages to parse as well.")
+    parser.add_argument("--skip-scrape", action="store_true", help="Skip the stand-in scrape_week benchmark.")
+    args = parser.parse_args()
+
+    results: dict[str, dict] = {}
+    if not args.skip_scrape:
+        bench_scrape_week(results, weeks=4, repeat=min(args.repeat, 3))
+
+    synthetic_pages = [
+        ("gamecenter", gamecenter_html(t, w, teams=args.teams, weeks=args.weeks).encode("utf-8"), "utf-8")
+        for w in (1, 2)
+        for t in range(1, args.teams + 1)
+    ]
+    synthetic_pages += [
+        ("standings", regular_standings_html(teams=args.teams).encode("utf-8"), "utf-8"),
+        ("playoffs", final_standings_html(teams=args.teams).encode("utf-8"), "utf-8"),
+        ("owners", owners_html(teams=args.teams).encode("utf-8"), "utf-8"),
+    ]
+    bench_parsing(results, pages=synthetic_pages, label="synthetic", repeat=args.repeat)
+    if args.fixtures:
+        recorded = _recorded_pages(args.fixtures, limit=200)
+        if recorded:
+            bench_parsing(results, pages=recorded, label="recorded", repeat=args.repeat)
+        else:
+            print(f"No recorded pages in {args.fixtures}; skipping")
+
+    from src.config import league_id
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dataset = build_dataset(
+            Path(tmp), league_id=league_id, seasons=args.seasons, teams=args.teams, weeks=args.weeks
+        )
+        bench_offline(results, dataset, repeat=args.repeat)
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "machine": _machine(),
+            "note": "Timings are specific to this machine; rerun with --update-baseline on another one.",
+            "dataset": {"seasons": args.seasons, "teams": args.teams, "weeks": args.weeks},
+        },
+        "results": results,
+        "strainers": strainer_ratios(results),
+    }
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline.exists() else {}
+    regressed = compare(results, baseline.get("results", {}), args.tolerance)
+    report_strainers(report["strainers"])
+    print(f"\nResults -> {args.out}")
+
+    same_machine = baseline.get("meta", {}).get("machine") == _machine()
+    if baseline and not same_machine:
+        print("Baseline was recorded on a different machine: ratios are indicative only, --check won't fail")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline updated -> {args.baseline}")
+    elif args.check and regressed and same_machine:
+        raise SystemExit(f"Regressed past the allowed slowdown: {regressed}")
+
+
+if __name__ == "__main__":
+    main()
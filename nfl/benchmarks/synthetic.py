@@ -0,0 +1,112 @@
+"""
+Synthetic fantasy.nfl.com pages shaped like the real ones, for benchmarks.
+Deterministic: the same (team, week) always renders the same HTML.
+"""
+from __future__ import annotations
+
+STARTER_SLOTS = ["QB", "RB", "RB", "WR", "WR", "TE", "W/R", "K", "DEF"]
+
+
+def points(team_id: int, week: int, i: int) -> str:
+    return f"{(team_id * 7 + week * 3 + i * 5) % 31 + 0.25 * (i % 4):.2f}"
+
+
+def team_total(team_id: int, week: int) -> float:
+    return sum(float(points(team_id, week, i)) for i in range(len(STARTER_SLOTS)))
+
+
+def bench_len(team_id: int, week: int) -> int:
+    return 5 + (team_id + week) % 3
+
+
+def opponent(team_id: int, week: int, teams: int) -> int | None:
+    """Round-robin pairing; with an odd league size one team is on bye."""
+    order = [((k + week) % teams) + 1 for k in range(teams)]
+    for a, b in zip(order[0::2], order[1::2]):
+        if team_id == a:
+            return b
+        if team_id == b:
+            return a
+    return None
+
+
+def _box_score(side: int, team_id: int, week: int) -> str:
+    starters = "".join(
+        f'<tr class="player-{team_id}{i} odd"><td class="teamPosition"><span>{slot}</span></td>'
+        f'<td class="playerNameAndInfo"><a>Player {team_id}-{i}</a> <em>{slot} - NE</em></td>'
+        f'<td class="stat">1</td><td class="statTotal">{points(team_id, week, i)}</td></tr>'
+        for i, slot in enumerate(STARTER_SLOTS)
+    )
+    bench = "".join(
+        f'<tr class="player-b{team_id}{j}"><td class="teamPosition"><span>BN</span></td>'
+        f'<td class="playerNameAndInfo"><a>Bench {team_id}-{j}</a></td>'
+        f'<td class="stat">0</td><td class="statTotal">{points(team_id, week, 20 + j)}</td></tr>'
+        for j in range(bench_len(team_id, week))
+    )
+    return (
+        f'<div class="teamWrap teamWrap-{side}"><h4>Team {team_id} Name</h4>'
+        f'<div class="teamTotalProjected">Proj {100 + team_id}.50</div>'
+        f'<div id="tableWrap-{side}"><table>{starters}</table></div>'
+        f'<div id="tableWrapBN-{side}"><table>{bench}</table></div></div>'
+    )
+
+
+def _header(side: int, team_id: int, week: int) -> str:
+    return (
+        f'<div class="teamWrap teamWrap-{side}">'
+        f'<span class="userName userId-{100 + team_id}">Owner{team_id}</span>'
+        f'<span class="teamRank teamId-{team_id}">Team {team_id} ({team_id})</span>'
+        f'<div class="teamTotal teamId-{team_id}">{team_total(team_id, week):.2f}</div></div>'
+    )
+
+
+def gamecenter_html(team_id: int, week: int, *, teams: int = 12, weeks: int = 17) -> str:
+    opp = opponent(team_id, week, teams)
+    header = _header(1, team_id, week) + (_header(2, opp, week) if opp else "")
+    box = _box_score(1, team_id, week) + (_box_score(2, opp, week) if opp else "")
+    week_nav = "".join(f'<li class="ww ww-{w}"><a>{w}</a></li>' for w in range(1, weeks + 1))
+    # Padding stands in for the nav, scripts and footer that dominate real pages
+    filler = "".join(f'<div class="promo"><p>filler {i}</p><script>var x{i} = {i};</script></div>' for i in range(400))
+    return (
+        "<html><head><title>Team Gamecenter</title></head><body>"
+        f'<div class="nav"><a href="/login">Sign In</a></div><ul class="weekNav">{week_nav}</ul>'
+        f'<div id="teamMatchupHeader">{header}</div>'
+        f'<div id="teamMatchupBoxScore">{box}</div>{filler}</body></html>'
+    )
+
+
+def owners_html(*, teams: int = 12) -> str:
+    rows = "".join(
+        f'<tr class="team-{t}"><td><a class="teamName" href="?teamId={t}">Team {t} Name</a></td>'
+        f'<td><span class="userName">Owner{t}</span></td>'
+        f'<td class="teamTransactionCount">{t}</td><td class="teamTradeCount">{t % 3}</td></tr>'
+        for t in range(1, teams + 1)
+    )
+    return f"<html><body><table>{rows}</table></body></html>"
+
+
+def regular_standings_html(*, teams: int = 12) -> str:
+    rows = "".join(
+        f'<tr class="team-{t}"><td><span class="teamRank">{t}</span></td>'
+        f'<td><a class="teamName" href="?teamId={t}">Team {t} Name</a></td>'
+        f'<td class="teamRecord">{teams - t}-{t - 1}-0</td>'
+        f'<td class="teamPts">{1500 - t * 10}.50</td><td class="teamPts">{1400 + t}.25</td></tr>'
+        for t in range(1, teams + 1)
+    )
+    return f"<html><body><table>{rows}</table></body></html>"
+
+
+def final_standings_html(*, teams: int = 12) -> str:
+    rows = "".join(
+        f'<li class="place-{t}"><div class="place">{t}th Place</div>'
+        f'<div class="value"><a class="teamName" href="?teamId={t}">Team {t} Name</a></div></li>'
+        for t in range(1, teams + 1)
+    )
+    return f"<html><body><ul>{rows}</ul></body></html>"
+
+
+def block_html() -> str:
+    return (
+        "<html><head><title>Access Denied</title></head><body>"
+        "<h1>Please verify you are human</h1><div class=\"captcha\"></div></body></html>"
+    )
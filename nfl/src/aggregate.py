@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import argparse
 import csv
-from dataclasses import dataclass
+import hashlib
+import io
+import json
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
 from pathlib import Path
-from typing import Dict
-from src.config import cutoff_playoffs, league_id, REQUIRED_COLUMNS
-from collections import defaultdict
-from src.utils.normalize import normalize_manager_name
+from typing import Dict, Iterable, Optional
+from src.config import AGGREGATE_PROCESSES, cutoff_playoffs, league_id, REQUIRED_COLUMNS
+from src.utils.atomic import atomic_open
+from src.utils.normalize import MANAGER_NAME_MAP, normalize_manager_name
 
+AGGREGATE_VERSION = 1  # bump when season_partial results change
+
+# Sidecar in the standings dir: SeasonPartial per standings CSV, by content hash
+PARTIALS_NAME = ".aggregate-partials.json"
 
 
 def safe_int(value: str | None) -> int:
@@ -67,62 +76,176 @@ class ManagerAgg:
     championships: int = 0
     toilet_bowls: int = 0
 
+    def add(self, other: ManagerAgg) -> None:
+        self.seasons += other.seasons
+        self.wins += other.wins
+        self.losses += other.losses
+        self.ties += other.ties
+        self.points_for += other.points_for
+        self.points_against += other.points_against
+        self.moves += other.moves
+        self.trades += other.trades
+        self.playoffs += other.playoffs
+        self.championships += other.championships
+        self.toilet_bowls += other.toilet_bowls
 
-def aggregate_stats(standings_dir: Path) -> dict[str, ManagerAgg]:
-    aggregated: defaultdict[str, ManagerAgg] = defaultdict(ManagerAgg)
-
-    season_files = sorted(standings_dir.glob("*.csv"))
-    if not season_files:
-        raise RuntimeError(f"No CSV files found in {standings_dir}")
-
-    for season_path in season_files:
-        managers_seen_this_season: set[str] = set()
 
-        with season_path.open("r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-
-            missing = REQUIRED_COLUMNS - set(reader.fieldnames or [])
-            if missing:
-                raise RuntimeError(f"{season_path.name} missing columns: {sorted(missing)}")
-
-            season_rows = list(reader)
+@dataclass
+class SeasonPartial:
+    """
+    What one or more consecutive standings CSVs add to aggregate_stats.
+    merge_partials is associative, so seasons can be computed separately
+    (cached, or in other processes) and combined in any grouping as long as
+    season order is kept.
+    """
+    managers: dict[str, ManagerAgg] = field(default_factory=dict)
+    # Each row's (PointsFor, PointsAgainst) per manager, in file order. The
+    # final totals are summed from these in the same order as a single pass
+    # over every file would, so merged floats come out bit-identical.
+    points: dict[str, list[tuple[float, float]]] = field(default_factory=dict)
+
+    def totals(self) -> dict[str, ManagerAgg]:
+        result: dict[str, ManagerAgg] = {}
+        for manager, agg in self.managers.items():
+            points_for = points_against = 0.0
+            for pf, pa in self.points.get(manager, ()):
+                points_for += pf
+                points_against += pa
+            result[manager] = replace(agg, points_for=points_for, points_against=points_against)
+        return result
+
+
+def merge_partials(partials: Iterable[SeasonPartial]) -> SeasonPartial:
+    merged = SeasonPartial()
+    for partial in partials:
+        for manager, agg in partial.managers.items():
+            if manager in merged.managers:
+                merged.managers[manager].add(agg)
+            else:
+                # Copied: the inputs (possibly cached) are never modified
+                merged.managers[manager] = replace(agg)
+        for manager, rows in partial.points.items():
+            merged.points.setdefault(manager, []).extend(rows)
+    return merged
+
+
+def season_partial(season_path: Path, raw: Optional[bytes] = None) -> SeasonPartial:
+    """One standings CSV's contribution (raw: its bytes, if already read)."""
+    if raw is None:
+        raw = season_path.read_bytes()
+    reader = csv.DictReader(io.StringIO(raw.decode("utf-8"), newline=""))
+
+    missing = REQUIRED_COLUMNS - set(reader.fieldnames or [])
+    if missing:
+        raise RuntimeError(f"{season_path.name} missing columns: {sorted(missing)}")
+
+    season_rows = list(reader)
+
+    num_owners = len(season_rows)
+    playoff_cutoff = cutoff_playoffs
+    bottom_four_cutoff = max(1, num_owners - 3)
+
+    partial = SeasonPartial()
+    for row in season_rows:
+        manager = normalize_manager_name(row.get("ManagerName") or "")
+
+        if not manager:
+            continue
+
+        agg = partial.managers.setdefault(manager, ManagerAgg(seasons=1))
+
+        points_for = safe_float(row.get("PointsFor"))
+        points_against = safe_float(row.get("PointsAgainst"))
+        partial.points.setdefault(manager, []).append((points_for, points_against))
+
+        agg.wins += safe_int(row.get("Wins"))
+        agg.losses += safe_int(row.get("Losses"))
+        agg.ties += safe_int(row.get("Ties"))
+        agg.points_for += points_for
+        agg.points_against += points_against
+        agg.moves += safe_int(row.get("Moves"))
+        agg.trades += safe_int(row.get("Trades"))
+
+        rank_playoff = safe_rank(row.get("PlayoffRank"))
+        if rank_playoff == 1:
+            agg.playoffs += 1
+            agg.championships += 1
+        elif 0 < rank_playoff <= playoff_cutoff:
+            agg.playoffs += 1
+
+        reg_rank = safe_rank(row.get("RegularSeasonRank"))
+        if reg_rank > 0 and reg_rank >= bottom_four_cutoff:
+            agg.toilet_bowls += 1
+
+    return partial
+
+
+def _partials_key() -> str:
+    # A cached partial is only valid for the rules it was computed with
+    settings = [AGGREGATE_VERSION, cutoff_playoffs, sorted(MANAGER_NAME_MAP.items()), sorted(REQUIRED_COLUMNS)]
+    return hashlib.sha256(json.dumps(settings).encode("utf-8")).hexdigest()[:16]
+
+
+def _load_partials(path: Path) -> dict[str, SeasonPartial]:
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        if raw.get("key") != _partials_key():
+            return {}
+        return {
+            digest: SeasonPartial(
+                managers={m: ManagerAgg(**agg) for m, agg in entry["managers"].items()},
+                points={m: [(pf, pa) for pf, pa in rows] for m, rows in entry["points"].items()},
+            )
+            for digest, entry in raw["partials"].items()
+        }
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        return {}
 
-        num_owners = len(season_rows)
-        playoff_cutoff = cutoff_playoffs
-        bottom_four_cutoff = max(1, num_owners - 3)
 
-        for row in season_rows:
-            manager = normalize_manager_name(row.get("ManagerName") or "")
+def _save_partials(path: Path, partials: dict[str, SeasonPartial]) -> None:
+    data = {"key": _partials_key(), "partials": {digest: asdict(p) for digest, p in partials.items()}}
+    with atomic_open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
 
-            if not manager:
-                continue
 
-            managers_seen_this_season.add(manager)
-            agg = aggregated[manager]
+def aggregate_stats(
+    standings_dir: Path, *, cache: bool = True, processes: int = AGGREGATE_PROCESSES
+) -> dict[str, ManagerAgg]:
+    """
+    Career totals per manager over every <season>.csv in standings_dir
+    (all_seasons_standings.csv, which combineStandings writes there, repeats
+    them and is skipped).
+
+    Each CSV's SeasonPartial is cached in the directory under the file's
+    sha256, so a run re-reads only the seasons that changed (normally just
+    the current one) and merges the cached rest. Uncached seasons are
+    computed in `processes` worker processes when there is more than one
+    (0 = in this process).
+    """
+    season_files = sorted(p for p in standings_dir.glob("*.csv") if p.stem.isdigit())
+    if not season_files:
+        raise RuntimeError(f"No CSV files found in {standings_dir}")
 
-            agg.wins += safe_int(row.get("Wins"))
-            agg.losses += safe_int(row.get("Losses"))
-            agg.ties += safe_int(row.get("Ties"))
-            agg.points_for += safe_float(row.get("PointsFor"))
-            agg.points_against += safe_float(row.get("PointsAgainst"))
-            agg.moves += safe_int(row.get("Moves"))
-            agg.trades += safe_int(row.get("Trades"))
+    cache_path = standings_dir / PARTIALS_NAME
+    cached = _load_partials(cache_path) if cache else {}
 
-            rank_playoff = safe_rank(row.get("PlayoffRank"))
-            if rank_playoff == 1:
-                agg.playoffs += 1
-                agg.championships += 1
-            elif 0 < rank_playoff <= playoff_cutoff:
-                agg.playoffs += 1
+    contents = {path: path.read_bytes() for path in season_files}
+    digests = {path: hashlib.sha256(raw).hexdigest() for path, raw in contents.items()}
+    partials = {digests[path]: cached[digests[path]] for path in season_files if digests[path] in cached}
 
-            reg_rank = safe_rank(row.get("RegularSeasonRank"))
-            if reg_rank > 0 and reg_rank >= bottom_four_cutoff:
-                agg.toilet_bowls += 1
+    todo = [path for path in season_files if digests[path] not in partials]
+    if processes > 0 and len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=min(processes, len(todo))) as pool:
+            computed = list(pool.map(season_partial, todo))
+    else:
+        computed = [season_partial(path, contents[path]) for path in todo]
+    partials.update({digests[path]: partial for path, partial in zip(todo, computed)})
 
-        for manager in managers_seen_this_season:
-            aggregated[manager].seasons += 1
+    if cache and (todo or len(cached) != len(partials)):
+        # Only this directory's current files are kept, so old versions of the live season drop out
+        _save_partials(cache_path, partials)
 
-    return dict(aggregated)
+    return merge_partials(partials[digests[path]] for path in season_files).totals()
 
 
 def write_aggregated_csv(output_path: Path, aggregated: Dict[str, ManagerAgg]) -> None:
@@ -168,11 +291,21 @@ def write_aggregated_csv(output_path: Path, aggregated: Dict[str, ManagerAgg]) -
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Aggregate career stats per manager from the standings CSVs.")
+    parser.add_argument("--rebuild", action="store_true", help="Ignore the cached per-season partials.")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=AGGREGATE_PROCESSES,
+        help="Worker processes for seasons that need reading (0 = none).",
+    )
+    args = parser.parse_args()
+
     base_output = Path("output")
     standings_dir = base_output / f"{league_id}-history-standings"
     output_csv = base_output / "aggregated_standings_data.csv"
 
-    aggregated = aggregate_stats(standings_dir)
+    aggregated = aggregate_stats(standings_dir, cache=not args.rebuild, processes=args.processes)
     write_aggregated_csv(output_csv, aggregated)
 
     print(f"Wrote {len(aggregated)} managers -> {output_csv}")
@@ -0,0 +1,124 @@
+"""
+Check a faster parse setup against the baseline (html.parser, full tree) on
+pages recorded in the HTML archive, before turning it on with HTML_PARSER /
+HTML_STRAINERS:
+
+    python -m src.check_parsers                          # lxml + strainers
+    python -m src.check_parsers --parser html.parser     # strainers only
+    python -m src.check_parsers --no-strain              # lxml only
+
+Each page goes through what the scrapers read from it (extract_gamecenter
+and the week selector, count_owners, and standings_rows for every season
+whose three standings pages are archived) under both setups. Exits 1 if any
+result differs.
+"""
+from __future__ import annotations
+
+import argparse
+import re
+from collections import defaultdict
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from src.config import HTML_ARCHIVE_DIR
+from src.html_archive import ArchiveEntry, HtmlArchive
+from src.page_parser import parse_html
+from src.standings import standings_rows
+from src.utils.getOwnersCount import count_owners
+from src.utils.parse_gamecenter import extract_gamecenter
+
+_WEEK_NAV = re.compile(r"\bww\b.*\bww-\d+\b")
+# .../league/<id>/history/<season>, shared by a season's standings pages
+_SEASON_PREFIX = re.compile(r"^(.*/league/[^/]+/history/\d+)/")
+# page_kind -> standings_rows argument
+_STANDINGS_ARGS = {"standings": "regular", "playoffs": "playoffs", "owners": "owners"}
+
+BASELINE: Callable[..., Any] = partial(parse_html, parser="html.parser", strain=False)
+
+
+def page_kind(url: str) -> Optional[str]:
+    """The page_parser.STRAINERS page type an archived URL is parsed as (None: not checked)."""
+    if "/teamgamecenter" in url:
+        return "gamecenter"
+    if "historyStandingsType=final" in url:
+        return "playoffs"
+    if "/standings" in url:
+        return "standings"
+    if url.endswith("/owners"):
+        return "owners"
+    return None
+
+
+def latest_pages(archive: HtmlArchive) -> list[tuple[str, ArchiveEntry]]:
+    """(kind, entry) for the newest good copy of every archived page of a checked kind."""
+    urls = dict.fromkeys(e.url for e in archive.entries() if e.ok and page_kind(e.url))
+    pages = []
+    for url in urls:
+        entry = archive.latest(url)
+        if entry is not None:
+            pages.append((page_kind(url), entry))
+    return pages
+
+
+def _gamecenter(parse: Callable[..., Any], content: bytes, encoding: Optional[str]) -> tuple:
+    weeks = parse(content, encoding=encoding, page_type="week_nav").find_all("li", class_=_WEEK_NAV)
+    return extract_gamecenter(parse(content, encoding=encoding, page_type="gamecenter")), len(weeks)
+
+
+def _owners(parse: Callable[..., Any], content: bytes, encoding: Optional[str]) -> int:
+    return count_owners(parse(content, encoding=encoding, page_type="owners"))
+
+
+def check(archive: HtmlArchive, candidate: Callable[..., Any]) -> tuple[dict[str, int], list[str]]:
+    """(pages checked per kind, URLs or seasons whose results differ from BASELINE's)."""
+    checked: dict[str, int] = defaultdict(int)
+    differ: list[str] = []
+    seasons: dict[str, dict[str, tuple[bytes, Optional[str]]]] = defaultdict(dict)
+
+    for kind, entry in latest_pages(archive):
+        content, encoding = archive.read(entry), entry.encoding or None
+        extract = {"gamecenter": _gamecenter, "owners": _owners}.get(kind)
+        if extract is not None:
+            checked[kind] += 1
+            if extract(BASELINE, content, encoding) != extract(candidate, content, encoding):
+                differ.append(entry.url)
+        prefix = _SEASON_PREFIX.match(entry.url)
+        if kind in _STANDINGS_ARGS and prefix:
+            seasons[prefix.group(1)][_STANDINGS_ARGS[kind]] = (content, encoding)
+
+    for season, pages in seasons.items():
+        if len(pages) < len(_STANDINGS_ARGS):
+            continue
+        checked["standings seasons"] += 1
+        expected = list(standings_rows(**pages, parse=BASELINE).items())
+        if list(standings_rows(**pages, parse=candidate).items()) != expected:
+            differ.append(f"{season} (standings)")
+    return dict(checked), differ
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare a parser/strainer setup with html.parser on full trees, over the HTML archive."
+    )
+    parser.add_argument("--archive", type=Path, default=HTML_ARCHIVE_DIR, help="HTML archive directory.")
+    parser.add_argument("--parser", default="lxml", help="BeautifulSoup parser to check (default: lxml).")
+    parser.add_argument("--no-strain", action="store_true", help="Check full trees only, without STRAINERS.")
+    args = parser.parse_args(argv)
+
+    candidate = partial(parse_html, parser=args.parser, strain=not args.no_strain)
+    checked, differ = check(HtmlArchive(args.archive), candidate)
+    if not checked:
+        raise SystemExit(f"No gamecenter or standings pages archived under {args.archive}")
+
+    setup = f"{args.parser}{'' if args.no_strain else ' + strainers'}"
+    print(f"Checked {setup}: " + ", ".join(f"{n} {kind}" for kind, n in sorted(checked.items())))
+    for what in differ:
+        print(f"✗ {what}")
+    if differ:
+        raise SystemExit(f"{len(differ)} result(s) differ from html.parser on the full tree; keep the defaults")
+    print("✓ Same results as html.parser on the full tree")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from src.config import BLOCK_COOLDOWN_SECONDS, BLOCK_THRESHOLD, MAX_BREAKER_TRIPS
+
+
+class CircuitOpenError(RuntimeError):
+    """The breaker tripped too many times; the site is not letting us in."""
+
+
+class CircuitBreaker:
+    """
+    Process-wide guard against scraping into a block wall.
+
+    closed    -> requests flow; consecutive blocks are counted
+    open      -> after `threshold` consecutive blocks every worker pauses
+                 for `cooldown` seconds (doubling on each trip)
+    half-open -> after the pause requests flow again; a success closes the
+                 breaker, another block reopens it
+
+    After `max_trips` openings wait() raises CircuitOpenError so the run
+    stops instead of hammering the site with requests it will discard.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: int = BLOCK_THRESHOLD,
+        cooldown: float = BLOCK_COOLDOWN_SECONDS,
+        max_trips: int = MAX_BREAKER_TRIPS,
+    ) -> None:
+        self.threshold = max(1, threshold)
+        self.cooldown = cooldown
+        self.max_trips = max_trips
+        self.consecutive_blocks = 0
+        self.trips = 0
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    def _remaining(self) -> float:
+        with self._lock:
+            if self.trips > self.max_trips:
+                raise CircuitOpenError(
+                    f"Blocked {self.trips} times in a row after cooling down; giving up"
+                )
+            return self._open_until - time.monotonic()
+
+    def wait(self) -> None:
+        """Block the calling worker while the breaker is open."""
+        while (remaining := self._remaining()) > 0:
+            time.sleep(remaining)
+
+    async def wait_async(self) -> None:
+        """wait() for coroutines: only the awaiting fetch pauses, not the event loop."""
+        while (remaining := self._remaining()) > 0:
+            await asyncio.sleep(remaining)
+
+    def record_block(self) -> None:
+        with self._lock:
+            self.consecutive_blocks += 1
+            now = time.monotonic()
+            if self.consecutive_blocks >= self.threshold and now >= self._open_until:
+                self.trips += 1
+                self._open_until = now + self.cooldown * (2 ** (self.trips - 1))
+                # half-open afterwards: a single further block reopens it
+                self.consecutive_blocks = self.threshold - 1
+                print(
+                    f"Circuit breaker open: pausing all requests for "
+                    f"{self._open_until - now:.0f}s (trip {self.trips})"
+                )
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.consecutive_blocks = 0
+            self.trips = 0
+
+    def describe(self) -> str:
+        return f"breaker: trips={self.trips} consecutive_blocks={self.consecutive_blocks}"
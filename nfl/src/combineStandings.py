@@ -7,7 +7,8 @@ from src.config import league_id
 from src.utils.normalize import normalize_manager_name
 
 
-def main() -> None:
+def combine_standings(league_id: str = league_id) -> Path:
+    """Rewrite <league>-history-standings/all_seasons_standings.csv from every season's standings CSV."""
     base_dir = Path("output")
     standings_dir = base_dir / f"{league_id}-history-standings"
 
@@ -64,6 +65,11 @@ def main() -> None:
                 writer.writerow([season] + row)
 
     print(f"Wrote combined standings file: {out_file}")
+    return out_file
+
+
+def main() -> None:
+    combine_standings()
 
 
 if __name__ == "__main__":
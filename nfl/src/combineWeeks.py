@@ -1,84 +1,264 @@
 from __future__ import annotations
 
+import argparse
 import csv
+import hashlib
+import io
+import json
+import os
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
+from typing import Iterable, Optional
 
 from src.config import league_id
+from src.utils.atomic import atomic_open
 from src.utils.normalize import normalize_manager_name
 
+# Sidecar next to all_seasons_combined.csv: which week files it holds, where
+# each one's rows start, and the header they were written against
+STATE_NAME = ".combined.json"
+# Bump when CombinedWeek or the sidecar layout changes: older sidecars force a rebuild
+STATE_VERSION = 2
 
-def main() -> None:
-    base_dir = Path("output")
-    gamecenter_root = base_dir / f"{league_id}-history-teamgamecenter"
 
-    out_file = gamecenter_root / "all_seasons_combined.csv"
+@dataclass(frozen=True)
+class CombinedWeek:
+    """One week CSV's rows in the combined file."""
+    path: str  # relative to the gamecenter root, e.g. "2017/2017-11.csv"
+    size: int
+    mtime_ns: int
+    sha256: str
+    # Byte offset of its first row in all_seasons_combined.csv
+    offset: int = 0
+    # The week file's own header, so the union header can be recomputed without rereading it
+    header: list[str] = field(default_factory=list)
 
-    # First pass: discover union header across all files
-    union_cols: list[str] = []
-    seen = set()
 
-    files: list[Path] = []
-    for season_dir in sorted(gamecenter_root.iterdir()):
+@dataclass
+class _WeekFile:
+    path: Path
+    rel: str
+    season: str
+    week: str
+    order: tuple[int, int]
+
+
+def _week_files(gamecenter_root: Path) -> list[_WeekFile]:
+    """Every <season>/<season>-<week>.csv, in (season, week) order."""
+    files: list[_WeekFile] = []
+    for season_dir in gamecenter_root.iterdir():
         if not season_dir.is_dir():
             continue
-        for csv_file in sorted(season_dir.glob("*.csv")):
-            files.append(csv_file)
-
-            with csv_file.open("r", newline="", encoding="utf-8") as f:
-                reader = csv.reader(f)
-                header = next(reader, None)
-                if not header:
-                    continue
-                for col in header:
-                    if col not in seen:
-                        seen.add(col)
-                        union_cols.append(col)
+        for csv_file in season_dir.glob("*.csv"):
+            # filename format: 2017-11.csv
+            try:
+                file_season, week = csv_file.stem.split("-")
+                order = (int(file_season), int(week))
+            except ValueError:
+                continue
+            rel = csv_file.relative_to(gamecenter_root).as_posix()
+            files.append(_WeekFile(csv_file, rel, file_season, week, order))
+    return sorted(files, key=lambda f: f.order)
 
-    if not union_cols:
-        raise RuntimeError(f"No CSV headers found under {gamecenter_root}")
 
+def _load_state(state_path: Path, out_file: Path) -> Optional[dict]:
+    """The sidecar, if it still describes out_file byte for byte."""
+    try:
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+        combined_size = out_file.stat().st_size
+    except (OSError, ValueError):
+        return None
+    if state.get("version") != STATE_VERSION:
+        return None
+    # A crash between writing rows and saving the sidecar leaves a size mismatch
+    if state.get("combined_size") != combined_size:
+        return None
+    state["weeks"] = [CombinedWeek(**w) for w in state.get("weeks", [])]
+    return state
+
+
+def _unchanged(week_file: _WeekFile, recorded: CombinedWeek) -> Optional[CombinedWeek]:
+    """
+    recorded (with the current mtime) if week_file is still the file that was
+    combined: same size and mtime, or failing the mtime, the same hash.
+    """
+    if week_file.rel != recorded.path:
+        return None
+    st = week_file.path.stat()
+    if st.st_size != recorded.size:
+        return None
+    if st.st_mtime_ns == recorded.mtime_ns:
+        return recorded
+    if hashlib.sha256(week_file.path.read_bytes()).hexdigest() != recorded.sha256:
+        return None
+    return CombinedWeek(**{**asdict(recorded), "mtime_ns": st.st_mtime_ns})
+
+
+def _read(week_file: _WeekFile) -> tuple[CombinedWeek, list[str], list[list[str]]]:
+    """(fingerprint, header, rows) from a single read of the file."""
+    st = week_file.path.stat()
+    raw = week_file.path.read_bytes()
+    rows = list(csv.reader(io.StringIO(raw.decode("utf-8"), newline="")))
+    header = rows[0] if rows else []
+    fingerprint = CombinedWeek(
+        week_file.rel, len(raw), st.st_mtime_ns, hashlib.sha256(raw).hexdigest(), header=header
+    )
+    return fingerprint, header, [row for row in rows[1:] if row]
+
+
+def union_header(headers: Iterable[list[str]]) -> list[str]:
+    """Every column name across headers, first appearance first (repeats listed once)."""
+    union_cols: list[str] = []
+    seen = set()
+    for header in headers:
+        for col in header:
+            if col not in seen:
+                seen.add(col)
+                union_cols.append(col)
+    return union_cols
+
+
+def encode_header(union_cols: list[str]) -> bytes:
     # We want Season/Week prefixed
-    final_header = ["Season", "Week"] + union_cols
+    buf = io.StringIO()
+    csv.writer(buf).writerow(["Season", "Week"] + union_cols)
+    return buf.getvalue().encode("utf-8")
+
 
+def encode_week_rows(
+    season: str, week: str, header: list[str], rows: list[list[str]], union_cols: list[str]
+) -> bytes:
+    """One week CSV's rows remapped onto the combined header (Season, Week, union columns)."""
+    positions = {col: 2 + i for i, col in enumerate(union_cols)}
     # Determine which column holds manager name (prefer Owner)
-    try:
-        owner_col_name = "Owner" if "Owner" in union_cols else "ManagerName"
-    except Exception:
-        owner_col_name = "Owner"
+    owner_col_name = "Owner" if "Owner" in union_cols else "ManagerName"
+    width = 2 + len(positions)
+    # Repeated names (the per-slot "Points") keep their last value, as the combined header lists them once
+    targets = [positions[col] for col in header]
+    owner_at = max((i for i, col in enumerate(header) if col == owner_col_name), default=None)
 
-    with out_file.open("w", newline="", encoding="utf-8") as out_f:
-        writer = csv.DictWriter(out_f, fieldnames=final_header)
-        writer.writeheader()
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for row in rows:
+        out = [""] * width
+        out[0] = season
+        out[1] = week
+        for target, value in zip(targets, row):
+            out[target] = value
+        if owner_at is not None:
+            # normalize manager/owner if present
+            out[targets[owner_at]] = normalize_manager_name(row[owner_at] if owner_at < len(row) else "")
+        writer.writerow(out)
+    return buf.getvalue().encode("utf-8")
 
-        # Second pass: write aligned rows
-        for csv_file in files:
-            # filename format: 2017-11.csv
-            name = csv_file.stem
-            try:
-                file_season, week = name.split("-")
-            except ValueError:
-                continue
 
-            with csv_file.open("r", newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                if reader.fieldnames is None:
-                    continue
-
-                for row in reader:
-                    # normalize manager/owner if present
-                    if owner_col_name in row:
-                        row[owner_col_name] = normalize_manager_name(row.get(owner_col_name) or "")
-
-                    # Build output dict with blanks for missing cols
-                    out_row = {col: "" for col in final_header}
-                    out_row["Season"] = file_season
-                    out_row["Week"] = week
-                    for k, v in row.items():
-                        if k in union_cols:
-                            out_row[k] = v if v is not None else ""
-                    writer.writerow(out_row)
+def _write_weeks(
+    out, start: int, read: list[tuple[_WeekFile, CombinedWeek, list[str], list[list[str]]]], union_cols: list[str]
+) -> list[CombinedWeek]:
+    written: list[CombinedWeek] = []
+    offset = start
+    for week_file, fingerprint, header, rows in read:
+        data = encode_week_rows(week_file.season, week_file.week, header, rows, union_cols) if header else b""
+        out.write(data)
+        written.append(CombinedWeek(**{**asdict(fingerprint), "offset": offset}))
+        offset += len(data)
+    return written
+
+
+def _save_state(state_path: Path, union_cols: list[str], weeks: list[CombinedWeek], combined_size: int) -> None:
+    state = {
+        "version": STATE_VERSION,
+        "union_cols": union_cols,
+        "combined_size": combined_size,
+        "weeks": [asdict(w) for w in weeks],
+    }
+    with atomic_open(state_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=1)
+
+
+def combine_weeks(league_id: str = league_id, *, rebuild: bool = False) -> Path:
+    """
+    Bring <league>-history-teamgamecenter/all_seasons_combined.csv up to date
+    with every week CSV.
+
+    Incremental: the sidecar records each combined week file (size, mtime,
+    hash) and where its rows start. Rows from the first new or changed week
+    on are rewritten (normally just an append of the latest week); the whole
+    file is re-emitted when the union header of the kept and rewritten weeks
+    differs from the one on disk in any way (a column added or dropped, or
+    first seen in a different order), or with rebuild. The result is always
+    what a full rebuild would write.
+    """
+    base_dir = Path("output")
+    gamecenter_root = base_dir / f"{league_id}-history-teamgamecenter"
+
+    out_file = gamecenter_root / "all_seasons_combined.csv"
+    state_path = gamecenter_root / STATE_NAME
+
+    files = _week_files(gamecenter_root)
+    state = None if rebuild else _load_state(state_path, out_file)
+
+    if state is not None:
+        # Weeks still combined exactly as recorded, up to the first difference
+        kept: list[CombinedWeek] = []
+        for week_file, recorded in zip(files, state["weeks"]):
+            same = _unchanged(week_file, recorded)
+            if same is None:
+                break
+            kept.append(same)
+
+        if len(kept) == len(files) == len(state["weeks"]):
+            if kept != state["weeks"]:
+                # Touched but identical files: record the new mtimes so they aren't hashed every run
+                _save_state(state_path, state["union_cols"], kept, state["combined_size"])
+            print(f"Combined file up to date: {out_file}")
+            return out_file
+
+        union_cols: list[str] = state["union_cols"]
+        tail = [(f, *_read(f)) for f in files[len(kept):]]
+        headers = [w.header for w in kept] + [header for _, _, header, _ in tail]
+        if union_header(headers) == union_cols:
+            cut = state["weeks"][len(kept)].offset if len(kept) < len(state["weeks"]) else state["combined_size"]
+            with out_file.open("r+b") as out:
+                out.truncate(cut)
+                out.seek(cut)
+                written = _write_weeks(out, cut, tail, union_cols)
+                out.flush()
+                os.fsync(out.fileno())
+                combined_size = out.tell()
+            _save_state(state_path, union_cols, kept + written, combined_size)
+            print(f"Updated combined file (rewrote {len(tail)} of {len(files)} week files): {out_file}")
+            return out_file
+        # The header changed shape: every earlier row needs the new layout
+
+    # Full rebuild: union header across all files, in file order
+    read = [(f, *_read(f)) for f in files]
+    union_cols = union_header(header for _, _, header, _ in read)
+
+    if not union_cols:
+        raise RuntimeError(f"No CSV headers found under {gamecenter_root}")
+
+    header_bytes = encode_header(union_cols)
+
+    with atomic_open(out_file, "wb") as out:
+        out.write(header_bytes)
+        written = _write_weeks(out, len(header_bytes), read, union_cols)
+        combined_size = out.tell()
+    _save_state(state_path, union_cols, written, combined_size)
 
     print(f"Wrote combined file: {out_file}")
+    return out_file
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Combine every week CSV into all_seasons_combined.csv.")
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Rewrite the combined file from scratch instead of updating it.",
+    )
+    args = parser.parse_args()
+    combine_weeks(rebuild=args.rebuild)
 
 
 if __name__ == "__main__":
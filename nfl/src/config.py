@@ -1,3 +1,6 @@
+from __future__ import annotations
+
+import os
 from pathlib import Path
 
 league_id: str = "879846"
@@ -5,8 +8,89 @@ league_start_year: int = 2012
 league_end_year: int = 2025  # inclusive
 cutoff_playoffs:int = 4
 
+# Every league scrapeAll/scrapeStandings batch over, with its own seasons
+# (inclusive). Cookies come from src.secrets.league_cookies[league_id] if
+# set, else src.secrets.cookie_string.
+LEAGUES: list[dict] = [
+    {"league_id": league_id, "start_year": league_start_year, "end_year": league_end_year},
+]
+
+# Site every page URL is built on. FANTASY_BASE_URL points the scrapers at a
+# local stand-in instead (python -m benchmarks.fake_site).
+BASE_URL: str = os.environ.get("FANTASY_BASE_URL", "https://fantasy.nfl.com").rstrip("/")
+
+# Upper bound on concurrent requests to a single host (fantasy.nfl.com).
+# The adaptive limiter (src/rate_limit.py) moves between 1 and this.
+MAX_IN_FLIGHT_PER_HOST: int = 4
+
+# Per-host request rate: starting point and the range AIMD may move it in
+REQUESTS_PER_SECOND: float = 2.0
+MIN_REQUESTS_PER_SECOND: float = 0.2
+MAX_REQUESTS_PER_SECOND: float = 8.0
+# Responses slower than this count as "back off" signals
+TARGET_LATENCY_SECONDS: float = 3.0
+
+# Retries for 429 / 5xx / connection errors, with jittered exponential backoff
+MAX_RETRIES: int = 5
+BACKOFF_BASE_SECONDS: float = 1.0
+BACKOFF_MAX_SECONDS: float = 60.0
+
+# Block handling: consecutive login/captcha pages before every worker pauses,
+# the first pause (doubles per trip), and how many trips before giving up
+BLOCK_THRESHOLD: int = 3
+BLOCK_COOLDOWN_SECONDS: float = 300.0
+MAX_BREAKER_TRIPS: int = 3
+# Response prefix scanned for block signatures before reading the rest
+EARLY_BLOCK_CHECK_BYTES: int = 16384
+
+# Fetch on one asyncio event loop (aiohttp, `pip install .[async]`) instead of
+# a thread per request. The host limiter still decides how many requests are
+# actually on the wire; the loop just holds the rest as cheap coroutines.
+ASYNC_TRANSPORT: bool = False
+ASYNC_FETCHES_IN_FLIGHT: int = 256
+# Idle keep-alive connections are closed after this long
+ASYNC_KEEPALIVE_SECONDS: float = 30.0
+
+# Fetched-but-unparsed pages allowed to wait for the parser (bounds raw HTML in memory)
+PIPELINE_QUEUE_SIZE: int = 8
+# Processes parsing gamecenter HTML off the fetch threads; 0 = parse on the
+# scheduler thread
+PARSE_PROCESSES: int = 0
+
+# Processes aggregating standings CSVs that aren't in aggregate's per-season
+# cache (only matters for a cold cache); 0 = in the calling process
+AGGREGATE_PROCESSES: int = 0
+
+# How often long scheduler runs print progress and ETA
+PROGRESS_INTERVAL_SECONDS: float = 10.0
+
 BASE_OUTPUT_DIR: Path = Path("output")
 
+# Cookies picked up by the homepage warmup, reused across runs
+SESSION_COOKIE_JAR: Path = BASE_OUTPUT_DIR / ".session" / "cookies.json"
+
+# BeautifulSoup parser. "lxml" (pip install .[fast]) builds trees several
+# times faster, and HTML_STRAINERS builds only the parts of each page that
+# get read; run python -m src.check_parsers against the HTML archive before
+# turning either on. Both can also be set from the environment.
+HTML_PARSER: str = os.environ.get("HTML_PARSER", "html.parser")
+HTML_STRAINERS: bool = os.environ.get("HTML_STRAINERS", "") == "1"
+
+# Raw pages kept in memory so different stages asking for the same URL
+# (owners page, week-1 gamecenter) share one download
+URL_CACHE_MAX_ENTRIES: int = 64
+
+# Every fetched page is kept here so parsing can be re-run offline (--replay)
+HTML_ARCHIVE_DIR: Path = BASE_OUTPUT_DIR / ".archive"
+
+# SQLite copy of the output CSVs for ad-hoc queries (python -m src.warehouse)
+WAREHOUSE_PATH: Path = BASE_OUTPUT_DIR / "warehouse.sqlite"
+
+# Per-season shape (owners, weeks) learned by discovery.
+# Finished seasons are never rediscovered; the current one is after the TTL.
+SEASON_META_PATH: Path = BASE_OUTPUT_DIR / ".meta" / "seasons.json"
+SEASON_META_TTL_SECONDS: float = 6 * 60 * 60
+
 REQUIRED_COLUMNS = {
     "ManagerName",
     "Wins",
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+from src.utils.jsonl import JsonlAppender, read_jsonl
+
+
+@dataclass(frozen=True)
+class ArchiveEntry:
+    url: str
+    fetched_at: float
+    sha256: str
+    encoding: str  # "" if the response didn't declare one
+    ok: bool  # False if the page failed its must_contain check
+    # Validators for conditional GETs (live mode); "" if the server sent none
+    etag: str = ""
+    last_modified: str = ""
+
+
+class HtmlArchive:
+    """
+    Content-addressed store of raw response bodies.
+
+    Layout under root:
+      index.jsonl              one ArchiveEntry per fetch (append-only)
+      blobs/ab/abcdef....gz    gzip'd body, named by sha256 of the raw bytes
+
+    Identical bodies fetched twice are stored once. An index line torn by a
+    crash mid-append is skipped on read and ended before the next append.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.index_path = root / "index.jsonl"
+        self._log = JsonlAppender(self.index_path)
+        self._lock = threading.Lock()
+        self._by_url: Optional[dict[str, list[ArchiveEntry]]] = None
+
+    def _blob_path(self, sha256: str) -> Path:
+        return self.root / "blobs" / sha256[:2] / f"{sha256}.gz"
+
+    def _index(self) -> dict[str, list[ArchiveEntry]]:
+        if self._by_url is None:
+            by_url: dict[str, list[ArchiveEntry]] = {}
+            # A torn last line (crash mid-append) is skipped, not fatal
+            for raw in read_jsonl(self.index_path):
+                try:
+                    entry = ArchiveEntry(**raw)
+                except TypeError:
+                    continue
+                by_url.setdefault(entry.url, []).append(entry)
+            self._by_url = by_url
+        return self._by_url
+
+    def put(
+        self,
+        url: str,
+        content: bytes,
+        *,
+        encoding: str = "",
+        ok: bool = True,
+        etag: str = "",
+        last_modified: str = "",
+    ) -> ArchiveEntry:
+        sha256 = hashlib.sha256(content).hexdigest()
+        entry = ArchiveEntry(
+            url=url,
+            fetched_at=time.time(),
+            sha256=sha256,
+            encoding=encoding,
+            ok=ok,
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+        with self._lock:
+            blob = self._blob_path(sha256)
+            if not blob.exists():
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                tmp = blob.with_suffix(".tmp")
+                tmp.write_bytes(gzip.compress(content))
+                tmp.replace(blob)
+
+            self._log.append(asdict(entry))
+            self._index().setdefault(url, []).append(entry)
+
+        return entry
+
+    def latest(self, url: str) -> Optional[ArchiveEntry]:
+        """Most recent good fetch of url, or None if we never got one."""
+        with self._lock:
+            entries = self._index().get(url, [])
+        good = [e for e in entries if e.ok]
+        return max(good, key=lambda e: e.fetched_at) if good else None
+
+    def entries(self) -> list[ArchiveEntry]:
+        """Every archived fetch, in index order."""
+        with self._lock:
+            return [e for entries in self._index().values() for e in entries]
+
+    def find(self, url: str, sha256: str) -> Optional[ArchiveEntry]:
+        """The newest entry for url whose body has this hash."""
+        with self._lock:
+            entries = self._index().get(url, [])
+        matching = [e for e in entries if e.sha256 == sha256]
+        return max(matching, key=lambda e: e.fetched_at) if matching else None
+
+    def read(self, entry: ArchiveEntry) -> bytes:
+        return self.read_blob(entry.sha256)
+
+    def read_blob(self, sha256: str) -> bytes:
+        """Body by content hash (FileNotFoundError if it was never stored)."""
+        return gzip.decompress(self._blob_path(sha256).read_bytes())
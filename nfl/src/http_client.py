@@ -1,9 +1,42 @@
 from __future__ import annotations
 
-from typing import Iterable, Optional
+import asyncio
+import hashlib
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Union
+from urllib.parse import urlsplit
 
 import requests
 from bs4 import BeautifulSoup as BS
+from requests.utils import get_encoding_from_headers
+
+try:
+    import aiohttp
+except ImportError:  # optional: pip install .[async]
+    aiohttp = None
+
+from src.circuit_breaker import CircuitBreaker
+from src.config import (
+    ASYNC_KEEPALIVE_SECONDS,
+    BASE_URL,
+    EARLY_BLOCK_CHECK_BYTES,
+    HTML_ARCHIVE_DIR,
+    MAX_IN_FLIGHT_PER_HOST,
+    MAX_RETRIES,
+    SESSION_COOKIE_JAR,
+    URL_CACHE_MAX_ENTRIES,
+)
+from src.html_archive import HtmlArchive
+from src.page_parser import parse_html
+from src.rate_limit import backoff_delay, describe_limiters, limiter_for
+from src.url_cache import SingleFlightCache
+
+HOME_URL = f"{BASE_URL}/"
 
 
 DEFAULT_HEADERS: dict[str, str] = {
@@ -14,17 +47,236 @@ DEFAULT_HEADERS: dict[str, str] = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8",
     "Accept-Language": "en-US,en;q=0.9",
     "Connection": "keep-alive",
-    "Referer": "https://fantasy.nfl.com/",
+    "Referer": HOME_URL,
     "Upgrade-Insecure-Requests": "1",
 }
 
 SESSION = requests.Session()
-
+# Let the connection pool hold as many keep-alive sockets as we allow in flight
+SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=MAX_IN_FLIGHT_PER_HOST))
 
 class ScrapeBlockedError(RuntimeError):
     pass
 
 
+# Block pages announce themselves in their <title>; real pages can mention
+# "captcha" anywhere else (a reCAPTCHA script, a sign-in modal), so only the
+# title is matched. The broader looks_like_login_or_block list is only used
+# on full bodies that already failed their must_contain check.
+_TITLE = re.compile(rb"<title[^>]*>([^<]*)</title", re.IGNORECASE)
+_HARD_BLOCK_TITLES: tuple[bytes, ...] = (
+    b"captcha",
+    b"verify you are human",
+    b"access denied",
+    b"attention required",
+)
+
+
+def _hard_blocked(prefix: bytes, must_contain: Optional[Iterable[str]]) -> bool:
+    """
+    True if prefix (the start of a response) is unmistakably a block page:
+    its title is a block page's, and none of the expected page's markers
+    are in it.
+    """
+    title = _TITLE.search(prefix)
+    if title is None or not any(s in title.group(1).lower() for s in _HARD_BLOCK_TITLES):
+        return False
+    return not any(m.encode("utf-8") in prefix for m in must_contain or ())
+
+
+class ArchiveMissError(RuntimeError):
+    """Replay mode asked for a URL that was never archived."""
+
+
+@dataclass
+class SessionStats:
+    warmups: int = 0
+    page_requests: int = 0
+    rewarms: int = 0
+    retries: int = 0
+    blocks: int = 0
+    aborted_bytes_saved: int = 0
+    # Conditional fetches whose page had not changed (304 or same body hash)
+    unchanged: int = 0
+
+    @property
+    def total_requests(self) -> int:
+        return self.warmups + self.page_requests
+
+
+class ScraperSession:
+    """
+    Owns the lifecycle of the shared requests.Session:
+    - warms up against the homepage once per process (not once per page)
+    - warms up again only when a page request gets bounced by a redirect
+    - persists the warmed cookie jar so the next run can skip the warmup
+
+    Page requests carry the warmup's cookies only. Cookies that page
+    responses set land in session.cookies too, but every league shares that
+    jar, so they are never sent on.
+    """
+
+    def __init__(self, session: requests.Session, cookie_jar_path: Optional[Path] = None) -> None:
+        self.session = session
+        self.cookie_jar_path = cookie_jar_path
+        self.stats = SessionStats()
+        self._warm = False
+        self._warm_cookies = requests.cookies.RequestsCookieJar()
+        self._lock = threading.Lock()
+        self.load_cookies()
+
+    def load_cookies(self) -> None:
+        if not self.cookie_jar_path or not self.cookie_jar_path.exists():
+            return
+        try:
+            cookies = json.loads(self.cookie_jar_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        for c in cookies:
+            for jar in (self.session.cookies, self._warm_cookies):
+                jar.set(c["name"], c["value"], domain=c.get("domain", ""), path=c.get("path", "/"))
+        # A persisted jar counts as warm; a bounce will trigger a fresh warmup
+        self._warm = bool(cookies)
+
+    def save_cookies(self) -> None:
+        if not self.cookie_jar_path:
+            return
+        cookies = [
+            {"name": c.name, "value": c.value, "domain": c.domain, "path": c.path}
+            for c in self._warm_cookies
+        ]
+        self.cookie_jar_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cookie_jar_path.write_text(json.dumps(cookies, indent=2), encoding="utf-8")
+
+    def warmup(self, *, force: bool = False) -> None:
+        with self._lock:
+            if self._warm and not force:
+                return
+            resp = self.session.get(HOME_URL, headers=DEFAULT_HEADERS, timeout=30)
+            # Taken from the warmup's own responses: session.cookies may also
+            # hold whatever other leagues' pages set by now
+            warm_cookies = self._warm_cookies.copy()
+            for r in [*resp.history, resp]:
+                warm_cookies.update(r.cookies)
+            self._warm_cookies = warm_cookies
+            self.stats.warmups += 1
+            if force:
+                self.stats.rewarms += 1
+            self._warm = True
+            self.save_cookies()
+
+    def cookie_header(self, cookie_string: str, url: str) -> str:
+        # An explicit Cookie header stops requests from sending the jar, so merge
+        # the warmed cookies in ourselves: those the jar would send to url
+        # (domain, path, expiry), with the configured cookie_string winning
+        explicit = {part.split("=", 1)[0].strip() for part in cookie_string.split(";") if "=" in part}
+        warm = requests.cookies.get_cookie_header(self._warm_cookies, requests.Request("GET", url)) or ""
+        extra = [part for part in warm.split("; ") if part and part.split("=", 1)[0] not in explicit]
+        return "; ".join([cookie_string.strip().rstrip(";")] + extra) if extra else cookie_string
+
+    def _send(
+        self,
+        url: str,
+        cookie_string: str,
+        *,
+        read_bounced: bool,
+        extra_headers: Optional[dict[str, str]] = None,
+        must_contain: Optional[Iterable[str]] = None,
+    ) -> tuple[requests.Response, bytes]:
+        """
+        Stream the response body. Raises ScrapeBlockedError as soon as the
+        first EARLY_BLOCK_CHECK_BYTES are a block page (see _hard_blocked),
+        without downloading the rest; shorter bodies are left to the full
+        check in _get_with_backoff. A bounced response's body is skipped
+        unless read_bounced.
+        """
+        headers = dict(DEFAULT_HEADERS)
+        headers["Cookie"] = self.cookie_header(cookie_string, url)
+        headers.update(extra_headers or {})
+        resp = self.session.get(url, headers=headers, timeout=30, allow_redirects=True, stream=True)
+        self.count_request()
+
+        with resp:
+            if _was_bounced(url, resp) and not read_bounced:
+                return resp, b""
+
+            body = _BodyReader(self, url, resp.headers, must_contain)
+            for chunk in resp.iter_content(chunk_size=8192):
+                body.feed(chunk)
+            return resp, body.content()
+
+    def count_request(self) -> None:
+        with self._lock:
+            self.stats.page_requests += 1
+
+    def count_abort(self, headers, read: int) -> None:
+        try:
+            total = int(headers.get("Content-Length", ""))
+        except ValueError:
+            return
+        with self._lock:
+            self.stats.aborted_bytes_saved += max(0, total - read)
+
+    def get(
+        self,
+        url: str,
+        cookie_string: str,
+        extra_headers: Optional[dict[str, str]] = None,
+        must_contain: Optional[Iterable[str]] = None,
+    ) -> tuple[requests.Response, bytes]:
+        self.warmup()
+        send = dict(extra_headers=extra_headers, must_contain=must_contain)
+        resp, content = self._send(url, cookie_string, read_bounced=False, **send)
+        if _was_bounced(url, resp):
+            self.warmup(force=True)
+            resp, content = self._send(url, cookie_string, read_bounced=True, **send)
+        return resp, content
+
+    def count_retry(self) -> None:
+        with self._lock:
+            self.stats.retries += 1
+
+    def count_block(self) -> None:
+        with self._lock:
+            self.stats.blocks += 1
+
+    def count_unchanged(self) -> None:
+        with self._lock:
+            self.stats.unchanged += 1
+
+    def report(self) -> str:
+        s = self.stats
+        return (
+            f"HTTP requests: {s.total_requests} "
+            f"(pages={s.page_requests}, warmups={s.warmups}, rewarms={s.rewarms}, retries={s.retries})\n"
+            f"Blocks: {s.blocks} (~{s.aborted_bytes_saved} bytes not downloaded), {BREAKER.describe()}\n"
+            f"Unchanged pages (conditional GET): {s.unchanged}\n"
+            f"{PAGE_CACHE.describe()}\n"
+            f"{describe_limiters()}"
+        )
+
+
+def _was_bounced(url: str, resp) -> bool:
+    """True if a redirect landed us on a different page (login wall, homepage...)."""
+    if not resp.history:
+        return False
+    return urlsplit(str(resp.url)).path.rstrip("/") != urlsplit(url).path.rstrip("/")
+
+
+SCRAPER_SESSION = ScraperSession(SESSION, SESSION_COOKIE_JAR)
+BREAKER = CircuitBreaker()
+ARCHIVE = HtmlArchive(HTML_ARCHIVE_DIR)
+PAGE_CACHE: SingleFlightCache[RawPage] = SingleFlightCache(URL_CACHE_MAX_ENTRIES)
+
+_replay = False
+
+
+def enable_replay() -> None:
+    """Serve every get_soup/get_page call from ARCHIVE; no network requests are made."""
+    global _replay
+    _replay = True
+
+
 def looks_like_login_or_block(html: str) -> bool:
     t = html.lower()
     return any(
@@ -43,25 +295,429 @@ def looks_like_login_or_block(html: str) -> bool:
     )
 
 
-def get_soup(url: str, cookie_string: str, must_contain: Optional[Iterable[str]] = None) -> BS:
-    # warmup (same as before)
-    SESSION.get("https://fantasy.nfl.com/", headers=DEFAULT_HEADERS, timeout=30)
+@dataclass(frozen=True)
+class RawPage:
+    url: str
+    content: bytes
+    encoding: Optional[str]
+    etag: str = ""
+    last_modified: str = ""
+    # Conditional fetch: same body as the archived copy (content is that copy)
+    unchanged: bool = False
+
+    def snippet(self, n: int = 1200) -> str:
+        return self.content[:n].decode(self.encoding or "utf-8", errors="replace").replace("\n", " ")
+
+
+def _missing_markers(content: bytes, must_contain: Optional[Iterable[str]]) -> list[str]:
+    return [m for m in must_contain or () if m.encode("utf-8") not in content]
+
+
+def _retry_after(headers) -> Optional[float]:
+    try:
+        return float(headers.get("Retry-After", ""))
+    except ValueError:
+        return None
+
+
+def _looks_blocked(content: bytes, encoding: Optional[str], must_contain: Optional[Iterable[str]]) -> bool:
+    """A page without its markers that reads like a login/block page."""
+    if not _missing_markers(content, must_contain):
+        return False
+    return looks_like_login_or_block(content.decode(encoding or "utf-8", errors="replace"))
+
+
+class _BodyReader:
+    """
+    Collects a streamed response body for either transport, raising
+    ScrapeBlockedError as soon as its first EARLY_BLOCK_CHECK_BYTES are a
+    block page (see _hard_blocked) so the rest is never downloaded.
+    """
+
+    def __init__(self, session: ScraperSession, url: str, headers, must_contain: Optional[Iterable[str]]) -> None:
+        self._session = session
+        self._url = url
+        self._headers = headers
+        self._must_contain = must_contain
+        self._buf = bytearray()
+        self._checked = False
 
-    headers = dict(DEFAULT_HEADERS)
-    headers["Cookie"] = cookie_string
+    def feed(self, chunk: bytes) -> None:
+        self._buf += chunk
+        if not self._checked and len(self._buf) >= EARLY_BLOCK_CHECK_BYTES:
+            self._checked = True
+            if _hard_blocked(bytes(self._buf[:EARLY_BLOCK_CHECK_BYTES]), self._must_contain):
+                self._session.count_abort(self._headers, len(self._buf))
+                raise ScrapeBlockedError(f"Block page detected early for URL:\n{self._url}")
 
-    resp = SESSION.get(url, headers=headers, timeout=30, allow_redirects=True)
-    resp.raise_for_status()
+    def content(self) -> bytes:
+        return bytes(self._buf)
 
-    html = resp.text or ""
-    if must_contain:
-        missing = [m for m in must_contain if m not in html]
-        if missing:
-            snippet = html[:1200].replace("\n", " ")
-            raise RuntimeError(
-                f"Did not receive expected HTML for URL:\n{url}\n\n"
-                f"Missing markers: {missing}\n\n"
-                f"HTML snippet:\n{snippet}"
+
+@dataclass(frozen=True)
+class _Response:
+    """What the retry logic needs from a requests or aiohttp response."""
+    status: int
+    headers: Any
+    content: bytes
+    encoding: Optional[str]
+    raise_for_status: Callable[[], Any]
+
+
+class _Attempts:
+    """
+    The retry/backoff decisions of one GET, shared by both transports; they
+    only do the I/O (breaker wait, limiter slot, request, sleep) around it:
+
+        attempts = _Attempts(url, must_contain)
+        while True:
+            ...fetch in attempts.limiter's slot...
+            result = attempts.outcome(response, error, latency)
+            if isinstance(result, RawPage):
+                return result
+            ...sleep result seconds...
+
+    429/5xx, connection errors and block pages are retried with jittered
+    exponential backoff and make the limiter back off; block pages also
+    count towards opening BREAKER, which pauses every worker.
+    """
+
+    def __init__(self, url: str, must_contain: Optional[Iterable[str]]) -> None:
+        self.url = url
+        self.must_contain = must_contain
+        self.limiter = limiter_for(url)
+        self.attempt = 0
+
+    def outcome(
+        self, response: Optional[_Response], error: Optional[BaseException], latency: float
+    ) -> Union[RawPage, float]:
+        """
+        The page, or the delay before the next attempt. response is None
+        when the request raised error (an early block page or a connection
+        error). Raises once the last attempt fails.
+        """
+        last_try = self.attempt == MAX_RETRIES
+        blocked = isinstance(error, ScrapeBlockedError)
+        if error is not None and not blocked and last_try:
+            raise error
+
+        throttled = response is None or response.status == 429 or response.status >= 500
+        not_modified = response is not None and response.status == 304
+        if response is not None and not throttled and not not_modified:
+            blocked = _looks_blocked(response.content, response.encoding, self.must_contain)
+
+        if blocked:
+            SCRAPER_SESSION.count_block()
+            BREAKER.record_block()
+            if last_try:
+                if error is not None:
+                    raise error
+                raise ScrapeBlockedError(
+                    f"Still getting a login/block page after {self.attempt + 1} tries:\n{self.url}"
+                )
+        elif not throttled:
+            assert response is not None
+            BREAKER.record_success()
+            self.limiter.record_success(latency)
+            response.raise_for_status()
+            return RawPage(
+                self.url,
+                response.content,
+                response.encoding,
+                etag=response.headers.get("ETag", ""),
+                last_modified=response.headers.get("Last-Modified", ""),
+                unchanged=not_modified,
+            )
+
+        delay = backoff_delay(self.attempt, _retry_after(response.headers) if response is not None else None)
+        self.limiter.record_throttle(delay)
+        if last_try:
+            assert response is not None
+            response.raise_for_status()
+            return RawPage(self.url, response.content, response.encoding)
+        self.attempt += 1
+        SCRAPER_SESSION.count_retry()
+        return delay
+
+
+def _get_with_backoff(
+    url: str,
+    cookie_string: str,
+    must_contain: Optional[Iterable[str]],
+    validators: Optional[dict[str, str]] = None,
+) -> RawPage:
+    """
+    GET through the host's shared limiter and the process-wide BREAKER,
+    retrying as _Attempts decides.
+
+    validators (If-None-Match / If-Modified-Since) make it a conditional
+    GET; a 304 comes back as an empty RawPage with unchanged=True.
+    """
+    attempts = _Attempts(url, must_contain)
+    while True:
+        BREAKER.wait()
+        response: Optional[_Response] = None
+        error: Optional[BaseException] = None
+        with attempts.limiter.slot():
+            start = time.monotonic()
+            try:
+                resp, content = SCRAPER_SESSION.get(url, cookie_string, validators, must_contain)
+                response = _Response(resp.status_code, resp.headers, content, resp.encoding, resp.raise_for_status)
+            except (ScrapeBlockedError, requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            latency = time.monotonic() - start
+
+        result = attempts.outcome(response, error, latency)
+        if isinstance(result, RawPage):
+            return result
+        time.sleep(result)
+
+
+def _replayed(url: str) -> RawPage:
+    entry = ARCHIVE.latest(url)
+    if entry is None:
+        raise ArchiveMissError(f"Replay mode: no archived HTML for URL:\n{url}")
+    return RawPage(url, ARCHIVE.read(entry), entry.encoding or None)
+
+
+def _validators(previous) -> dict[str, str]:
+    """Conditional-GET headers for the archived copy previous (None: plain GET)."""
+    validators: dict[str, str] = {}
+    if previous is not None:
+        if previous.etag:
+            validators["If-None-Match"] = previous.etag
+        if previous.last_modified:
+            validators["If-Modified-Since"] = previous.last_modified
+    return validators
+
+
+def _archive_fetched(url: str, page: RawPage, previous, must_contain: Optional[Iterable[str]]) -> RawPage:
+    """Archive a freshly fetched page, or resolve it to previous if it is unchanged."""
+    # 304, or a server without validators sending the same bytes again
+    if previous is not None and (page.unchanged or hashlib.sha256(page.content).hexdigest() == previous.sha256):
+        SCRAPER_SESSION.count_unchanged()
+        if not page.unchanged and (page.etag, page.last_modified) != (previous.etag, previous.last_modified):
+            # Same body, new validators: keep them so the next check can be a 304
+            previous = ARCHIVE.put(
+                url,
+                page.content,
+                encoding=page.encoding or "",
+                etag=page.etag,
+                last_modified=page.last_modified,
             )
+        return RawPage(
+            url,
+            ARCHIVE.read(previous),
+            previous.encoding or None,
+            etag=previous.etag,
+            last_modified=previous.last_modified,
+            unchanged=True,
+        )
+
+    ARCHIVE.put(
+        url,
+        page.content,
+        encoding=page.encoding or "",
+        ok=not _missing_markers(page.content, must_contain),
+        etag=page.etag,
+        last_modified=page.last_modified,
+    )
+    return page
 
-    return BS(html, "html.parser")
+
+def _load_page(url: str, cookie_string: str, must_contain: Optional[Iterable[str]], conditional: bool) -> RawPage:
+    if _replay:
+        return _replayed(url)
+    previous = ARCHIVE.latest(url) if conditional else None
+    page = _get_with_backoff(url, cookie_string, must_contain, _validators(previous))
+    return _archive_fetched(url, page, previous, must_contain)
+
+
+def _check_markers(page: RawPage, must_contain: Optional[Iterable[str]]) -> RawPage:
+    missing = _missing_markers(page.content, must_contain)
+    if missing:
+        # Don't hand a bad page to the next caller
+        PAGE_CACHE.invalidate(page.url)
+        raise RuntimeError(
+            f"Did not receive expected HTML for URL:\n{page.url}\n\n"
+            f"Missing markers: {missing}\n\n"
+            f"HTML snippet:\n{page.snippet()}"
+        )
+    return page
+
+
+def fetch_page(
+    url: str,
+    cookie_string: str,
+    must_contain: Optional[Iterable[str]] = None,
+    *,
+    conditional: bool = False,
+) -> RawPage:
+    """
+    Raw bytes for url (from the network, or ARCHIVE when replaying). Goes
+    through PAGE_CACHE, so callers in other stages or threads asking for the
+    same URL share one request.
+
+    conditional revalidates against the newest archived copy (ETag /
+    Last-Modified, else body hash); the result has unchanged=True if the
+    page is the same as that copy.
+    """
+    page = PAGE_CACHE.get_or_fetch(url, lambda: _load_page(url, cookie_string, must_contain, conditional))
+    return _check_markers(page, must_contain)
+
+
+def get_soup(
+    url: str,
+    cookie_string: str,
+    must_contain: Optional[Iterable[str]] = None,
+    page_type: Optional[str] = None,
+) -> BS:
+    """
+    Fetch url and parse it. page_type (see page_parser.STRAINERS) limits
+    parsing to the subtrees that page's parsers read.
+    """
+    page = fetch_page(url, cookie_string, must_contain)
+    return parse_html(page.content, encoding=page.encoding, page_type=page_type)
+
+
+class AsyncTransport:
+    """
+    fetch_page for asyncio: one aiohttp session over a keep-alive connection
+    pool, so a single event loop can have thousands of gamecenter pages
+    queued without a thread each. Everything else is shared with the sync
+    path: SCRAPER_SESSION's warmed cookies and stats, the host limiters,
+    BREAKER, ARCHIVE (and replay mode) and PAGE_CACHE. Responses are
+    negotiated compressed (gzip/deflate, brotli if installed) and decoded
+    by aiohttp.
+
+        async with AsyncTransport(cookie_string) as transport:
+            page = await transport.get_page(url, must_contain=["teamMatchupBoxScore"])
+    """
+
+    def __init__(
+        self,
+        cookie_string: str = "",
+        *,
+        max_connections: int = MAX_IN_FLIGHT_PER_HOST,
+        keepalive: float = ASYNC_KEEPALIVE_SECONDS,
+    ) -> None:
+        if aiohttp is None:
+            raise RuntimeError("The async transport needs aiohttp: pip install '.[async]'")
+        self.cookie_string = cookie_string
+        self.max_connections = max_connections
+        self.keepalive = keepalive
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> AsyncTransport:
+        self._session = aiohttp.ClientSession(
+            # The host limiter never lets more than MAX_IN_FLIGHT_PER_HOST
+            # through, so that many sockets are kept open and reused
+            connector=aiohttp.TCPConnector(
+                limit=self.max_connections,
+                keepalive_timeout=self.keepalive,
+                ttl_dns_cache=300,
+            ),
+            headers=DEFAULT_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=30),
+            # Cookies go in an explicit header built from SCRAPER_SESSION's warmup cookies
+            cookie_jar=aiohttp.DummyCookieJar(),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _send(
+        self,
+        url: str,
+        cookie_string: str,
+        *,
+        read_bounced: bool,
+        extra_headers: Optional[dict[str, str]] = None,
+        must_contain: Optional[Iterable[str]] = None,
+    ) -> tuple[aiohttp.ClientResponse, bytes]:
+        """ScraperSession._send over aiohttp (early block-page abort included)."""
+        assert self._session is not None, "use AsyncTransport as an async context manager"
+        headers = {"Cookie": SCRAPER_SESSION.cookie_header(cookie_string, url)}
+        headers.update(extra_headers or {})
+        async with self._session.get(url, headers=headers, allow_redirects=True) as resp:
+            SCRAPER_SESSION.count_request()
+            if _was_bounced(url, resp) and not read_bounced:
+                return resp, b""
+
+            body = _BodyReader(SCRAPER_SESSION, url, resp.headers, must_contain)
+            async for chunk in resp.content.iter_chunked(8192):
+                body.feed(chunk)
+            return resp, body.content()
+
+    async def _get(
+        self,
+        url: str,
+        cookie_string: str,
+        extra_headers: Optional[dict[str, str]] = None,
+        must_contain: Optional[Iterable[str]] = None,
+    ) -> tuple[aiohttp.ClientResponse, bytes]:
+        # The warmup is one request per process; run it (and its lock) off the loop
+        await asyncio.to_thread(SCRAPER_SESSION.warmup)
+        send = dict(extra_headers=extra_headers, must_contain=must_contain)
+        resp, content = await self._send(url, cookie_string, read_bounced=False, **send)
+        if _was_bounced(url, resp):
+            await asyncio.to_thread(SCRAPER_SESSION.warmup, force=True)
+            resp, content = await self._send(url, cookie_string, read_bounced=True, **send)
+        return resp, content
+
+    async def _get_with_backoff(
+        self,
+        url: str,
+        cookie_string: str,
+        must_contain: Optional[Iterable[str]],
+        validators: Optional[dict[str, str]] = None,
+    ) -> RawPage:
+        """_get_with_backoff, awaiting the breaker, limiter and backoff instead of blocking."""
+        attempts = _Attempts(url, must_contain)
+        while True:
+            await BREAKER.wait_async()
+            response: Optional[_Response] = None
+            error: Optional[BaseException] = None
+            async with attempts.limiter.slot_async():
+                start = time.monotonic()
+                try:
+                    resp, content = await self._get(url, cookie_string, validators, must_contain)
+                    # Same charset rules as requests (text/* without one is ISO-8859-1)
+                    encoding = get_encoding_from_headers(resp.headers)
+                    response = _Response(resp.status, resp.headers, content, encoding, resp.raise_for_status)
+                except (ScrapeBlockedError, aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    error = e
+                latency = time.monotonic() - start
+
+            result = attempts.outcome(response, error, latency)
+            if isinstance(result, RawPage):
+                return result
+            await asyncio.sleep(result)
+
+    async def _load_page(
+        self, url: str, cookie_string: str, must_contain: Optional[Iterable[str]], conditional: bool
+    ) -> RawPage:
+        # Archive reads/writes are file I/O: keep them off the loop
+        if _replay:
+            return await asyncio.to_thread(_replayed, url)
+        previous = await asyncio.to_thread(ARCHIVE.latest, url) if conditional else None
+        page = await self._get_with_backoff(url, cookie_string, must_contain, _validators(previous))
+        return await asyncio.to_thread(_archive_fetched, url, page, previous, must_contain)
+
+    async def get_page(
+        self,
+        url: str,
+        must_contain: Optional[Iterable[str]] = None,
+        *,
+        cookie_string: Optional[str] = None,
+        conditional: bool = False,
+    ) -> RawPage:
+        """fetch_page, awaitable. cookie_string defaults to the transport's."""
+        cookie_string = self.cookie_string if cookie_string is None else cookie_string
+        page = await PAGE_CACHE.get_or_fetch_async(
+            url, lambda: self._load_page(url, cookie_string, must_contain, conditional)
+        )
+        return _check_markers(page, must_contain)
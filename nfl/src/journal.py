@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Optional
+
+from src.utils import parse_gamecenter
+from src.utils.atomic import atomic_open
+from src.utils.jsonl import JsonlAppender, read_jsonl
+from src.utils.parse_gamecenter import GamecenterPage
+
+
+class ScrapeJournal:
+    """
+    Append-only JSONL log of gamecenter work units, one line per event:
+
+      {"event": "page", "season", "week", "team_id", "parser_version", "records": [...]}
+      {"event": "week", "season", "week", "path"}
+
+    A "page" line means that team's page was fetched and parsed; its records
+    (both sides of the matchup) are enough to rebuild the week's CSV, so a
+    resumed run never refetches it. Pages parsed by another
+    parse_gamecenter.PARSER_VERSION are ignored, so their records never end
+    up in a CSV stamped with the current one. A truncated last line (crash
+    mid-write) is ignored.
+
+    The file is read once, into a (season, week) index that appends keep up
+    to date. When superseded entries (refetched pages, other parser
+    versions) outnumber the live ones, it is rewritten with just the live
+    ones.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._log = JsonlAppender(path)
+        self._lock = threading.Lock()
+        # Latest entry per page or week, in file order; None until first used
+        self._live: Optional[dict[tuple, dict]] = None
+        # (season, week) -> team_id -> latest current-version page entry
+        self._pages: dict[tuple[int, int], dict[int, dict]] = {}
+
+    @staticmethod
+    def _key(entry: dict) -> Optional[tuple]:
+        if entry.get("event") == "page":
+            if entry.get("parser_version") != parse_gamecenter.PARSER_VERSION:
+                return None
+            return ("page", entry.get("season"), entry.get("week"), entry.get("team_id"))
+        if entry.get("event") == "week":
+            return ("week", entry.get("season"), entry.get("week"))
+        return None
+
+    def _index(self, entry: dict) -> None:
+        key = self._key(entry)
+        if key is None:
+            return
+        # Re-inserted at the end, so a compacted file keeps the latest order
+        self._live.pop(key, None)
+        self._live[key] = entry
+        if key[0] == "page":
+            self._pages.setdefault((key[1], key[2]), {})[key[3]] = entry
+
+    def _load(self) -> None:
+        if self._live is not None:
+            return
+        self._live = {}
+        read = 0
+        for entry in read_jsonl(self.path):
+            read += 1
+            self._index(entry)
+        if read - len(self._live) > len(self._live):
+            self._compact()
+
+    def _compact(self) -> None:
+        with atomic_open(self.path, "w", encoding="utf-8") as f:
+            for entry in self._live.values():
+                f.write(json.dumps(entry) + "\n")
+        self._log = JsonlAppender(self.path)
+
+    def _append(self, entry: dict) -> None:
+        with self._lock:
+            self._load()
+            self._log.append(entry)
+            self._index(entry)
+
+    def record_page(self, *, season: int, week: int, team_id: int, records: list[GamecenterPage]) -> None:
+        self._append(
+            {
+                "event": "page",
+                "season": season,
+                "week": week,
+                "team_id": team_id,
+                "parser_version": parse_gamecenter.PARSER_VERSION,
+                "records": [r.to_dict() for r in records],
+            }
+        )
+
+    def record_week(self, *, season: int, week: int, path: Path) -> None:
+        self._append({"event": "week", "season": season, "week": week, "path": str(path)})
+
+    def pages_for(self, *, season: int, week: int) -> dict[int, list[GamecenterPage]]:
+        """
+        team_id -> records from the latest journaled fetch of that team's page
+        parsed by the current parser version.
+        """
+        with self._lock:
+            self._load()
+            entries = dict(self._pages.get((season, week), {}))
+        return {team_id: [GamecenterPage.from_dict(r) for r in e["records"]] for team_id, e in entries.items()}
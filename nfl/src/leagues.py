@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+import src.secrets as secrets
+from src.config import LEAGUES
+
+
+@dataclass(frozen=True)
+class LeagueConfig:
+    league_id: str
+    start_year: int
+    end_year: int  # inclusive
+    cookie_string: str
+
+    @property
+    def seasons(self) -> list[int]:
+        return list(range(self.start_year, self.end_year + 1))
+
+
+def configured_leagues(only: Optional[list[str]] = None) -> list[LeagueConfig]:
+    """config.LEAGUES resolved against src.secrets; only filters by league_id."""
+    cookies: dict[str, str] = getattr(secrets, "league_cookies", {})
+    leagues = [
+        LeagueConfig(
+            league_id=str(entry["league_id"]),
+            start_year=int(entry["start_year"]),
+            end_year=int(entry["end_year"]),
+            cookie_string=cookies.get(str(entry["league_id"]), secrets.cookie_string),
+        )
+        for entry in LEAGUES
+    ]
+    if only:
+        unknown = set(only) - {league.league_id for league in leagues}
+        if unknown:
+            raise RuntimeError(f"League(s) not in config.LEAGUES: {sorted(unknown)}")
+        leagues = [league for league in leagues if league.league_id in only]
+    return leagues
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from src.utils import gamecenterCsvUtils, owners, parse_gamecenter, playoffs, regular_standings
+from src.utils.atomic import atomic_open
+
+# Parser versions each kind of CSV depends on
+PARSERS: dict[str, dict[str, int]] = {
+    "gamecenter": {
+        "parse_gamecenter": parse_gamecenter.PARSER_VERSION,
+        "gamecenterCsvUtils": gamecenterCsvUtils.PARSER_VERSION,
+    },
+    "standings": {
+        "regular_standings": regular_standings.PARSER_VERSION,
+        "playoffs": playoffs.PARSER_VERSION,
+        "owners": owners.PARSER_VERSION,
+    },
+}
+
+
+@dataclass
+class ManifestEntry:
+    """How one output CSV was produced: parser versions and the HTML it came from."""
+    kind: str  # "gamecenter" | "standings"
+    season: int
+    week: int = 0  # gamecenter only
+    teams: int = 0  # gamecenter only: team_ids are 1..teams
+    parsers: dict[str, int] = field(default_factory=dict)
+    # source URL -> sha256 of the archived body that was parsed
+    sources: dict[str, str] = field(default_factory=dict)
+    written_at: float = 0.0
+
+    def is_current(self) -> bool:
+        return self.parsers == PARSERS[self.kind]
+
+
+def stamp(kind: str, *, season: int, sources: dict[str, str], week: int = 0, teams: int = 0) -> ManifestEntry:
+    return ManifestEntry(
+        kind=kind,
+        season=season,
+        week=week,
+        teams=teams,
+        parsers=dict(PARSERS[kind]),
+        sources=dict(sorted(sources.items())),
+        written_at=time.time(),
+    )
+
+
+class OutputManifest:
+    """
+    Sidecar `.manifest.json` in an output directory, one ManifestEntry per
+    CSV file name. Rewritten atomically on every stamp; only written from
+    one thread (the scheduler's, or reparse's main process).
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.path = directory / ".manifest.json"
+
+    def _load(self) -> dict[str, ManifestEntry]:
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+            return {name: ManifestEntry(**entry) for name, entry in raw.items()}
+        except (OSError, ValueError, TypeError):
+            return {}
+
+    def get(self, csv_path: Path) -> Optional[ManifestEntry]:
+        return self._load().get(csv_path.name)
+
+    def stamp(self, csv_path: Path, entry: ManifestEntry) -> None:
+        entries = self._load()
+        entries[csv_path.name] = entry
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_open(self.path, "w", encoding="utf-8") as f:
+            json.dump({name: asdict(e) for name, e in sorted(entries.items())}, f, indent=1)
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import re
+from typing import Optional
+
+from bs4 import BeautifulSoup as BS
+from bs4 import SoupStrainer
+
+from src.config import HTML_PARSER, HTML_STRAINERS
+
+PARSER: str = HTML_PARSER
+
+# Per-page-type strainers: only these subtrees get built, the rest of the page
+# (nav, ads, scripts, footer) is skipped during parsing.
+STRAINERS: dict[str, SoupStrainer] = {
+    # #teamMatchupHeader (owners, ranks, totals) + #teamMatchupBoxScore (rosters)
+    "gamecenter": SoupStrainer(id=re.compile(r"^teamMatchup")),
+    # week selector <li class="ww ww-N">
+    "week_nav": SoupStrainer("li", class_=re.compile(r"\bww\b")),
+    # owners + regular standings are row-per-team tables
+    "owners": SoupStrainer("tr"),
+    "standings": SoupStrainer("tr"),
+    # final standings are <li class="place..."> entries
+    "playoffs": SoupStrainer("li"),
+}
+
+
+def parse_html(
+    content: bytes,
+    *,
+    encoding: Optional[str] = None,
+    page_type: Optional[str] = None,
+    parser: Optional[str] = None,
+    strain: Optional[bool] = None,
+) -> BS:
+    """
+    Parse raw response bytes (no str decode up front; the parser decodes).
+    With strain (default HTML_STRAINERS), page_type picks a strainer from
+    STRAINERS; otherwise, or with no page_type, the full tree is built.
+    parser defaults to PARSER.
+    """
+    strain = HTML_STRAINERS if strain is None else strain
+    strainer = STRAINERS[page_type] if page_type and strain else None
+    return BS(content, parser or PARSER, from_encoding=encoding, parse_only=strainer)
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator, Optional
+from urllib.parse import urlsplit
+
+from src.config import (
+    BACKOFF_BASE_SECONDS,
+    BACKOFF_MAX_SECONDS,
+    MAX_IN_FLIGHT_PER_HOST,
+    MAX_REQUESTS_PER_SECOND,
+    MIN_REQUESTS_PER_SECOND,
+    REQUESTS_PER_SECOND,
+    TARGET_LATENCY_SECONDS,
+)
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """
+    Full-jitter exponential backoff: uniform(0, base * 2**attempt), capped.
+    A server-provided Retry-After is treated as a floor.
+    """
+    delay = random.uniform(0, min(BACKOFF_MAX_SECONDS, BACKOFF_BASE_SECONDS * (2 ** attempt)))
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, BACKOFF_MAX_SECONDS))
+    return delay
+
+
+class HostLimiter:
+    """
+    Per-host token bucket + AIMD concurrency limit.
+
+    - rate: requests/second refilled into the bucket (burst = 1 second's worth)
+    - limit: how many requests may be in flight at once
+
+    Each fast success nudges both up additively (about +1 in-flight per
+    `limit` successes). A throttle (429/5xx, slow response, block) halves
+    both and pauses the host for the backoff delay. Decreases are spaced
+    out by TARGET_LATENCY_SECONDS, so one bad burst only halves once.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float = REQUESTS_PER_SECOND,
+        min_rate: float = MIN_REQUESTS_PER_SECOND,
+        max_rate: float = MAX_REQUESTS_PER_SECOND,
+        max_concurrency: int = MAX_IN_FLIGHT_PER_HOST,
+        target_latency: float = TARGET_LATENCY_SECONDS,
+    ) -> None:
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = float(max(1, self.max_concurrency // 2))
+        self.target_latency = target_latency
+
+        self.active = 0
+        self.successes = 0
+        self.throttles = 0
+        self._tokens = 1.0
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(max(1.0, self.rate), self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def _token_wait(self) -> float:
+        """Take a token and return 0, or return how long until one is due."""
+        with self._cond:
+            now = time.monotonic()
+            wait = self._paused_until - now
+            if wait <= 0:
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return 0.0
+                wait = (1 - self._tokens) / self.rate
+            return wait
+
+    def _release(self) -> None:
+        with self._cond:
+            self.active -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        with self._cond:
+            while self.active >= int(self.limit):
+                self._cond.wait()
+            self.active += 1
+        try:
+            while (wait := self._token_wait()) > 0:
+                time.sleep(wait)
+            yield
+        finally:
+            self._release()
+
+    @asynccontextmanager
+    async def slot_async(self) -> AsyncIterator[None]:
+        """
+        slot() for coroutines, sharing the same bucket and in-flight count.
+        A full host is polled about once per request interval rather than
+        waited on, since a Condition would block the event loop.
+        """
+        while True:
+            with self._cond:
+                if self.active < int(self.limit):
+                    self.active += 1
+                    break
+            await asyncio.sleep(1.0 / self.rate)
+        try:
+            while (wait := self._token_wait()) > 0:
+                await asyncio.sleep(wait)
+            yield
+        finally:
+            self._release()
+
+    def record_success(self, latency: float) -> None:
+        if latency > self.target_latency:
+            self.record_throttle(0.0)
+            return
+        with self._cond:
+            self.successes += 1
+            self.limit = min(float(self.max_concurrency), self.limit + 1.0 / max(1.0, self.limit))
+            self.rate = min(self.max_rate, self.rate + 0.1 / max(1.0, self.limit))
+            self._cond.notify_all()
+
+    def record_throttle(self, pause: float) -> None:
+        with self._cond:
+            now = time.monotonic()
+            self.throttles += 1
+            if now - self._last_decrease >= self.target_latency:
+                self.limit = max(1.0, self.limit / 2)
+                self.rate = max(self.min_rate, self.rate / 2)
+                self._last_decrease = now
+            self._paused_until = max(self._paused_until, now + pause)
+
+    def describe(self) -> str:
+        return (
+            f"rate={self.rate:.2f}/s in_flight_limit={int(self.limit)} "
+            f"successes={self.successes} throttles={self.throttles}"
+        )
+
+
+_LIMITERS: dict[str, HostLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def limiter_for(url: str) -> HostLimiter:
+    """The process-wide limiter for url's host (shared by every get_soup caller)."""
+    host = urlsplit(url).netloc
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(host)
+        if limiter is None:
+            limiter = HostLimiter()
+            _LIMITERS[host] = limiter
+        return limiter
+
+
+def describe_limiters() -> str:
+    with _LIMITERS_LOCK:
+        return "\n".join(f"{host}: {lim.describe()}" for host, lim in sorted(_LIMITERS.items()))
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+from src.config import BASE_OUTPUT_DIR
+from src.html_archive import ArchiveEntry
+from src.http_client import ARCHIVE, ArchiveMissError
+from src.manifest import ManifestEntry, OutputManifest, stamp
+from src.scrapeWeek import WeekJob, parse_gamecenter_page, write_week_csv
+from src.standings import standings_rows, standings_urls
+from src.utils.gameCenterUrl import gamecenter_url
+from src.writer import write_standings_csv
+
+
+@dataclass(frozen=True)
+class ReparseTask:
+    """One output CSV to rebuild from archived HTML (picklable, runs in a worker process)."""
+    kind: str  # "gamecenter" | "standings"
+    league_id: str
+    csv_path: Path
+    season: int
+    week: int
+    teams: int
+    sources: tuple[tuple[str, str], ...]  # (url, sha256)
+
+
+def _archived(url: str, sha256: str) -> tuple[bytes, Optional[str]]:
+    entry = ARCHIVE.find(url, sha256)
+    if entry is None:
+        raise ArchiveMissError(f"No archived HTML with sha256={sha256} for URL:\n{url}")
+    return ARCHIVE.read(entry), entry.encoding or None
+
+
+def _team_id(url: str) -> int:
+    return int(parse_qs(urlsplit(url).query)["teamId"][0])
+
+
+def rebuild(task: ReparseTask) -> ManifestEntry:
+    """Worker: parse task's sources with the current parsers and rewrite its CSV."""
+    if task.kind == "gamecenter":
+        job = WeekJob(
+            league_id=task.league_id,
+            season=task.season,
+            week=task.week,
+            out_csv_path=task.csv_path,
+            team_ids=list(range(1, task.teams + 1)),
+        )
+        # Team order, so a team's own page wins over its opponent's view of it
+        for url, sha256 in sorted(task.sources, key=lambda s: _team_id(s[0])):
+            content, encoding = _archived(url, sha256)
+            job.add(_team_id(url), parse_gamecenter_page(content, encoding))
+        write_week_csv(
+            season=task.season,
+            week=task.week,
+            team_ids=job.team_ids,
+            pages=job.pages,
+            out_csv_path=task.csv_path,
+        )
+        return stamp("gamecenter", season=task.season, week=task.week, teams=task.teams, sources=dict(task.sources))
+
+    by_url = dict(task.sources)
+    pages = {key: _archived(url, by_url[url]) for key, url in standings_urls(task.league_id, task.season).items()}
+    rows_by_team = standings_rows(**pages)
+    write_standings_csv(task.csv_path, rows_by_team.values())
+    return stamp("standings", season=task.season, sources=by_url)
+
+
+def _latest_sources(urls: list[str]) -> Optional[tuple[tuple[str, str], ...]]:
+    """For CSVs written before manifests existed: the newest good archived copy of each URL."""
+    entries: list[Optional[ArchiveEntry]] = [ARCHIVE.latest(url) for url in urls]
+    found = tuple((e.url, e.sha256) for e in entries if e is not None)
+    return found or None
+
+
+def _csv_rows(path: Path) -> int:
+    with path.open("r", newline="", encoding="utf-8") as f:
+        return max(0, sum(1 for _ in csv.reader(f)) - 1)
+
+
+def outdated(base_output_dir: Path, *, force: bool = False) -> tuple[list[ReparseTask], list[Path]]:
+    """
+    (tasks, unrecoverable): every output CSV whose manifest entry is missing
+    or stamped with other parser versions (all of them with force), and the
+    ones whose HTML is not in the archive.
+    """
+    tasks: list[ReparseTask] = []
+    unrecoverable: list[Path] = []
+
+    def consider(kind: str, league_id: str, csv_path: Path, season: int, week: int, manifest: OutputManifest) -> None:
+        entry = manifest.get(csv_path)
+        if entry is not None and entry.is_current() and not force:
+            return
+        if entry is not None:
+            teams, sources = entry.teams, tuple(sorted(entry.sources.items()))
+        elif kind == "gamecenter":
+            teams = _csv_rows(csv_path)
+            urls = [
+                gamecenter_url(league_id=league_id, season=season, team_id=t, week=week) for t in range(1, teams + 1)
+            ]
+            sources = _latest_sources(urls)
+        else:
+            teams, sources = 0, _latest_sources(list(standings_urls(league_id, season).values()))
+        if not sources:
+            unrecoverable.append(csv_path)
+            return
+        tasks.append(ReparseTask(kind, league_id, csv_path, season, week, teams, sources))
+
+    for gamecenter_root in sorted(base_output_dir.glob("*-history-teamgamecenter")):
+        league_id = gamecenter_root.name.split("-history-")[0]
+        for season_dir in sorted(p for p in gamecenter_root.iterdir() if p.is_dir() and p.name.isdigit()):
+            manifest = OutputManifest(season_dir)
+            for csv_path in sorted(season_dir.glob(f"{season_dir.name}-*.csv")):
+                week = int(csv_path.stem.split("-")[1])
+                consider("gamecenter", league_id, csv_path, int(season_dir.name), week, manifest)
+
+    for standings_dir in sorted(base_output_dir.glob("*-history-standings")):
+        league_id = standings_dir.name.split("-history-")[0]
+        manifest = OutputManifest(standings_dir)
+        for csv_path in sorted(p for p in standings_dir.glob("*.csv") if p.stem.isdigit()):
+            consider("standings", league_id, csv_path, int(csv_path.stem), 0, manifest)
+
+    return tasks, unrecoverable
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Rebuild output CSVs made by older parser versions from the local HTML archive (no network)."
+    )
+    parser.add_argument("--force", action="store_true", help="Rebuild every CSV, not just outdated ones.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Parser processes (default: all cores).")
+    parser.add_argument("--dry-run", action="store_true", help="Only list what would be rebuilt.")
+    args = parser.parse_args()
+
+    tasks, unrecoverable = outdated(BASE_OUTPUT_DIR, force=args.force)
+    for path in unrecoverable:
+        print(f"! No archived HTML for {path}; rescrape it")
+    print(f"{len(tasks)} outdated CSV(s)")
+    if args.dry_run or not tasks:
+        for task in tasks:
+            print(f"  {task.csv_path}")
+        return
+
+    failed = 0
+    # Per-CSV work is independent and CPU-bound; manifests are only written here
+    with ProcessPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        futures = {pool.submit(rebuild, task): task for task in tasks}
+        for future in as_completed(futures):
+            task = futures[future]
+            try:
+                entry = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"✗ {task.csv_path}: {e}")
+                continue
+            OutputManifest(task.csv_path.parent).stamp(task.csv_path, entry)
+            print(f"✓ Rebuilt {task.csv_path}")
+
+    if failed:
+        raise SystemExit(f"{failed} CSV(s) could not be rebuilt")
+
+
+if __name__ == "__main__":
+    main()
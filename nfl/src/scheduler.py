@@ -0,0 +1,365 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterator, Optional, Union
+
+from src.circuit_breaker import CircuitOpenError
+from src.config import (
+    ASYNC_FETCHES_IN_FLIGHT,
+    ASYNC_TRANSPORT,
+    MAX_IN_FLIGHT_PER_HOST,
+    PARSE_PROCESSES,
+    PIPELINE_QUEUE_SIZE,
+    PROGRESS_INTERVAL_SECONDS,
+)
+from src.http_client import ArchiveMissError, AsyncTransport, RawPage, ScrapeBlockedError, fetch_page
+
+# Lower runs first. Discovery unlocks a season's gamecenter weeks, so it goes
+# ahead of everything; standings are three pages a season.
+PRIORITY_DISCOVERY = 0
+PRIORITY_STANDINGS = 1
+PRIORITY_GAMECENTER = 2
+
+# Nothing else can succeed once the site is blocking us
+_FATAL = (ScrapeBlockedError, CircuitOpenError)
+
+
+def new_parse_pool(processes: int) -> ProcessPoolExecutor:
+    """
+    A process pool for parse_fn calls. Its workers start lazily, while fetch
+    threads (or the async loop's thread) are mid-request, and forking a
+    multi-threaded process can hand the child a lock that is never released;
+    so they come from a forkserver (spawn where there is none).
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context(method))
+
+
+@dataclass(frozen=True)
+class FetchTask:
+    url: str
+    must_contain: tuple[str, ...]
+    # Job-specific handle for the page (team_id, page name, ...)
+    key: Hashable
+    # Revalidate against the archived copy (live mode; see fetch_page)
+    conditional: bool = False
+
+
+class Job:
+    """
+    One node of the work graph: hands out FetchTasks, consumes their pages
+    on the scheduler thread, and writes its output when done. finish() may
+    return follow-up jobs (a season's discovery yields its weeks).
+
+    Subclasses provide `in_flight` (keys of tasks currently being fetched),
+    and set `priority` and `group`; a failure drops every job of its group.
+    `cookie_string` overrides the scheduler's (leagues need their own).
+    """
+
+    priority: int = PRIORITY_GAMECENTER
+    cookie_string: Optional[str] = None
+    in_flight: set
+
+    @property
+    def group(self) -> Hashable:
+        return None
+
+    def next_task(self) -> Optional[FetchTask]:
+        raise NotImplementedError
+
+    def handle(self, task: FetchTask, page: RawPage) -> None:
+        raise NotImplementedError
+
+    def parse_fn(self, task: FetchTask, page: RawPage) -> Optional[Callable[[bytes, Optional[str]], Any]]:
+        """
+        With Scheduler(parse_processes=N): a picklable top-level function
+        taking (content, encoding), run in a worker process; its (compact)
+        result goes to handle_parsed. None handles the page here instead.
+        """
+        return None
+
+    def handle_parsed(self, task: FetchTask, page: RawPage, parsed: Any) -> None:
+        raise NotImplementedError
+
+    def missing(self, task: FetchTask, error: ArchiveMissError) -> None:
+        """Replay had no archived copy of task's page."""
+        raise error
+
+    def done(self) -> bool:
+        raise NotImplementedError
+
+    def finish(self) -> list[Job]:
+        return []
+
+    def remaining(self) -> int:
+        """Upper bound on fetches this job still needs (for progress/ETA)."""
+        return 0
+
+
+class Progress:
+    """Throttled 'done/total, rate, ETA' line for long runs."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.started = time.monotonic()
+        self.fetched = 0
+        self._last_report = self.started
+
+    def tick(self, *, remaining: int) -> None:
+        self.fetched += 1
+        now = time.monotonic()
+        if now - self._last_report < self.interval:
+            return
+        self._last_report = now
+        rate = self.fetched / max(now - self.started, 1e-9)
+        total = self.fetched + remaining
+        eta = remaining / rate if rate > 0 else 0.0
+        print(
+            f"Progress: {self.fetched}/{total} pages ({100 * self.fetched / max(total, 1):.0f}%), "
+            f"{rate:.2f} pages/s, ETA {int(eta // 60)}m{int(eta % 60):02d}s"
+        )
+
+
+class Scheduler:
+    """
+    Drains a graph of Jobs through one shared fetch pool:
+
+      fetch threads --(raw HTML)--> job.handle --> job.finish
+                               \--> parse processes --(records)--> job.handle_parsed
+
+    Only max_workers fetches are in flight (the host limiter paces them) and
+    at most queue_size raw pages wait to be parsed. Free fetch slots go to
+    jobs in (priority, insertion) order, round-robin, and a job with a fetch
+    in flight gets at most its share of max_workers, so several weeks (or
+    seasons, or stages) progress together instead of idling between them.
+
+    With parse_processes, jobs that offer a parse_fn have their HTML parsed
+    in a ProcessPoolExecutor while fetch threads keep going; only the parsed
+    records come back across the process boundary.
+
+    With async_transport, fetches are coroutines on one event loop thread
+    (AsyncTransport) instead of a thread each, and max_workers defaults to
+    ASYNC_FETCHES_IN_FLIGHT: many more tasks can wait on the host limiter.
+
+    run() returns the failures by group; blocks (ScrapeBlockedError,
+    CircuitOpenError) stop everything and are raised.
+    """
+
+    def __init__(
+        self,
+        *,
+        cookie_string: str = "",
+        max_workers: Optional[int] = None,
+        queue_size: int = PIPELINE_QUEUE_SIZE,
+        progress_interval: float = PROGRESS_INTERVAL_SECONDS,
+        parse_processes: int = PARSE_PROCESSES,
+        async_transport: bool = ASYNC_TRANSPORT,
+    ) -> None:
+        if max_workers is None:
+            max_workers = ASYNC_FETCHES_IN_FLIGHT if async_transport else MAX_IN_FLIGHT_PER_HOST
+        self.cookie_string = cookie_string
+        self.parse_processes = max(0, parse_processes)
+        self.async_transport = async_transport
+        self.max_workers = max(1, max_workers)
+        self.queue_size = max(1, queue_size)
+        self.progress = Progress(progress_interval)
+        self.failures: dict[Hashable, BaseException] = {}
+        self._jobs: list[Job] = []
+        self._seq: dict[int, int] = {}
+
+    def add(self, job: Job) -> None:
+        if job.group in self.failures:
+            return
+        self._seq[id(job)] = len(self._seq)
+        self._jobs.append(job)
+        self._jobs.sort(key=lambda j: (j.priority, self._seq[id(j)]))
+
+    def _active(self, job: Job) -> bool:
+        # Identity, not ==: dataclass jobs compare by value
+        return any(j is job for j in self._jobs)
+
+    def _remaining(self) -> int:
+        return sum(job.remaining() for job in self._jobs)
+
+    def _fail(self, job: Job, error: BaseException) -> None:
+        self.failures[job.group] = error
+        self._jobs = [j for j in self._jobs if j.group != job.group]
+
+    def _finish_done(self) -> None:
+        while True:
+            finished = [j for j in self._jobs if j.done()]
+            if not finished:
+                return
+            for job in finished:
+                if not self._active(job):
+                    continue  # its group failed while finishing an earlier job
+                self._jobs = [j for j in self._jobs if j is not job]
+                try:
+                    follow_ups = job.finish()
+                except _FATAL:
+                    raise
+                except Exception as e:
+                    self._fail(job, e)
+                    continue
+                for follow_up in follow_ups:
+                    self.add(follow_up)
+
+    @contextmanager
+    def _fetcher(self, events: "queue.Queue[tuple]") -> Iterator[Callable[[Job, FetchTask], None]]:
+        """
+        A submit(job, task) that fetches in the background and puts a
+        ("fetched", job, task, page-or-exception) event when done.
+        """
+        if not self.async_transport:
+
+            def fetch(job: Job, task: FetchTask) -> None:
+                try:
+                    page: Union[RawPage, BaseException] = fetch_page(
+                        task.url,
+                        job.cookie_string or self.cookie_string,
+                        must_contain=list(task.must_contain),
+                        conditional=task.conditional,
+                    )
+                except BaseException as e:
+                    page = e
+                events.put(("fetched", job, task, page))
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                yield lambda job, task: pool.submit(fetch, job, task)
+            return
+
+        transport = AsyncTransport(self.cookie_string)
+
+        async def fetch_async(job: Job, task: FetchTask) -> None:
+            try:
+                page: Union[RawPage, BaseException] = await transport.get_page(
+                    task.url,
+                    list(task.must_contain),
+                    cookie_string=job.cookie_string or self.cookie_string,
+                    conditional=task.conditional,
+                )
+            except BaseException as e:
+                page = e
+            events.put(("fetched", job, task, page))
+
+        async def close() -> None:
+            # Only left over if run() is being unwound by an exception
+            pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for t in pending:
+                t.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            await transport.__aexit__(None, None, None)
+
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, name="scheduler-fetch-loop", daemon=True)
+        thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(transport.__aenter__(), loop).result()
+            yield lambda job, task: asyncio.run_coroutine_threadsafe(fetch_async(job, task), loop)
+        finally:
+            asyncio.run_coroutine_threadsafe(close(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def run(self) -> dict[Hashable, BaseException]:
+        # Fetched pages and, with parse_processes, finished parses, in arrival order
+        events: "queue.Queue[tuple]" = queue.Queue()
+        parse_pool = new_parse_pool(self.parse_processes) if self.parse_processes else None
+
+        def submit_more(submit: Callable[[Job, FetchTask], None], in_flight: int, parsing: int) -> int:
+            # Raw pages in memory: at most max_workers being fetched or waiting
+            # to be handled, plus queue_size waiting in the parse pool
+            while in_flight < self.max_workers and parsing < self.queue_size:
+                submitted = False
+                # Shares are of what the host limiter lets onto the wire, so a
+                # large async max_workers doesn't fetch both teams of a matchup
+                share = -(-min(self.max_workers, MAX_IN_FLIGHT_PER_HOST) // max(1, len(self._jobs)))
+                for job in list(self._jobs):
+                    if in_flight >= self.max_workers:
+                        break
+                    if job.in_flight and len(job.in_flight) >= share:
+                        continue
+                    task = job.next_task()
+                    if task is None:
+                        continue
+                    job.in_flight.add(task.key)
+                    submit(job, task)
+                    in_flight += 1
+                    submitted = True
+                if not submitted:
+                    break
+            return in_flight
+
+        # Jobs already complete (journaled weeks, cached discovery) need no fetch
+        self._finish_done()
+
+        in_flight = 0
+        parsing = 0
+        fatal: Optional[BaseException] = None
+        try:
+            with self._fetcher(events) as submit:
+                in_flight = submit_more(submit, in_flight, parsing)
+                while in_flight or parsing:
+                    event = events.get()
+                    job, task, page = event[1:4]
+                    if event[0] == "fetched":
+                        in_flight -= 1
+                    else:
+                        parsing -= 1
+
+                    if fatal is not None or not self._active(job):
+                        job.in_flight.discard(task.key)
+                        continue  # draining, or the job's group already failed
+
+                    try:
+                        if isinstance(page, ArchiveMissError):
+                            job.in_flight.discard(task.key)
+                            job.missing(task, page)
+                        elif isinstance(page, BaseException):
+                            job.in_flight.discard(task.key)
+                            raise page
+                        elif event[0] == "parsed":
+                            job.in_flight.discard(task.key)
+                            job.handle_parsed(task, page, event[4].result())
+                        else:
+                            parse_fn = job.parse_fn(task, page) if parse_pool else None
+                            if parse_fn is not None:
+                                # Stays in job.in_flight until parsed, so the job can't finish early
+                                future = parse_pool.submit(parse_fn, page.content, page.encoding)
+                                future.add_done_callback(
+                                    lambda f, job=job, task=task, page=page: events.put(("parsed", job, task, page, f))
+                                )
+                                parsing += 1
+                                in_flight = submit_more(submit, in_flight, parsing)
+                                continue
+                            job.in_flight.discard(task.key)
+                            job.handle(task, page)
+                        del page
+                    except _FATAL as e:
+                        fatal = e
+                        continue
+                    except Exception as e:
+                        self._fail(job, e)
+
+                    try:
+                        self._finish_done()
+                    except _FATAL as e:
+                        fatal = e
+                        continue
+                    self.progress.tick(remaining=self._remaining() + in_flight)
+                    in_flight = submit_more(submit, in_flight, parsing)
+        finally:
+            if parse_pool is not None:
+                parse_pool.shutdown(cancel_futures=True)
+
+        if fatal is not None:
+            raise fatal
+        return self.failures
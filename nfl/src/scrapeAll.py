@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import argparse
 from pathlib import Path
 
 from bs4 import BeautifulSoup as BS
 
-from src.config import league_id, league_end_year, league_start_year
-from src.secrets import cookie_string
-from src.scrapeSeason import scrape_season
+from src.circuit_breaker import CircuitOpenError
+from src.config import ASYNC_TRANSPORT, PARSE_PROCESSES
+from src.http_client import SCRAPER_SESSION, ScrapeBlockedError, enable_replay
+from src.leagues import configured_leagues
+from src.scheduler import Scheduler
+from src.scrapeSeason import record_season_progress, season_jobs
+from src.scrapeStandings import StandingsJob, report_standings_failures
 
 
 def dump_debug_html(*, debug_dir: Path, season: int, week: int, team_id: int, soup: BS) -> None:
@@ -15,24 +20,85 @@ def dump_debug_html(*, debug_dir: Path, season: int, week: int, team_id: int, so
     out.write_text(str(soup), encoding="utf-8")
 
 def main() -> None:
-    # Adjust these to your full range
-    start_season = league_start_year
-    end_season = league_end_year
+    parser = argparse.ArgumentParser(description="Scrape teamgamecenter weeks (and standings) for every configured league and season.")
+    parser.add_argument(
+        "--replay",
+        action="store_true",
+        help="Re-parse from the local HTML archive (no network) and rewrite existing week CSVs.",
+    )
+    parser.add_argument(
+        "--gamecenter-only",
+        action="store_true",
+        help="Skip the standings/owners pages (scrapeStandings covers them separately).",
+    )
+    parser.add_argument(
+        "--parse-processes",
+        type=int,
+        default=PARSE_PROCESSES,
+        help="Parse gamecenter HTML in this many worker processes (0: on the scheduler thread).",
+    )
+    parser.add_argument(
+        "--async",
+        dest="async_transport",
+        action="store_true",
+        default=ASYNC_TRANSPORT,
+        help="Fetch on one asyncio event loop (needs aiohttp) instead of a thread per request.",
+    )
+    parser.add_argument(
+        "--league",
+        action="append",
+        help="Only this league_id from config.LEAGUES (repeatable; default: all).",
+    )
+    args = parser.parse_args()
+    if args.replay:
+        enable_replay()
 
-    base_output_dir = Path("output")
+    leagues = configured_leagues(args.league)
 
-    for season in range(start_season, end_season + 1):
-        try:
-            scrape_season(
-                league_id=league_id,
+    # One work graph for every league and season: discovery, standings and
+    # gamecenter pages share the connection pool, host rate limiter and
+    # fetch workers, so the request budget never idles between leagues,
+    # seasons or stages. Output goes to each league's own directories.
+    scheduler = Scheduler(parse_processes=args.parse_processes, async_transport=args.async_transport)
+    for league in leagues:
+        for season in league.seasons:
+            for job in season_jobs(
+                league_id=league.league_id,
                 season=season,
-                base_output_dir=base_output_dir,
-                cookie_string=cookie_string,
-            )
-        except Exception as e:
-            # Stop on first failure so you can inspect debug HTML & fix parsing
-            print(f"\nFAILED season {season}: {e}")
-            raise
+                overwrite=args.replay,
+                cookie_string=league.cookie_string,
+            ):
+                scheduler.add(job)
+            if not args.gamecenter_only:
+                scheduler.add(
+                    StandingsJob(league_id=league.league_id, season=season, cookie_string=league.cookie_string)
+                )
+
+    try:
+        failures = scheduler.run()
+    except (ScrapeBlockedError, CircuitOpenError) as e:
+        # Every remaining page would hit the same wall
+        print(f"\nBLOCKED: {e}")
+        raise
+
+    failed_standings = report_standings_failures(failures)
+    failed: list[tuple[str, int]] = []
+    for league in leagues:
+        for season in league.seasons:
+            error = failures.get((league.league_id, season))
+            if error is not None:
+                # Pages already fetched for this season are journaled, so a rerun
+                # resumes where it stopped. Raw HTML is in the archive.
+                print(f"\nFAILED league {league.league_id} season {season}: {error}")
+                failed.append((league.league_id, season))
+            else:
+                record_season_progress(league_id=league.league_id, season=season)
+
+    print(SCRAPER_SESSION.report())
+    if failures:
+        raise SystemExit(
+            f"\nFailed seasons: {failed}, failed standings: {failed_standings} (rerun to resume)"
+        )
 
     print("\nAll done")
 
@@ -1,8 +1,8 @@
-from src.config import league_id
+from src.config import BASE_URL, league_id
 from src.http_client import get_soup
 from src.secrets import cookie_string
 
-URL = f"https://fantasy.nfl.com/league/{league_id}/history/2025/teamgamecenter?teamId=10&week=1"
+URL = f"{BASE_URL}/league/{league_id}/history/2025/teamgamecenter?teamId=10&week=1"
 
 def main() -> None:
     soup = get_soup(URL, cookie_string, must_contain=["teamMatchupBoxScore", "userName"])
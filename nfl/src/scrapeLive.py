@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import Optional
+
+from src.combineStandings import combine_standings
+from src.combineWeeks import combine_weeks
+from src.http_client import SCRAPER_SESSION
+from src.journal import ScrapeJournal
+from src.leagues import LeagueConfig, configured_leagues
+from src.output_paths import ensure_output_paths
+from src.scheduler import Job, Scheduler
+from src.scrapeStandings import StandingsJob, report_standings_failures
+from src.scrapeWeek import WeekJob
+from src.season_meta import current_season, current_week, get_season_meta
+
+
+def live_jobs(
+    *,
+    league: LeagueConfig,
+    season: int,
+    week: Optional[int],
+    on_week_written,
+    on_standings_written=None,
+) -> list[Job]:
+    """
+    Conditional refetch of the current and previous week plus the season's
+    standings. Nothing is rediscovered unless the season cache is stale.
+    """
+    meta = get_season_meta(league_id=league.league_id, season=season, cookie_string=league.cookie_string)
+    paths = ensure_output_paths(league_id=league.league_id, season=season, base_output_dir=Path("output"))
+    journal = ScrapeJournal(paths.gamecenter_dir / ".journal.jsonl")
+
+    week = week or current_week(season, meta.season_length)
+    jobs: list[Job] = []
+    for w in sorted({max(1, week - 1), week}):
+        jobs.append(
+            WeekJob(
+                league_id=league.league_id,
+                season=season,
+                week=w,
+                out_csv_path=paths.gamecenter_dir / f"{season}-{w}.csv",
+                team_ids=list(range(1, meta.number_of_owners + 1)),
+                journal=journal,
+                cookie_string=league.cookie_string,
+                refresh=True,
+                on_written=on_week_written,
+            )
+        )
+    jobs.append(
+        StandingsJob(
+            league_id=league.league_id,
+            season=season,
+            cookie_string=league.cookie_string,
+            refresh=True,
+            on_written=on_standings_written,
+        )
+    )
+    return jobs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="In-season refresh: re-check the current and previous week and rewrite only what changed."
+    )
+    parser.add_argument("--league", action="append", help="Only this league_id (repeatable; default: all).")
+    parser.add_argument("--season", type=int, help="Season to refresh (default: the current one).")
+    parser.add_argument("--week", type=int, help="Week to treat as current (default: from today's date).")
+    args = parser.parse_args()
+
+    season = args.season or current_season()
+    leagues = configured_leagues(args.league)
+    changed: dict[str, list[Path]] = {league.league_id: [] for league in leagues}
+    standings_changed: set[str] = set()
+
+    scheduler = Scheduler()
+    for league in leagues:
+        if not league.start_year <= season <= league.end_year:
+            continue
+
+        def on_week_written(week: int, out_csv: Path, league_id: str = league.league_id) -> None:
+            print(f"League {league_id} week {week}: changed, wrote {out_csv}")
+            changed[league_id].append(out_csv)
+
+        def on_standings_written(out_csv: Path, league_id: str = league.league_id) -> None:
+            print(f"League {league_id} standings: changed, wrote {out_csv}")
+            standings_changed.add(league_id)
+
+        for job in live_jobs(
+            league=league,
+            season=season,
+            week=args.week,
+            on_week_written=on_week_written,
+            on_standings_written=on_standings_written,
+        ):
+            scheduler.add(job)
+
+    failures = scheduler.run()
+    report_standings_failures(failures)
+    for group, error in failures.items():
+        if group[0] != "standings":
+            print(f"FAILED league {group[0]} season {group[1]}: {error}")
+
+    # Per-league combined CSVs: only rebuilt for leagues where an input changed.
+    # aggregate and the JSON converters read single-league paths under output/
+    # and are still run by hand after a refresh.
+    for league_id, written in changed.items():
+        if written:
+            combine_weeks(league_id)
+        else:
+            print(f"League {league_id}: no week changed")
+        if league_id in standings_changed:
+            combine_standings(league_id)
+        else:
+            print(f"League {league_id}: standings unchanged")
+
+    print(SCRAPER_SESSION.report())
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
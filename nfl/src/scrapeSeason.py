@@ -1,51 +1,184 @@
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Optional
 
 from src.config import league_id
+from src.http_client import RawPage
+from src.journal import ScrapeJournal
 from src.output_paths import ensure_output_paths
+from src.scheduler import PRIORITY_DISCOVERY, FetchTask, Job, Scheduler
+from src.season_meta import (
+    OWNERS_MARKERS,
+    SEASON_META,
+    WEEK_NAV_MARKERS,
+    SeasonMeta,
+    cached_season_meta,
+    meta_from_pages,
+    owners_url,
+    store_discovered,
+    update_from_weeks,
+)
 from src.secrets import cookie_string
 
-from src.utils.getOwnersCount import get_number_of_owners
-from src.utils.getSeasonLength import get_season_length
-from src.scrapeWeek import scrape_week
-
-
-def scrape_season(
-    *,
-    league_id: str,
-    season: int,
-    base_output_dir: Path,
-    cookie_string: str,
-) -> None:
+from src.scrapeWeek import WeekJob
+from src.utils.gameCenterUrl import gamecenter_url
 
 
+def _gamecenter_dir(league_id: str, season: int) -> Path:
     paths = ensure_output_paths(
         league_id=league_id,
         season=season,
         base_output_dir=Path("output"),
     )
+    return paths.gamecenter_dir
+
 
-    number_of_owners = get_number_of_owners(league_id, season, cookie_string)
-    season_length = get_season_length(league_id=league_id, season=season, cookie_string=cookie_string)
+def _week_csvs(league_id: str, meta: SeasonMeta) -> list[Path]:
+    gamecenter_dir = _gamecenter_dir(league_id, meta.season)
+    return [gamecenter_dir / f"{meta.season}-{week}.csv" for week in range(1, meta.season_length + 1)]
 
-    print(f"Season {season}: owners={number_of_owners}, weeks={season_length}")
 
-    for week in range(1, season_length + 1):
-        out_csv = paths.gamecenter_dir / f"{season}-{week}.csv"
+def week_jobs(
+    *, league_id: str, meta: SeasonMeta, overwrite: bool, cookie_string: Optional[str] = None
+) -> list[WeekJob]:
+    """One WeekJob per week of the season that still needs its CSV."""
+    season = meta.season
+    print(f"League {league_id} season {season}: owners={meta.number_of_owners}, weeks={meta.season_length}")
 
+    # Resume from pages fetched by an earlier, interrupted run (not when
+    # overwriting: that is a deliberate re-parse of every page)
+    journal = None if overwrite else ScrapeJournal(_gamecenter_dir(league_id, season) / ".journal.jsonl")
+    team_ids = list(range(1, meta.number_of_owners + 1))
+
+    jobs: list[WeekJob] = []
+    for week, out_csv in enumerate(_week_csvs(league_id, meta), start=1):
         # Skip if already scraped (super useful when rerunning)
-        if out_csv.exists():
+        if out_csv.exists() and not overwrite:
             print(f"Week {week}: already exists, skipping -> {out_csv}")
             continue
 
-        print(f"Week {week}: scraping...")
-        scrape_week(
-            league_id=league_id,
-            season=season,
-            week=week,
-            number_of_owners=number_of_owners,
-            cookie_string=cookie_string,
-            out_csv_path=out_csv,
+        jobs.append(
+            WeekJob(
+                league_id=league_id,
+                season=season,
+                week=week,
+                out_csv_path=out_csv,
+                team_ids=team_ids,
+                journal=journal,
+                cookie_string=cookie_string,
+                on_written=lambda week, out_csv: print(f"Wrote {out_csv}"),
+            )
+        )
+
+    if jobs:
+        print(f"League {league_id} season {season} weeks {[job.week for job in jobs]}: scraping...")
+    return jobs
+
+
+@dataclass(eq=False)
+class SeasonDiscoveryJob(Job):
+    """
+    Fetch a season's owners page and team 1's week-1 gamecenter page, cache
+    the SeasonMeta they describe, then hand the season's WeekJobs to the
+    scheduler. The week-1 page is also fed to its WeekJob, so it is not
+    fetched twice.
+    """
+    league_id: str
+    season: int
+    overwrite: bool = False
+    cookie_string: Optional[str] = None
+    priority: int = PRIORITY_DISCOVERY
+    in_flight: set = field(default_factory=set)
+    pages: dict = field(default_factory=dict)
+
+    @property
+    def group(self) -> tuple[str, int]:
+        return (self.league_id, self.season)
+
+    def _tasks(self) -> list[FetchTask]:
+        return [
+            FetchTask(owners_url(self.league_id, self.season), OWNERS_MARKERS, "owners"),
+            FetchTask(
+                gamecenter_url(league_id=self.league_id, season=self.season, team_id=1, week=1),
+                WEEK_NAV_MARKERS,
+                "week",
+            ),
+        ]
+
+    def next_task(self) -> Optional[FetchTask]:
+        for task in self._tasks():
+            if task.key not in self.pages and task.key not in self.in_flight:
+                return task
+        return None
+
+    def remaining(self) -> int:
+        return sum(1 for task in self._tasks() if task.key not in self.pages and task.key not in self.in_flight)
+
+    def handle(self, task: FetchTask, page: RawPage) -> None:
+        self.pages[task.key] = page
+
+    def done(self) -> bool:
+        return len(self.pages) == 2
+
+    def finish(self) -> list[Job]:
+        week_page: RawPage = self.pages["week"]
+        meta = store_discovered(
+            meta_from_pages(
+                league_id=self.league_id,
+                season=self.season,
+                owners_page=self.pages["owners"],
+                week_page=week_page,
+            )
         )
-        print(f"Week {week}: wrote {out_csv}")
+        jobs = week_jobs(
+            league_id=self.league_id, meta=meta, overwrite=self.overwrite, cookie_string=self.cookie_string
+        )
+        for job in jobs:
+            if job.week == 1 and 1 not in job.pages:
+                job.accept_page(1, week_page)
+        return jobs
+
+
+def season_jobs(
+    *, league_id: str, season: int, overwrite: bool = False, cookie_string: Optional[str] = None
+) -> list[Job]:
+    """
+    The gamecenter work for a season (its weeks, or discovery first if the
+    shape is unknown). Jobs are grouped by (league_id, season).
+    """
+    meta = cached_season_meta(league_id, season)
+    if meta is None:
+        return [
+            SeasonDiscoveryJob(league_id=league_id, season=season, overwrite=overwrite, cookie_string=cookie_string)
+        ]
+    return list(week_jobs(league_id=league_id, meta=meta, overwrite=overwrite, cookie_string=cookie_string))
+
+
+def record_season_progress(*, league_id: str, season: int) -> None:
+    """Fold a finished run's week CSVs into the season cache (immutability)."""
+    meta = SEASON_META.get(league_id, season)
+    if meta is not None:
+        update_from_weeks(meta, _week_csvs(league_id, meta))
+
+
+def scrape_season(
+    *,
+    league_id: str,
+    season: int,
+    base_output_dir: Path,
+    cookie_string: str,
+    overwrite: bool = False,
+) -> None:
+    # Owners and season length come from the season cache when possible;
+    # every missing week goes through one fetch/parse/write pipeline
+    scheduler = Scheduler(cookie_string=cookie_string)
+    for job in season_jobs(league_id=league_id, season=season, overwrite=overwrite):
+        scheduler.add(job)
+
+    failures = scheduler.run()
+    if failures:
+        raise failures[(league_id, season)]
+
+    record_season_progress(league_id=league_id, season=season)
 
-    print("Done")
\ No newline at end of file
+    print("Done")
@@ -1,75 +1,123 @@
-from src.config import (
-    BASE_OUTPUT_DIR,
-    league_id,
-    league_start_year,
-    league_end_year,
-)
-from src.http_client import get_soup
+import hashlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+from src.config import BASE_OUTPUT_DIR
+from src.http_client import SCRAPER_SESSION, RawPage, enable_replay
+from src.leagues import configured_leagues
 from src.output_paths import ensure_output_paths
-from src.utils.owners import apply_owners
-from src.utils.playoffs import apply_playoffs
-from src.utils.regular_standings import parse_regular_standings
-from src.secrets import cookie_string
+from src.manifest import OutputManifest, stamp
+from src.scheduler import PRIORITY_STANDINGS, FetchTask, Job, Scheduler
+from src.standings import standings_rows, standings_urls
 from src.writer import write_standings_csv
-import time
+import argparse
+
+
+@dataclass(eq=False)
+class StandingsJob(Job):
+    """Regular standings, final standings and owners pages of one season -> standings CSV."""
+    league_id: str
+    season: int
+    cookie_string: Optional[str] = None
+    # Live mode: conditional fetches; the CSV is only rewritten if a page changed
+    refresh: bool = False
+    on_written: Optional[Callable[[Path], None]] = None
+    priority: int = PRIORITY_STANDINGS
+    in_flight: set = field(default_factory=set)
+    pages: dict = field(default_factory=dict)
+
+    @property
+    def group(self) -> tuple[str, str, int]:
+        # Separate from the season's gamecenter jobs: one failing doesn't drop the other
+        return ("standings", self.league_id, self.season)
+
+    def _tasks(self) -> list[FetchTask]:
+        urls = standings_urls(self.league_id, self.season)
+        return [
+            FetchTask(urls["regular"], ("teamName", "teamPts"), "regular", conditional=self.refresh),
+            FetchTask(urls["playoffs"], ("teamName", "place"), "playoffs", conditional=self.refresh),
+            FetchTask(urls["owners"], ("teamName", "userName"), "owners", conditional=self.refresh),
+        ]
+
+    def next_task(self) -> Optional[FetchTask]:
+        for task in self._tasks():
+            if task.key not in self.pages and task.key not in self.in_flight:
+                return task
+        return None
+
+    def remaining(self) -> int:
+        return sum(1 for task in self._tasks() if task.key not in self.pages and task.key not in self.in_flight)
+
+    def handle(self, task: FetchTask, page: RawPage) -> None:
+        self.pages[task.key] = page
+
+    def done(self) -> bool:
+        return len(self.pages) == 3
+
+    def finish(self) -> list[Job]:
+        paths = ensure_output_paths(
+            league_id=self.league_id,
+            season=self.season,
+            base_output_dir=BASE_OUTPUT_DIR,
+        )
+        if self.refresh and paths.standings_csv.exists() and all(p.unchanged for p in self.pages.values()):
+            return []
+
+        rows_by_team = standings_rows(**{key: (page.content, page.encoding) for key, page in self.pages.items()})
+
+        # --- Write CSV ---
+        write_standings_csv(paths.standings_csv, rows_by_team.values())
+        OutputManifest(paths.standings_dir).stamp(
+            paths.standings_csv,
+            stamp(
+                "standings",
+                season=self.season,
+                sources={page.url: hashlib.sha256(page.content).hexdigest() for page in self.pages.values()},
+            ),
+        )
+
+        print(f"✓ Wrote {len(rows_by_team)} rows -> {paths.standings_csv}")
+        if self.on_written:
+            self.on_written(paths.standings_csv)
+        return []
+
+
+def report_standings_failures(failures: dict) -> list[tuple[str, int]]:
+    """Print the standings failures in a Scheduler.run() result; returns their (league_id, season)."""
+    failed: list[tuple[str, int]] = []
+    for group, e in failures.items():
+        if group[0] == "standings":
+            print(f"✗ Failed league {group[1]} season {group[2]}: {e}")
+            failed.append((group[1], group[2]))
+    return failed
 
 
 def main() -> None:
-    for season in range(league_start_year, league_end_year + 1):
-        print(f"\nProcessing season {season}...")
-
-        try:
-            regular_url = (
-                f"https://fantasy.nfl.com/league/{league_id}/history/{season}/standings"
-                f"?historyStandingsType=regular"
-            )
-            playoffs_url = (
-                f"https://fantasy.nfl.com/league/{league_id}/history/{season}/standings"
-                f"?historyStandingsType=final"
-            )
-            owners_url = (
-                f"https://fantasy.nfl.com/league/{league_id}/history/{season}/owners"
-            )
-
-            # --- Regular standings ---
-            regular_soup = get_soup(
-                regular_url,
-                cookie_string,
-                must_contain=["teamName", "teamPts"],
-            )
-            rows_by_team = parse_regular_standings(regular_soup)
-
-            # --- Playoffs ---
-            playoffs_soup = get_soup(
-                playoffs_url,
-                cookie_string,
-                must_contain=["teamName", "place"],
-            )
-            apply_playoffs(playoffs_soup, rows_by_team)
-
-            # --- Owners ---
-            owners_soup = get_soup(
-                owners_url,
-                cookie_string,
-                must_contain=["teamName", "userName"],
-            )
-            apply_owners(owners_soup, rows_by_team)
-
-            # --- Write CSV ---
-            paths = ensure_output_paths(
-                league_id=league_id,
-                season=season,
-                base_output_dir=BASE_OUTPUT_DIR,
-            )
-
-            write_standings_csv(paths.standings_csv, rows_by_team.values())
-
-            print(f"✓ Wrote {len(rows_by_team)} rows -> {paths.standings_csv}")
-            
-            time.sleep(0.5)
-
-        except Exception as e:
-            print(f"✗ Failed season {season}: {e}")
+    parser = argparse.ArgumentParser(description="Scrape standings + owners for every season.")
+    parser.add_argument(
+        "--replay",
+        action="store_true",
+        help="Re-parse from the local HTML archive (no network).",
+    )
+    parser.add_argument(
+        "--league",
+        action="append",
+        help="Only this league_id from config.LEAGUES (repeatable; default: all).",
+    )
+    args = parser.parse_args()
+    if args.replay:
+        enable_replay()
+
+    # All leagues' and seasons' pages go through one scheduler, so the
+    # request budget is never idle between them
+    scheduler = Scheduler()
+    for league in configured_leagues(args.league):
+        for season in league.seasons:
+            scheduler.add(StandingsJob(league_id=league.league_id, season=season, cookie_string=league.cookie_string))
+    report_standings_failures(scheduler.run())
+
+    print(SCRAPER_SESSION.report())
 
 
 if __name__ == "__main__":
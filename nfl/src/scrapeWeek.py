@@ -1,33 +1,179 @@
 import csv
-from bs4 import BeautifulSoup as BS
+import hashlib
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
 
-from src.http_client import get_soup
-from src.utils.parse_gamecenter import parse_bench_len
-from src.utils.getterGamecenter import get_starter_slots
+from src.config import MAX_IN_FLIGHT_PER_HOST, PARSE_PROCESSES, PIPELINE_QUEUE_SIZE
+from src.http_client import ARCHIVE, ArchiveMissError, RawPage
+from src.journal import ScrapeJournal
+from src.manifest import OutputManifest, stamp
+from src.page_parser import parse_html
+from src.scheduler import PRIORITY_GAMECENTER, FetchTask, Job, Scheduler
+from src.utils.parse_gamecenter import GamecenterPage, extract_gamecenter
 from src.utils.gamecenterCsvUtils import build_header, build_row
 from src.utils.gameCenterUrl import gamecenter_url
+from src.utils.atomic import atomic_open
 
 
-def scrape_week(
-    *,
-    league_id: str,
-    season: int,
-    week: int,
-    number_of_owners: int,
-    cookie_string: str,
-    out_csv_path,
-) -> None:
-    # 1) Fetch and cache soups once
-    soups: dict[int, BS] = {}
-    for team_id in range(1, number_of_owners + 1):
-        url = gamecenter_url(league_id=league_id, season=season, team_id=team_id, week=week)
-        soups[team_id] = get_soup(url, cookie_string, must_contain=["teamMatchupBoxScore"])
+def parse_gamecenter_page(content: bytes, encoding: Optional[str]) -> list[GamecenterPage]:
+    """Raw teamgamecenter HTML -> records; the soup is dropped on return."""
+    return extract_gamecenter(parse_html(content, encoding=encoding, page_type="gamecenter"))
+
+
+@dataclass(eq=False)
+class WeekJob(Job):
+    """
+    Progress of one week through the scheduler. pages maps team_id to that
+    team's record, read from its own page (side 1) or its opponent's (side 2).
+
+    per_matchup reads both sides of each page, so a team is only fetched
+    itself if no earlier page had it as the opponent (byes, pages already
+    in flight). When replaying, a team whose own page was never archived
+    is skipped; the live run must have read it from its opponent's page.
+
+    With a journal, every parsed page is logged as it arrives and pages
+    already in the journal are not fetched again, so an interrupted run
+    resumes at team-page granularity.
+
+    refresh (live mode) refetches every team conditionally instead: a page
+    that has not changed reuses its journaled records without parsing, and
+    if no page changed an existing CSV is left alone.
+    """
+    league_id: str
+    season: int
+    week: int
+    out_csv_path: Path
+    team_ids: list[int]
+    per_matchup: bool = True
+    journal: Optional[ScrapeJournal] = None
+    on_written: Optional[Callable[[int, Path], None]] = None
+    cookie_string: Optional[str] = None
+    refresh: bool = False
+    priority: int = PRIORITY_GAMECENTER
+    pending: deque = field(default_factory=deque)
+    in_flight: set = field(default_factory=set)
+    pages: dict = field(default_factory=dict)
+    # refresh: journaled records, used for pages that come back unchanged
+    known: dict = field(default_factory=dict)
+    changed: bool = False
+    # URL -> sha256 of every page the records came from (for the manifest)
+    sources: dict = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self.pending = deque(self.team_ids)
+        if self.journal:
+            journaled = self.journal.pages_for(season=self.season, week=self.week)
+            if self.refresh:
+                self.known = journaled
+            else:
+                for team_id, records in journaled.items():
+                    self.add(team_id, records)
+                    self._journaled_source(team_id)
+
+    @property
+    def group(self) -> tuple[str, int]:
+        return (self.league_id, self.season)
+
+    def next_team(self) -> Optional[int]:
+        while self.pending:
+            team_id = self.pending.popleft()
+            if team_id not in self.pages:
+                return team_id
+        return None
+
+    def _url(self, team_id: int) -> str:
+        return gamecenter_url(league_id=self.league_id, season=self.season, team_id=team_id, week=self.week)
+
+    def _journaled_source(self, team_id: int) -> None:
+        entry = ARCHIVE.latest(self._url(team_id))
+        if entry is not None:
+            self.sources[entry.url] = entry.sha256
+
+    def next_task(self) -> Optional[FetchTask]:
+        team_id = self.next_team()
+        if team_id is None:
+            return None
+        url = self._url(team_id)
+        return FetchTask(url, ("teamMatchupBoxScore",), team_id, conditional=self.refresh)
+
+    def done(self) -> bool:
+        return not self.in_flight and all(t in self.pages for t in self.pending)
+
+    def remaining(self) -> int:
+        return sum(1 for t in self.pending if t not in self.pages)
+
+    def add(self, team_id: int, records: list[GamecenterPage]) -> None:
+        self.pages[team_id] = records[0]
+        opponent = records[1] if self.per_matchup and len(records) > 1 else None
+        if opponent and opponent.team_id in self.team_ids and opponent.team_id not in self.pages:
+            self.pages[opponent.team_id] = opponent
+
+    def accept(self, team_id: int, records: list[GamecenterPage]) -> None:
+        """A freshly parsed page for team_id: journal it, then add it."""
+        if self.journal:
+            self.journal.record_page(season=self.season, week=self.week, team_id=team_id, records=records)
+        self.add(team_id, records)
+
+    def _accept_parsed(self, team_id: int, page: RawPage, records: list[GamecenterPage]) -> None:
+        self.sources[page.url] = hashlib.sha256(page.content).hexdigest()
+        self.changed = self.changed or not page.unchanged
+        self.accept(team_id, records)
+
+    def accept_page(self, team_id: int, page: RawPage) -> None:
+        """team_id's fetched page: parse it (unless unchanged and journaled) and accept it."""
+        if page.unchanged and team_id in self.known:
+            self.sources[page.url] = hashlib.sha256(page.content).hexdigest()
+            self.add(team_id, self.known[team_id])
+            return
+        self._accept_parsed(team_id, page, parse_gamecenter_page(page.content, page.encoding))
+
+    def handle(self, task: FetchTask, page: RawPage) -> None:
+        self.accept_page(task.key, page)
 
-    # 2) Find longest bench
+    def parse_fn(self, task: FetchTask, page: RawPage) -> Optional[Callable]:
+        if page.unchanged and task.key in self.known:
+            return None  # journaled records are reused, nothing to parse
+        return parse_gamecenter_page
+
+    def handle_parsed(self, task: FetchTask, page: RawPage, parsed: list[GamecenterPage]) -> None:
+        self._accept_parsed(task.key, page, parsed)
+
+    def missing(self, task: FetchTask, error: ArchiveMissError) -> None:
+        pass
+
+    def finish(self) -> list[Job]:
+        if self.refresh and not self.changed and self.out_csv_path.exists():
+            return []
+        write_week_csv(
+            season=self.season,
+            week=self.week,
+            team_ids=self.team_ids,
+            pages=self.pages,
+            out_csv_path=self.out_csv_path,
+        )
+        OutputManifest(self.out_csv_path.parent).stamp(
+            self.out_csv_path,
+            stamp("gamecenter", season=self.season, week=self.week, teams=len(self.team_ids), sources=self.sources),
+        )
+        if self.journal:
+            self.journal.record_week(season=self.season, week=self.week, path=self.out_csv_path)
+        if self.on_written:
+            self.on_written(self.week, self.out_csv_path)
+        return []
+
+
+def write_week_csv(*, season: int, week: int, team_ids: list[int], pages: dict, out_csv_path: Path) -> None:
+    missing = [team_id for team_id in team_ids if team_id not in pages]
+    if missing:
+        raise RuntimeError(f"No gamecenter page for team_ids={missing} (season={season} week={week})")
+
+    # Find longest bench (in team order, so ties resolve like a serial run)
     longest_bench_len = -1
     longest_bench_team_id = -1
-    for team_id, soup in soups.items():
-        bench_len = parse_bench_len(soup)
+    for team_id in team_ids:
+        bench_len = pages[team_id].bench_len
         if bench_len > longest_bench_len:
             longest_bench_len = bench_len
             longest_bench_team_id = team_id
@@ -35,20 +181,88 @@ def scrape_week(
     if longest_bench_team_id == -1:
         raise RuntimeError(f"Could not determine longest bench team (season={season} week={week})")
 
-    # 3) Header
-    starter_slots = get_starter_slots(soups[longest_bench_team_id])
+    # Header
+    starter_slots = list(pages[longest_bench_team_id].starter_slots)
     header = build_header(starter_slots, longest_bench_len)
 
-    # 4) Write CSV
-    with out_csv_path.open("w", newline="", encoding="utf-8") as f:
+    # Write CSV (atomically: a partial file must never look like a finished week)
+    with atomic_open(out_csv_path, "w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
         writer.writerow(header)
 
-        for team_id in range(1, number_of_owners + 1):
-            row = build_row(soups[team_id], starter_slots, longest_bench_len)
+        for team_id in team_ids:
+            row = build_row(pages[team_id], starter_slots, longest_bench_len)
             if len(row) != len(header):
                 raise RuntimeError(
                     f"Row/header mismatch season={season} week={week} team_id={team_id} "
                     f"row={len(row)} header={len(header)}"
                 )
             writer.writerow(row)
+
+
+def scrape_weeks(
+    *,
+    league_id: str,
+    season: int,
+    weeks: list[tuple[int, Path]],
+    number_of_owners: int,
+    cookie_string: str,
+    max_workers: int = MAX_IN_FLIGHT_PER_HOST,
+    per_matchup: bool = True,
+    queue_size: int = PIPELINE_QUEUE_SIZE,
+    on_week_written: Optional[Callable[[int, Path], None]] = None,
+    journal: Optional[ScrapeJournal] = None,
+    parse_processes: int = PARSE_PROCESSES,
+) -> None:
+    """
+    Scrape several (week, out_csv_path) pairs of one season as a pipeline
+    (see Scheduler): a week's CSV is written as soon as all its teams have
+    a record (the header needs the longest bench), while later weeks are
+    still being fetched.
+    """
+    team_ids = list(range(1, number_of_owners + 1))
+    scheduler = Scheduler(
+        cookie_string=cookie_string,
+        max_workers=max_workers,
+        queue_size=queue_size,
+        parse_processes=parse_processes,
+    )
+    for week, out_csv_path in weeks:
+        scheduler.add(
+            WeekJob(
+                league_id=league_id,
+                season=season,
+                week=week,
+                out_csv_path=out_csv_path,
+                team_ids=team_ids,
+                per_matchup=per_matchup,
+                journal=journal,
+                on_written=on_week_written,
+            )
+        )
+
+    failures = scheduler.run()
+    if failures:
+        raise next(iter(failures.values()))
+
+
+def scrape_week(
+    *,
+    league_id: str,
+    season: int,
+    week: int,
+    number_of_owners: int,
+    cookie_string: str,
+    out_csv_path,
+    max_workers: int = MAX_IN_FLIGHT_PER_HOST,
+    per_matchup: bool = True,
+) -> None:
+    scrape_weeks(
+        league_id=league_id,
+        season=season,
+        weeks=[(week, out_csv_path)],
+        number_of_owners=number_of_owners,
+        cookie_string=cookie_string,
+        max_workers=max_workers,
+        per_matchup=per_matchup,
+    )
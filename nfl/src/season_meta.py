@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass, fields
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Optional
+
+from src.config import BASE_URL, SEASON_META_PATH, SEASON_META_TTL_SECONDS
+from src.http_client import RawPage, fetch_page
+from src.page_parser import parse_html
+from src.utils.atomic import atomic_open
+from src.utils.gameCenterUrl import gamecenter_url
+from src.utils.getOwnersCount import count_owners
+
+@dataclass
+class SeasonMeta:
+    """What a season looks like, so scraping it needs no discovery requests."""
+    league_id: str
+    season: int
+    number_of_owners: int
+    season_length: int
+    discovered_at: float = 0.0
+    # Set once every week is on disk for a season that is over: never refreshed
+    immutable: bool = False
+
+    def is_fresh(self, *, ttl: float = SEASON_META_TTL_SECONDS) -> bool:
+        return self.immutable or time.time() - self.discovered_at < ttl
+
+
+def current_season(today: Optional[date] = None) -> int:
+    """NFL seasons run into the next calendar year (playoffs end by February)."""
+    today = today or date.today()
+    return today.year if today.month >= 3 else today.year - 1
+
+
+def current_week(season: int, season_length: int, today: Optional[date] = None) -> int:
+    """
+    Fantasy week in progress (or just finished) on `today`. Week 1 kicks off
+    the Thursday after Labor Day and each week runs Tuesday to Monday.
+    """
+    today = today or date.today()
+    september_first = date(season, 9, 1)
+    labor_day = september_first + timedelta(days=(7 - september_first.weekday()) % 7)
+    week_one_tuesday = labor_day + timedelta(days=1)
+    week = 1 + (today - week_one_tuesday).days // 7
+    return min(max(week, 1), season_length)
+
+
+class SeasonMetaCache:
+    """
+    JSON file of SeasonMeta keyed by "<league_id>/<season>". Rewritten
+    atomically on every change; a corrupt or missing file is an empty cache.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Optional[dict[str, SeasonMeta]] = None
+
+    @staticmethod
+    def _key(league_id: str, season: int) -> str:
+        return f"{league_id}/{season}"
+
+    def _load(self) -> dict[str, SeasonMeta]:
+        if self._entries is None:
+            try:
+                raw = json.loads(self.path.read_text(encoding="utf-8"))
+                # Fields a cache file written by an older version may still carry are dropped
+                known = {f.name for f in fields(SeasonMeta)}
+                self._entries = {k: SeasonMeta(**{n: x for n, x in v.items() if n in known}) for k, v in raw.items()}
+            except (OSError, ValueError, TypeError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_open(self.path, "w", encoding="utf-8") as f:
+            json.dump({k: asdict(v) for k, v in sorted(self._load().items())}, f, indent=2)
+
+    def get(self, league_id: str, season: int) -> Optional[SeasonMeta]:
+        with self._lock:
+            return self._load().get(self._key(league_id, season))
+
+    def put(self, meta: SeasonMeta) -> None:
+        with self._lock:
+            self._load()[self._key(meta.league_id, meta.season)] = meta
+            self._save()
+
+
+SEASON_META = SeasonMetaCache(SEASON_META_PATH)
+
+
+OWNERS_MARKERS = ("team-",)
+WEEK_NAV_MARKERS = ("teamMatchupBoxScore", "ww ww-")
+
+
+def owners_url(league_id: str, season: int) -> str:
+    return f"{BASE_URL}/league/{league_id}/history/{season}/owners"
+
+
+def meta_from_pages(*, league_id: str, season: int, owners_page: RawPage, week_page: RawPage) -> SeasonMeta:
+    """
+    Build SeasonMeta from the owners page and a week's gamecenter page, which
+    carries the week selector (season length).
+    """
+    owners_soup = parse_html(owners_page.content, encoding=owners_page.encoding, page_type="owners")
+    soup = parse_html(week_page.content, encoding=week_page.encoding, page_type="week_nav")
+    # count week selector <li class="ww ww-x">
+    weeks = soup.find_all("li", class_=re.compile(r"\bww\b.*\bww-\d+\b"))
+
+    return SeasonMeta(
+        league_id=league_id,
+        season=season,
+        number_of_owners=count_owners(owners_soup),
+        season_length=len(weeks),
+        discovered_at=time.time(),
+    )
+
+
+def discover_season(*, league_id: str, season: int, cookie_string: str) -> SeasonMeta:
+    """Two requests: the owners page and team 1's week-1 gamecenter page."""
+    week_url = gamecenter_url(league_id=league_id, season=season, team_id=1, week=1)
+    return meta_from_pages(
+        league_id=league_id,
+        season=season,
+        owners_page=fetch_page(owners_url(league_id, season), cookie_string, must_contain=OWNERS_MARKERS),
+        week_page=fetch_page(week_url, cookie_string, must_contain=WEEK_NAV_MARKERS),
+    )
+
+
+def cached_season_meta(league_id: str, season: int, *, cache: SeasonMetaCache = SEASON_META) -> Optional[SeasonMeta]:
+    """The cached entry if it can be used without rediscovery."""
+    meta = cache.get(league_id, season)
+    return meta if meta is not None and meta.is_fresh() else None
+
+
+def store_discovered(meta: SeasonMeta, *, cache: SeasonMetaCache = SEASON_META) -> SeasonMeta:
+    """Save a rediscovered meta."""
+    cache.put(meta)
+    return meta
+
+
+def get_season_meta(
+    *,
+    league_id: str,
+    season: int,
+    cookie_string: str,
+    cache: SeasonMetaCache = SEASON_META,
+) -> SeasonMeta:
+    """Cached SeasonMeta if immutable or within the TTL, else rediscover."""
+    meta = cached_season_meta(league_id, season, cache=cache)
+    if meta is not None:
+        return meta
+    return store_discovered(
+        discover_season(league_id=league_id, season=season, cookie_string=cookie_string),
+        cache=cache,
+    )
+
+
+def update_from_weeks(meta: SeasonMeta, week_csvs: list[Path], *, cache: SeasonMetaCache = SEASON_META) -> SeasonMeta:
+    """
+    Fold the written week CSVs into meta: whether the season is finished
+    (every week on disk and the season is over).
+    """
+    present = [p for p in week_csvs if p.exists()]
+    if len(present) == meta.season_length and meta.season < current_season():
+        meta.immutable = True
+    cache.put(meta)
+    return meta
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import Callable
+
+from bs4 import BeautifulSoup
+
+from src.config import BASE_URL
+from src.models import TeamSeasonRow
+from src.page_parser import parse_html
+from src.utils.owners import apply_owners
+from src.utils.playoffs import apply_playoffs
+from src.utils.regular_standings import parse_regular_standings
+
+
+def standings_urls(league_id: str, season: int) -> dict[str, str]:
+    """Source page URL for each standings_rows argument."""
+    history = f"{BASE_URL}/league/{league_id}/history/{season}"
+    return {
+        "regular": f"{history}/standings?historyStandingsType=regular",
+        "playoffs": f"{history}/standings?historyStandingsType=final",
+        "owners": f"{history}/owners",
+    }
+
+
+def standings_rows(
+    *,
+    regular: tuple[bytes, str | None],
+    playoffs: tuple[bytes, str | None],
+    owners: tuple[bytes, str | None],
+    parse: Callable[..., BeautifulSoup] = parse_html,
+) -> dict[str, TeamSeasonRow]:
+    """
+    Standings rows from the (content, encoding) of a season's three source
+    pages. parse is parse_html or a stand-in with its signature.
+    """
+    # --- Regular standings ---
+    rows_by_team = parse_regular_standings(parse(regular[0], encoding=regular[1], page_type="standings"))
+
+    # --- Playoffs ---
+    apply_playoffs(parse(playoffs[0], encoding=playoffs[1], page_type="playoffs"), rows_by_team)
+
+    # --- Owners ---
+    apply_owners(parse(owners[0], encoding=owners[1], page_type="owners"), rows_by_team)
+
+    return rows_by_team
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    # Callers that arrived while the same URL was already being fetched
+    coalesced: int = 0
+    evictions: int = 0
+
+
+class SingleFlightCache(Generic[T]):
+    """
+    URL -> value LRU where concurrent callers for the same URL share one
+    in-flight fetch. Failures are not cached: every waiter of a failed fetch
+    sees the exception and the next caller tries again.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, T] = OrderedDict()
+        self._in_flight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def _claim(self, url: str) -> tuple[bool, Future]:
+        """
+        (owner, future). The owner must fetch and settle the future; everyone
+        else waits on it. A cached URL comes back already resolved.
+        """
+        with self._lock:
+            if url in self._entries:
+                self._entries.move_to_end(url)
+                self.stats.hits += 1
+                done: Future = Future()
+                done.set_result(self._entries[url])
+                return False, done
+            pending = self._in_flight.get(url)
+            if pending is not None:
+                self.stats.coalesced += 1
+                return False, pending
+            self.stats.misses += 1
+            pending = Future()
+            self._in_flight[url] = pending
+            return True, pending
+
+    def _failed(self, url: str, pending: Future, error: BaseException) -> None:
+        with self._lock:
+            del self._in_flight[url]
+        pending.set_exception(error)
+
+    def _fetched(self, url: str, pending: Future, value: T) -> None:
+        with self._lock:
+            del self._in_flight[url]
+            self._entries[url] = value
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+        pending.set_result(value)
+
+    def get_or_fetch(self, url: str, fetch: Callable[[], T]) -> T:
+        owner, pending = self._claim(url)
+        if not owner:
+            return pending.result()
+        try:
+            value = fetch()
+        except BaseException as e:
+            self._failed(url, pending, e)
+            raise
+        self._fetched(url, pending, value)
+        return value
+
+    async def get_or_fetch_async(self, url: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        """get_or_fetch for coroutines; shares entries and in-flight fetches with threaded callers."""
+        owner, pending = self._claim(url)
+        if not owner:
+            return await asyncio.wrap_future(pending)
+        try:
+            value = await fetch()
+        except BaseException as e:
+            self._failed(url, pending, e)
+            raise
+        self._fetched(url, pending, value)
+        return value
+
+    def invalidate(self, url: str) -> None:
+        with self._lock:
+            self._entries.pop(url, None)
+
+    def describe(self) -> str:
+        s = self.stats
+        return (
+            f"URL cache: hits={s.hits} coalesced={s.coalesced} misses={s.misses} "
+            f"evictions={s.evictions} entries={len(self._entries)}/{self.max_entries}"
+        )
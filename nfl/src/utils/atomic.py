@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator
+
+
+@contextmanager
+def atomic_open(path: Path, mode: str = "w", **kwargs) -> Iterator[IO]:
+    """
+    Write to a hidden temp file next to path and rename it into place on
+    success, so a crash never leaves a half-written file under the real name.
+    """
+    tmp = path.with_name(f".{path.name}.tmp")
+    try:
+        with tmp.open(mode, **kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
@@ -1,7 +1,8 @@
 import re
-from bs4 import BeautifulSoup as BS
-from src.utils.parse_gamecenter import parse_owner, parse_opponent_owner, parse_opponent_total, parse_rank, parse_team_name, parse_team_total, parse_team_projected_total
-from src.utils.getterGamecenter import get_roster_names, get_roster_points
+from src.utils.parse_gamecenter import GamecenterPage
+
+# Week CSV row/header layout, stamped with every week CSV
+PARSER_VERSION = 1
 
 _NUM = re.compile(r"[-+]?\d*\.?\d+")
 
@@ -27,19 +28,19 @@ def _pad_to(items: list[str], target_len: int, fill: str = "-") -> list[str]:
     return items[:target_len]
 
 
-def build_row(soup: BS, starter_slots: list[str], longest_bench_len: int) -> list[str]:
-    owner = parse_owner(soup)
-    rank = parse_rank(soup)
+def build_row(page: GamecenterPage, starter_slots: list[str], longest_bench_len: int) -> list[str]:
+    owner = page.owner
+    rank = page.rank
 
     expected_starters = len(starter_slots)
     expected_roster_len = expected_starters + longest_bench_len
 
-    roster = get_roster_names(soup, longest_bench_len)
+    roster = page.roster(longest_bench_len)
 
     # ✅ Critical: ensure roster matches header expectation (starters + bench)
     roster = _pad_to(roster, expected_roster_len)
 
-    points = get_roster_points(soup)
+    points = list(page.points)
     # ✅ Also pad points so we always have one per roster slot
     points = _pad_to(points, expected_roster_len)
     
@@ -54,11 +55,11 @@ def build_row(soup: BS, starter_slots: list[str], longest_bench_len: int) -> lis
         roster_and_points.append(name)
         roster_and_points.append(points[idx] if idx < len(points) else "-")
 
-    total = parse_team_total(soup)
-    projected = parse_team_projected_total(soup)
-    opp_owner = parse_opponent_owner(soup)
-    opp_total = parse_opponent_total(soup)
-    team_name = parse_team_name(soup)
+    total = page.total
+    projected = page.projected
+    opp_owner = page.opponent
+    opp_total = page.opponent_total
+    team_name = page.team_name
 
 
     result = compute_result(total, opp_total, opp_owner)
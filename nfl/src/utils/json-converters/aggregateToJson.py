@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import argparse
 import csv
-import json
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional, Sequence
+
+from json_stream import add_output_arguments, stream_json_object
 
 
 def parse_int(s: str) -> int:
@@ -26,7 +28,11 @@ def parse_float(s: str) -> float:
         return 0.0
 
 
-def main() -> None:
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="aggregated_standings_data.csv -> JSON by manager.")
+    add_output_arguments(parser)
+    args = parser.parse_args(argv)
+
     in_path = Path("output") / "aggregated_standings_data.csv"
     out_path = Path("output") / "aggregated_standings_data.json"
 
@@ -65,7 +71,10 @@ def main() -> None:
                 "ToiletBowls": parse_int(row.get("Toilet Bowl", "")),
             }
 
-    out_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    # One entry per manager: small, but written the same way as the other converters
+    with stream_json_object(out_path, indent=None if args.compact else 2, serializer=args.serializer) as out:
+        for manager, entry in data.items():
+            out.write((manager,), entry)
     print(f"Wrote {len(data)} managers -> {out_path}")
 
 
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import argparse
 import csv
-import json
 from collections import defaultdict
 from pathlib import Path
-from typing import Any, Sequence
+from typing import Optional, Sequence
+
+from json_stream import add_output_arguments, stream_json_object
 
 
 def pick_col(fieldnames: Sequence[str], candidates: Sequence[str]) -> str:
@@ -37,7 +39,11 @@ def to_int_season(value: str) -> int | None:
         return None
 
 
-def main() -> None:
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="all_seasons_standings.csv -> JSON by manager.")
+    add_output_arguments(parser)
+    args = parser.parse_args(argv)
+
     # Input / output paths
     in_path = Path("output") / "all_seasons_standings.csv"
     out_path = Path("output") / "all_seasons_standings_by_manager.json"
@@ -45,7 +51,9 @@ def main() -> None:
     if not in_path.exists():
         raise FileNotFoundError(f"Input CSV not found: {in_path.resolve()}")
 
-    with in_path.open("r", newline="", encoding="utf-8") as f:
+    with in_path.open("r", newline="", encoding="utf-8") as f, stream_json_object(
+        out_path, indent=None if args.compact else 2, serializer=args.serializer
+    ) as out:
         reader = csv.DictReader(f)
         if reader.fieldnames is None:
             raise RuntimeError("CSV has no header row.")
@@ -80,8 +88,7 @@ def main() -> None:
                     if prev is None or season > prev[0]:
                         latest_team[manager] = (season, team)
 
-        # Build final JSON object keyed by managerName
-        result: dict[str, Any] = {}
+        # Write the final JSON object keyed by managerName
         for manager in sorted(set(name_history.keys()) | set(active_seasons.keys()) | set(latest_team.keys())):
             seasons_sorted = sorted(active_seasons.get(manager, set()))
             history_sorted = sorted(name_history.get(manager, set()))
@@ -89,14 +96,16 @@ def main() -> None:
             # teamName: most recent season's team name if available; else "-"
             team_name = latest_team.get(manager, (None, "-"))[1]
 
-            result[manager] = {
-                "managerName": manager,
-                "teamName": team_name,
-                "nameHistory": history_sorted,     # exact unique names
-                "activeSeasons": seasons_sorted,   # ints, sorted
-            }
+            out.write(
+                (manager,),
+                {
+                    "managerName": manager,
+                    "teamName": team_name,
+                    "nameHistory": history_sorted,     # exact unique names
+                    "activeSeasons": seasons_sorted,   # ints, sorted
+                },
+            )
 
-    out_path.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
     print(f"Wrote: {out_path}")
 
 
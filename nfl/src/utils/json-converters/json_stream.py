@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, Mapping, Optional, Sequence, TextIO
+
+try:
+    import orjson
+except ImportError:  # optional: pip install .[fast]
+    orjson = None
+
+# value, indent (None = compact) -> JSON text
+Serializer = Callable[[Any, Optional[int]], str]
+
+
+def _json_dumps(value: Any, indent: Optional[int]) -> str:
+    if indent is None:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return json.dumps(value, indent=indent, ensure_ascii=False)
+
+
+def _orjson_dumps(value: Any, indent: Optional[int]) -> str:
+    if indent is None:
+        return orjson.dumps(value).decode("utf-8")
+    if indent == 2:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode("utf-8")
+    # orjson only indents by 2
+    return _json_dumps(value, indent)
+
+
+SERIALIZERS: dict[str, Serializer] = {"json": _json_dumps}
+if orjson is not None:
+    SERIALIZERS["orjson"] = _orjson_dumps
+
+
+def serializer_name(name: Optional[str] = None) -> str:
+    """name, else JSON_SERIALIZER from the environment, else the fastest one installed."""
+    name = name or os.environ.get("JSON_SERIALIZER") or ("orjson" if "orjson" in SERIALIZERS else "json")
+    if name not in SERIALIZERS:
+        raise ValueError(f"Unknown or uninstalled JSON serializer {name!r}; available: {sorted(SERIALIZERS)}")
+    return name
+
+
+def get_serializer(name: Optional[str] = None) -> Serializer:
+    """
+    A serializer by name (see serializer_name). Output is the same as
+    json's except that orjson writes NaN/Infinity as null.
+    """
+    return SERIALIZERS[serializer_name(name)]
+
+
+class ObjectStreamWriter:
+    """
+    Writes one JSON object of nested objects `depth` levels deep, a leaf at
+    a time, without holding the whole thing in memory:
+
+        writer.write(("2017", "11"), week)  # -> {"2017": {"11": week, ...}, ...}
+
+    Leaves must arrive grouped by their parent keys (every week of a season
+    together); the text is then exactly what json.dumps(nested_dict,
+    indent=indent, ensure_ascii=False) gives, or the compact form with
+    indent=None. Reopening an object that was already closed is an error.
+    """
+
+    def __init__(
+        self, f: TextIO, *, depth: int = 1, indent: Optional[int] = 2, serializer: Optional[str] = None
+    ) -> None:
+        self._f = f
+        self._depth = depth
+        self._indent = indent
+        self._dumps = get_serializer(serializer)
+        self._colon = ":" if indent is None else ": "
+        # Keys of the open objects below the top one, and items written in each open object (top first)
+        self._path: list[str] = []
+        self._counts: list[int] = [0]
+        self._closed: set[tuple[str, ...]] = set()
+        self._leaf_keys: set[str] = set()
+        self._f.write("{")
+
+    def _newline(self, level: int) -> str:
+        return "" if self._indent is None else "\n" + " " * (self._indent * level)
+
+    def _start_item(self, level: int, key: str) -> None:
+        separator = "," if self._counts[level] else ""
+        self._f.write(separator + self._newline(level + 1) + json.dumps(key, ensure_ascii=False) + self._colon)
+        self._counts[level] += 1
+
+    def _close_innermost(self) -> None:
+        level = len(self._path)
+        self._f.write((self._newline(level) if self._counts[level] else "") + "}")
+        self._closed.add(tuple(self._path))
+        self._path.pop()
+        self._counts.pop()
+        self._leaf_keys = set()
+
+    def write(self, keys: Sequence[str], value: Any) -> None:
+        if len(keys) != self._depth:
+            raise ValueError(f"Expected {self._depth} keys, got {keys!r}")
+        parents = list(keys[:-1])
+
+        common = 0
+        while common < len(self._path) and self._path[common] == parents[common]:
+            common += 1
+        while len(self._path) > common:
+            self._close_innermost()
+
+        for level in range(common, len(parents)):
+            if tuple(parents[: level + 1]) in self._closed:
+                raise ValueError(f"{parents[: level + 1]} was already written: input is not grouped by these keys")
+            self._start_item(level, parents[level])
+            self._f.write("{")
+            self._path.append(parents[level])
+            self._counts.append(0)
+            self._leaf_keys = set()
+
+        leaf = keys[-1]
+        if leaf in self._leaf_keys:
+            raise ValueError(f"{list(keys)} was already written: input is not grouped by these keys")
+        self._leaf_keys.add(leaf)
+
+        level = len(self._path)
+        text = self._dumps(value, self._indent)
+        if self._indent is not None:
+            text = text.replace("\n", self._newline(level + 1))
+        self._start_item(level, leaf)
+        self._f.write(text)
+
+    def close(self) -> None:
+        while self._path:
+            self._close_innermost()
+        self._f.write((self._newline(0) if self._counts[0] else "") + "}")
+
+
+@contextmanager
+def stream_json_object(
+    path: Path, *, depth: int = 1, indent: Optional[int] = 2, serializer: Optional[str] = None
+) -> Iterator[ObjectStreamWriter]:
+    """ObjectStreamWriter into path, renamed into place only once complete."""
+    tmp = path.with_name(f".{path.name}.tmp")
+    try:
+        with tmp.open("w", encoding="utf-8") as f:
+            writer = ObjectStreamWriter(f, depth=depth, indent=indent, serializer=serializer)
+            yield writer
+            writer.close()
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+# Bump when the shard files or index.json change shape: every shard is rewritten
+SHARD_FORMAT_VERSION = 1
+
+_SHARD_KEY_PART = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+def update_row_digest(digest: Any, row: Mapping[Any, Any]) -> None:
+    """Feed one CSV row (DictReader dict) into a shard's source digest."""
+    # repr of the tuple is unambiguous (quoted, escaped) and done in C
+    digest.update(repr(tuple(row.values())).encode("utf-8"))
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+class ShardWriter:
+    """
+    One JSON file per shard (e.g. per season, or per season/week) under
+    root, each with a precompressed .json.gz next to it, plus root/index.json:
+
+        {"format": {...}, "shards": {"2017/11": {"path": "2017/11.json", "sha256": ...,
+                                                 "bytes": ..., "gzip_bytes": ..., "source": ...}}}
+
+    sha256 is the plain file's content hash (for cache busting); source is
+    the digest of the CSV rows the shard was built from. A shard whose
+    source digest and format are unchanged is left as it is on disk. Shards
+    that are no longer produced, in any earlier format, are deleted when
+    the writer closes.
+    """
+
+    def __init__(self, root: Path, *, indent: Optional[int] = 2, serializer: Optional[str] = None) -> None:
+        self.root = root
+        self._indent = indent
+        name = serializer_name(serializer)
+        self._dumps = SERIALIZERS[name]
+        self._format = {"version": SHARD_FORMAT_VERSION, "indent": indent, "serializer": name}
+        self._index_path = root / "index.json"
+        try:
+            previous = json.loads(self._index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            previous = {}
+        # Everything the last run left on disk (for removing stale shards), and
+        # the part of it that can be reused: only shards written in this format
+        self._on_disk: dict[str, dict[str, Any]] = previous.get("shards", {})
+        self._previous = self._on_disk if previous.get("format") == self._format else {}
+        self._shards: dict[str, dict[str, Any]] = {}
+        self.written = 0
+        self.unchanged = 0
+
+    def put(self, keys: Sequence[str], value: Any, source_digest: str) -> None:
+        for part in keys:
+            if not _SHARD_KEY_PART.match(part):
+                raise ValueError(f"Shard key {list(keys)} can't be used in a file name")
+        key = "/".join(keys)
+        if key in self._shards:
+            raise ValueError(f"Shard {key} was already written: input is not grouped by these keys")
+
+        path = self.root / f"{key}.json"
+        previous = self._previous.get(key)
+        if (
+            previous is not None
+            and previous.get("source") == source_digest
+            and path.exists()
+            and path.with_name(path.name + ".gz").exists()
+        ):
+            self._shards[key] = previous
+            self.unchanged += 1
+            return
+
+        data = self._dumps(value, self._indent).encode("utf-8")
+        # mtime=0: the same shard always compresses to the same bytes
+        compressed = gzip.compress(data, compresslevel=9, mtime=0)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(path, data)
+        _write_atomic(path.with_name(path.name + ".gz"), compressed)
+        self._shards[key] = {
+            "path": f"{key}.json",
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "bytes": len(data),
+            "gzip_bytes": len(compressed),
+            "source": source_digest,
+        }
+        self.written += 1
+
+    def close(self) -> None:
+        for key, entry in self._on_disk.items():
+            if key not in self._shards:
+                stale = self.root / entry["path"]
+                stale.unlink(missing_ok=True)
+                stale.with_name(stale.name + ".gz").unlink(missing_ok=True)
+                # e.g. a season's directory once its week shards are gone
+                if stale.parent != self.root and stale.parent.is_dir() and not any(stale.parent.iterdir()):
+                    stale.parent.rmdir()
+        self.root.mkdir(parents=True, exist_ok=True)
+        index = {"format": self._format, "shards": self._shards}
+        _write_atomic(self._index_path, (json.dumps(index, indent=self._indent) + "\n").encode("utf-8"))
+
+    def describe(self) -> str:
+        return f"{self.written} shard(s) written, {self.unchanged} unchanged -> {self._index_path}"
+
+
+def add_output_arguments(parser) -> None:
+    """--compact / --serializer, shared by the converters."""
+    parser.add_argument("--compact", action="store_true", help="No indentation or spaces (smaller file).")
+    parser.add_argument(
+        "--serializer",
+        choices=sorted(SERIALIZERS),
+        help="JSON library for the values (default: JSON_SERIALIZER, else the fastest installed).",
+    )
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import argparse
 import csv
-import json
+import hashlib
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, Optional, Sequence
+
+from json_stream import ShardWriter, add_output_arguments, stream_json_object, update_row_digest
 
 
 def parse_int(value: str | None) -> int:
@@ -26,15 +29,67 @@ def parse_float(value: str | None) -> float:
         return 0.0
 
 
-def main() -> None:
+def iter_seasons(reader: csv.DictReader) -> Iterator[tuple[str, dict[str, Any], Any]]:
+    """
+    (season, {team: standings}, digest of the season's rows) per season.
+    Seasons come one after another (combineStandings), so only the current
+    one is held.
+    """
+    season_key: Optional[str] = None
+    teams: dict[str, Any] = {}
+    digest = hashlib.sha256()
+
+    for row in reader:
+        season = (row.get("Season") or "").strip()
+        team = (row.get("TeamName") or "").strip()
+
+        if not season or not team:
+            continue
+
+        if season != season_key:
+            if season_key is not None:
+                yield season_key, teams, digest
+            season_key, teams, digest = season, {}, hashlib.sha256()
+
+        update_row_digest(digest, row)
+
+        # Build clean typed object
+        teams[team] = {
+            "TeamName": team,
+            "ManagerName": (row.get("ManagerName") or "").strip(),
+            "Wins": parse_int(row.get("Wins")),
+            "Losses": parse_int(row.get("Losses")),
+            "Ties": parse_int(row.get("Ties")),
+            "PointsFor": parse_float(row.get("PointsFor")),
+            "PointsAgainst": parse_float(row.get("PointsAgainst")),
+            "RegularSeasonRank": parse_int(row.get("RegularSeasonRank")),
+            "PlayoffRank": parse_int(row.get("PlayoffRank")),
+            "Moves": parse_int(row.get("Moves")),
+            "Trades": parse_int(row.get("Trades")),
+        }
+
+    if season_key is not None:
+        yield season_key, teams, digest
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="all_seasons_standings.csv -> JSON by season and team.")
+    add_output_arguments(parser)
+    parser.add_argument(
+        "--shard-by",
+        choices=("season",),
+        help="Instead of one file, write a .json and .json.gz per season plus index.json under "
+        "output/all_seasons_standings_by_season_team/; unchanged shards are skipped.",
+    )
+    args = parser.parse_args(argv)
+    indent = None if args.compact else 2
+
     in_path = Path("output") / "all_seasons_standings.csv"
     out_path = Path("output") / "all_seasons_standings_by_season_team.json"
 
     if not in_path.exists():
         raise FileNotFoundError(f"Input file not found: {in_path.resolve()}")
 
-    result: dict[str, dict[str, Any]] = {}
-
     with in_path.open("r", newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
 
@@ -46,33 +101,18 @@ def main() -> None:
         if missing:
             raise RuntimeError(f"Missing required columns: {missing}")
 
-        for row in reader:
-            season = (row.get("Season") or "").strip()
-            team = (row.get("TeamName") or "").strip()
-
-            if not season or not team:
-                continue
-
-            if season not in result:
-                result[season] = {}
-
-            # Build clean typed object
-            result[season][team] = {
-                "TeamName": team,
-                "ManagerName": (row.get("ManagerName") or "").strip(),
-                "Wins": parse_int(row.get("Wins")),
-                "Losses": parse_int(row.get("Losses")),
-                "Ties": parse_int(row.get("Ties")),
-                "PointsFor": parse_float(row.get("PointsFor")),
-                "PointsAgainst": parse_float(row.get("PointsAgainst")),
-                "RegularSeasonRank": parse_int(row.get("RegularSeasonRank")),
-                "PlayoffRank": parse_int(row.get("PlayoffRank")),
-                "Moves": parse_int(row.get("Moves")),
-                "Trades": parse_int(row.get("Trades")),
-            }
-
-    out_path.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
-    print(f"Wrote JSON to {out_path}")
+        if args.shard_by is None:
+            with stream_json_object(out_path, indent=indent, serializer=args.serializer) as out:
+                for season, teams, _ in iter_seasons(reader):
+                    out.write((season,), teams)
+            print(f"Wrote JSON to {out_path}")
+            return
+
+        shards = ShardWriter(out_path.with_suffix(""), indent=indent, serializer=args.serializer)
+        for season, teams, digest in iter_seasons(reader):
+            shards.put((season,), teams, digest.hexdigest())
+        shards.close()
+        print(shards.describe())
 
 
 if __name__ == "__main__":
@@ -1,57 +1,111 @@
 from __future__ import annotations
 
+import argparse
 import csv
-import json
+import hashlib
+import itertools
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, Optional, Sequence
 
+from json_stream import ShardWriter, add_output_arguments, stream_json_object, update_row_digest
+
+
+def iter_weeks(reader: csv.DictReader, owner_col: str) -> Iterator[tuple[str, str, dict[str, Any], Any]]:
+    """
+    (season, week, {owner: row}, digest of the week's rows) per week.
+    combineWeeks writes each week's rows together, so a week is complete as
+    soon as the next one starts and only one is held in memory.
+    """
+    current: Optional[tuple[str, str]] = None
+    week_bucket: dict[str, Any] = {}
+    digest = hashlib.sha256()
+
+    for row in reader:
+        season = (row.get("Season") or "").strip()
+        week = (row.get("Week") or "").strip()
+        owner = (row.get(owner_col) or "").strip()
+
+        if not season or not week or not owner:
+            continue
+
+        if (season, week) != current:
+            if current is not None:
+                yield (*current, week_bucket, digest)
+            current, week_bucket, digest = (season, week), {}, hashlib.sha256()
+
+        update_row_digest(digest, row)
+
+        # Keep full row (including Season/Week/Owner)
+        payload = dict(row)
+
+        existing = week_bucket.get(owner)
+
+        if existing is None:
+            week_bucket[owner] = payload
+        else:
+            # If duplicates exist, convert to list
+            if isinstance(existing, list):
+                existing.append(payload)
+            else:
+                week_bucket[owner] = [existing, payload]
+
+    if current is not None:
+        yield (*current, week_bucket, digest)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="all_seasons_combined.csv -> JSON by season, week and owner.")
+    add_output_arguments(parser)
+    parser.add_argument(
+        "--shard-by",
+        choices=("season", "week"),
+        help="Instead of one file, write a .json and .json.gz per season (or week) plus index.json "
+        "under output/all_seasons_combined_by_season_week_owner/; unchanged shards are skipped.",
+    )
+    args = parser.parse_args(argv)
+    indent = None if args.compact else 2
 
-def main() -> None:
     in_path = Path("output") / "all_seasons_combined.csv"
     out_path = Path("output") / "all_seasons_combined_by_season_week_owner.json"
 
     if not in_path.exists():
         raise FileNotFoundError(f"Input file not found: {in_path.resolve()}")
 
-    result: dict[str, dict[str, dict[str, Any]]] = {}
-
     with in_path.open("r", newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         if reader.fieldnames is None:
             raise RuntimeError("CSV has no header row.")
 
-        required = {"Season", "Week", "Owner"}
+        # Week CSVs name the manager column ManagerName; older ones used Owner
+        owner_col = "Owner" if "Owner" in reader.fieldnames else "ManagerName"
+        required = {"Season", "Week", owner_col}
         missing = required - set(reader.fieldnames)
         if missing:
             raise RuntimeError(f"Missing required columns: {sorted(missing)}")
 
-        for row in reader:
-            season = (row.get("Season") or "").strip()
-            week = (row.get("Week") or "").strip()
-            owner = (row.get("Owner") or "").strip()
-
-            if not season or not week or not owner:
-                continue
-
-            # Keep full row (including Season/Week/Owner)
-            payload = dict(row)
-
-            season_bucket = result.setdefault(season, {})
-            week_bucket = season_bucket.setdefault(week, {})
-
-            existing = week_bucket.get(owner)
-
-            if existing is None:
-                week_bucket[owner] = payload
-            else:
-                # If duplicates exist, convert to list
-                if isinstance(existing, list):
-                    existing.append(payload)
-                else:
-                    week_bucket[owner] = [existing, payload]
-
-    out_path.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
-    print(f"Wrote JSON to {out_path}")
+        weeks = iter_weeks(reader, owner_col)
+
+        if args.shard_by is None:
+            with stream_json_object(out_path, depth=2, indent=indent, serializer=args.serializer) as out:
+                for season, week, week_bucket, _ in weeks:
+                    out.write((season, week), week_bucket)
+            print(f"Wrote JSON to {out_path}")
+            return
+
+        shards = ShardWriter(out_path.with_suffix(""), indent=indent, serializer=args.serializer)
+        if args.shard_by == "week":
+            for season, week, week_bucket, digest in weeks:
+                shards.put((season, week), week_bucket, digest.hexdigest())
+        else:
+            for season, season_weeks in itertools.groupby(weeks, key=lambda w: w[0]):
+                season_bucket: dict[str, Any] = {}
+                season_digest = hashlib.sha256()
+                for _, week, week_bucket, digest in season_weeks:
+                    season_bucket[week] = week_bucket
+                    season_digest.update(digest.digest())
+                shards.put((season,), season_bucket, season_digest.hexdigest())
+        shards.close()
+        print(shards.describe())
 
 
 if __name__ == "__main__":
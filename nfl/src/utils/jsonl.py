@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Iterator
+
+
+def read_jsonl(path: Path) -> Iterator[dict]:
+    """
+    Every JSON object in an append-only log, in order. Lines that don't
+    parse (the torn last line of a crash mid-append) are skipped.
+    """
+    if not path.exists():
+        return
+    with path.open("r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(entry, dict):
+                yield entry
+
+
+def _ends_mid_line(path: Path) -> bool:
+    try:
+        with path.open("rb") as f:
+            f.seek(-1, 2)
+            return f.read(1) != b"\n"
+    except OSError:  # missing or empty
+        return False
+
+
+class JsonlAppender:
+    """
+    Appends one JSON object per line to path. If the file ends mid-line
+    (a crash mid-append), that line is ended before the first new entry, so
+    it doesn't swallow the entry too. Not thread-safe: callers lock.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._tail_checked = False
+
+    def append(self, entry: dict) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        prefix = ""
+        if not self._tail_checked:
+            prefix = "\n" if _ends_mid_line(self.path) else ""
+            self._tail_checked = True
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(prefix + json.dumps(entry) + "\n")
+            f.flush()
+
@@ -7,6 +7,8 @@ from bs4 import BeautifulSoup, Tag
 
 from src.models import TeamSeasonRow
 
+PARSER_VERSION = 1  # bump when apply_owners results change
+
 
 _TEAM_ID_PATTERNS: list[Pattern[str]] = [
     re.compile(r"/team/(\d+)\b"),
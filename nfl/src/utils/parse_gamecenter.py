@@ -1,191 +1,271 @@
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 import re
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
-_TEAM_WRAP_1 = re.compile(r"\bteamWrap\b.*\bteamWrap-1\b")
+# Bump when this module's output changes; src/reparse.py rebuilds every CSV
+# stamped with an older version from the archived HTML
+PARSER_VERSION = 2
 
-@dataclass(frozen=True)
-class PlayerRow:
-    slot: str
-    name: str
-    points: str
-    
-_BLOCKY = re.compile(r"\bteamWrap\b.*\bteamWrap-2\b")
-_USERNAME = re.compile(r"\buserName\b")
-
-def parse_owner(soup: BeautifulSoup) -> str:
-    owner_span = soup.find("span", class_=re.compile(r"userName\s+userId"))
-    return owner_span.get_text(strip=True) if owner_span else "-"
-
-def parse_team_total(soup: BeautifulSoup) -> str:
-    totals = soup.find_all("div", class_=re.compile(r"teamTotal\s+teamId-"))
-    return totals[0].get_text(strip=True) if totals else "-"
-
-def parse_players(soup: BeautifulSoup) -> list[PlayerRow]:
-    matchup = soup.find("div", id="teamMatchupBoxScore")
-    if not matchup:
-        return []
-
-    team_wrap_1 = matchup.find("div", class_=re.compile(r"\bteamWrap\b.*\bteamWrap-1\b"))
-    if not team_wrap_1:
-        return []
-
-    rows: list[PlayerRow] = []
-    for tr in team_wrap_1.find_all("tr", class_=re.compile(r"player-")):
-        # slot label (usually a <span> at start of row)
-        slot_span = tr.find("span")
-        slot = slot_span.get_text(strip=True) if slot_span else ""
-
-        name_td = tr.find("td", class_="playerNameAndInfo")
-        name = name_td.get_text(" ", strip=True) if name_td else "-"
-
-        points_td = tr.find("td", class_=re.compile(r"\bstatTotal\b"))
-        points = points_td.get_text(strip=True) if points_td else "-"
-
-        if slot or name != "-":
-            rows.append(PlayerRow(slot=slot, name=name, points=points))
-
-    return rows
+_TEAM_ID = re.compile(r"\bteamId-(\d+)\b")
 
-def parse_bench_len(soup: BeautifulSoup) -> int:
-    bench_wrap = soup.find("div", id="tableWrapBN-1")
-    if not bench_wrap:
-        return 0
-    return len(bench_wrap.find_all("td", class_="playerNameAndInfo"))
+# Every teamgamecenter page shows both sides of the matchup:
+# side 1 is the team in the URL (teamWrap-1), side 2 its opponent (teamWrap-2).
+# Each side has two containers: its header (owner, rank, total) above the
+# box score, and its teamWrap inside #teamMatchupBoxScore (roster, points).
 
-def parse_rank(soup: BeautifulSoup) -> str:
-    # rank_text looks like "... (3) ..." -> extract inside parentheses
-    rank_span = soup.find("span", class_=re.compile(r"teamRank\s+teamId-"))
-    rank_text = rank_span.get_text(strip=True) if rank_span else ""
-    m = re.search(r"\((\d+)\)", rank_text)
-    return m.group(1) if m else "-"
 
+# ---------------------------------------------------------------------------
+# Single-pass extraction
+#
+# extract_gamecenter reads everything build_row/scrape_week need in one walk to
+# find each side's containers and one walk per container, and returns compact
+# records (no soup references).
+# ---------------------------------------------------------------------------
 
-def parse_opponent_owner(soup: BeautifulSoup) -> str:
-    matchup = soup.find("div", id="teamMatchupBoxScore")
-    if not matchup:
-        return "-"
+_ANY_TEAM_WRAP = re.compile(r"\bteamWrap\b.*\bteamWrap-(\d+)\b")
+_OWNER_CLASS = re.compile(r"userName\s+userId")
+_RANK_CLASS = re.compile(r"teamRank\s+teamId-")
+_TOTAL_CLASS = re.compile(r"teamTotal\s+teamId-")
+_PLAYER_ROW = re.compile(r"player-")
+_STAT_TOTAL = re.compile(r"\bstatTotal\b")
+_RANK_NUM = re.compile(r"\((\d+)\)")
+_PROJ_NUM = re.compile(r"([\d.]+)")
 
-    teamWrap2 = re.compile(r"\bteamWrap\b.*\bteamWrap-2\b")
-    team_wrap_2 = matchup.find("div", class_=teamWrap2)
-    if not team_wrap_2:
-        return "-"
 
-    # Primary: opponent team name appears in <h4>...</h4>
-    h4 = team_wrap_2.find("h4")
-    if h4:
-        text = h4.get_text(" ", strip=True)
-        return text or "-"
-
-    # Fallback: some pages might show a username element
-    tag = team_wrap_2.select_one(".userName")
-    if tag:
-        text = tag.get_text(" ", strip=True)
-        return text or "-"
-
-    return "-"
-
-def parse_opponent_total(soup: BeautifulSoup) -> str:
-    team_totals = soup.find_all("div", class_=re.compile(r"teamTotal\s+teamId-"))
-    return team_totals[1].get_text(strip=True) if len(team_totals) >= 2 else "-"
-
-
-
-def get_starter_slots(soup: BeautifulSoup) -> list[str]:
+@dataclass(frozen=True)
+class GamecenterPage:
+    """One team's view of a teamgamecenter page (side 1 = URL team, side 2 = opponent)."""
+    side: int
+    team_id: int | None
+    owner: str
+    team_name: str
+    rank: str
+    starter_slots: tuple[str, ...]
+    starters: tuple[str, ...]
+    bench: tuple[str, ...]
+    points: tuple[str, ...]
+    total: str
+    projected: str
+    opponent: str
+    opponent_total: str
+    opponent_id: int | None
+
+    @property
+    def bench_len(self) -> int:
+        return len(self.bench)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GamecenterPage":
+        fields = dict(data)
+        for key in ("starter_slots", "starters", "bench", "points"):
+            fields[key] = tuple(fields[key])
+        return cls(**fields)
+
+    def roster(self, longest_bench_len: int) -> list[str]:
+        """Starters + bench, bench padded with "-" to longest_bench_len."""
+        bench = list(self.bench)
+        bench.extend(["-"] * (longest_bench_len - len(bench)))
+        return list(self.starters) + bench
+
+
+def _class_matches(tag, pattern: re.Pattern[str]) -> bool:
+    # Same rule as bs4's class_=<regex>: any single class, or the whole class string
+    classes = tag.get("class") or []
+    return any(pattern.search(c) for c in classes) or bool(pattern.search(" ".join(classes)))
+
+
+@dataclass
+class _WrapScan:
+    h4: str | None = None
+    user_name: str | None = None
+    projected: str | None = None
+    slots: list[str] | None = None
+    points: list[str] | None = None
+    starters: list[str] | None = None
+    bench: list[str] | None = None
+
+
+def _tags(root):
+    # Plain descendants iteration; much cheaper than find_all's filter machinery
+    return (node for node in root.descendants if isinstance(node, Tag))
+
+
+def _first_span(tr):
+    return next((tag for tag in _tags(tr) if tag.name == "span"), None)
+
+
+def _name_bucket(td, wrap, starters_id: str, bench_id: str) -> str | None:
+    node = td.parent
+    while node is not None and node is not wrap:
+        if node.name == "div":
+            node_id = node.get("id")
+            if node_id == starters_id:
+                return "starters"
+            if node_id == bench_id:
+                return "bench"
+        node = node.parent
+    return None
+
+
+def _scan_wrap(wrap, side: int) -> _WrapScan:
+    scan = _WrapScan(slots=[], points=[])
+    starters_id = f"tableWrap-{side}"
+    bench_id = f"tableWrapBN-{side}"
+    names: dict[str, list[str]] = {}
+
+    for tag in _tags(wrap):
+        name = tag.name
+        classes = tag.get("class") or []
+
+        if name == "h4":
+            if scan.h4 is None:
+                scan.h4 = tag.get_text(" ", strip=True)
+        elif name == "tr":
+            if _class_matches(tag, _PLAYER_ROW):
+                span = _first_span(tag)
+                slot = span.get_text(strip=True) if span else ""
+                if slot and slot != "BN":
+                    scan.slots.append(slot)
+        elif name == "td":
+            if "playerNameAndInfo" in classes:
+                bucket = _name_bucket(tag, wrap, starters_id, bench_id)
+                if bucket:
+                    names.setdefault(bucket, []).append(tag.get_text(" ", strip=True))
+            if _class_matches(tag, _STAT_TOTAL):
+                scan.points.append(tag.get_text(strip=True))
+        elif name == "div":
+            # An empty container still means "this team has 0 bench players"
+            if tag.get("id") == starters_id:
+                names.setdefault("starters", [])
+            elif tag.get("id") == bench_id:
+                names.setdefault("bench", [])
+
+        if scan.projected is None and "teamTotalProjected" in classes:
+            m = _PROJ_NUM.search(tag.get_text(" ", strip=True))
+            scan.projected = m.group(1) if m else "-"
+        if scan.user_name is None and "userName" in classes:
+            scan.user_name = tag.get_text(" ", strip=True)
+
+    scan.starters = names.get("starters")
+    scan.bench = names.get("bench")
+    return scan
+
+
+@dataclass
+class _HeaderScan:
+    owner: Tag | None = None
+    rank: Tag | None = None
+    total: Tag | None = None
+
+
+def _scan_header(wrap) -> _HeaderScan:
+    scan = _HeaderScan()
+    for tag in _tags(wrap):
+        if tag.name == "span":
+            if scan.owner is None and _class_matches(tag, _OWNER_CLASS):
+                scan.owner = tag
+            elif scan.rank is None and _class_matches(tag, _RANK_CLASS):
+                scan.rank = tag
+        elif tag.name == "div" and scan.total is None and _class_matches(tag, _TOTAL_CLASS):
+            scan.total = tag
+    return scan
+
+
+def _wrap_side(tag) -> int | None:
+    m = _ANY_TEAM_WRAP.search(" ".join(tag.get("class") or []))
+    return int(m.group(1)) if m else None
+
+
+def _inside(tag, ancestor) -> bool:
+    return ancestor is not None and any(parent is ancestor for parent in tag.parents)
+
+
+def _team_id_of(tag) -> int | None:
+    if tag is None:
+        return None
+    m = _TEAM_ID.search(" ".join(tag.get("class", [])))
+    return int(m.group(1)) if m else None
+
+
+def _text(tag) -> str:
+    return tag.get_text(strip=True) if tag else "-"
+
+
+def extract_gamecenter(soup: BeautifulSoup) -> list[GamecenterPage]:
     """
-    Pull slot labels (QB/RB/WR/...) from player rows.
-    We'll treat non-BN slots as starters.
+    Records for every team shown on a teamgamecenter page: always side 1,
+    plus side 2 when the page has an opponent (teamWrap-2).
+
+    Every field is read from its own side's containers, never matched by
+    position across the page. Raises RuntimeError if a side shown has no
+    header, or its header has no owner or total.
     """
-    matchup = soup.find("div", id="teamMatchupBoxScore")
-    if not matchup:
-        return []
-
-    team_wrap_1 = matchup.find("div", class_=re.compile(r"\bteamWrap\b.*\bteamWrap-1\b"))
-    if not team_wrap_1:
-        return []
-
-    slots: list[str] = []
-    for tr in team_wrap_1.find_all("tr", class_=re.compile(r"player-")):
-        span = tr.find("span")
-        slot = span.get_text(strip=True) if span else ""
-        if not slot:
+    matchup = None
+    headers: dict[int, object] = {}
+    wraps: dict[int, object] = {}
+    for tag in _tags(soup):
+        if tag.name != "div":
             continue
-        # Stop when we hit bench (or skip bench)
-        if slot == "BN":
+        if matchup is None and tag.get("id") == "teamMatchupBoxScore":
+            matchup = tag
             continue
-        slots.append(slot)
-    return slots
-
-
-def get_roster_names(soup: BeautifulSoup, longest_bench_len: int) -> list[str]:
-    """
-    Roster = starters (tableWrap-1) + bench (tableWrapBN-1), padded to longest_bench_len.
-    """
-    starters_wrap = soup.find("div", id="tableWrap-1")
-    starters = []
-    if starters_wrap:
-        starters = [
-            td.get_text(" ", strip=True)
-            for td in starters_wrap.find_all("td", class_="playerNameAndInfo")
-        ]
-
-    bench_wrap = soup.find("div", id="tableWrapBN-1")
-    bench = []
-    if bench_wrap:
-        bench = [
-            td.get_text(" ", strip=True)
-            for td in bench_wrap.find_all("td", class_="playerNameAndInfo")
-        ]
-
-    while len(bench) < longest_bench_len:
-        bench.append("-")
-
-    return starters + bench
-
-
-def get_roster_points(soup: BeautifulSoup) -> list[str]:
-    """
-    Pull points cells. This is the “old approach” and can misalign in edge cases,
-    but it's enough for the first CSV commit. We'll harden later.
-    """
-    matchup = soup.find("div", id="teamMatchupBoxScore")
-    if not matchup:
-        return []
-
-    team_wrap_1 = matchup.find("div", class_=re.compile(r"\bteamWrap\b.*\bteamWrap-1\b"))
-    if not team_wrap_1:
-        return []
-
-    totals_tds = team_wrap_1.find_all("td", class_=re.compile(r"\bstatTotal\b"))
-    return [td.get_text(strip=True) for td in totals_tds]
-
-def parse_team_projected_total(soup: BeautifulSoup) -> str:
-    matchup = soup.find("div", id="teamMatchupBoxScore")
-    if not matchup:
-        return "-"   
-
-    team_wrap_1 = matchup.find("div", class_=re.compile(r"\bteamWrap\b.*\bteamWrap-1\b"))
-    scope = team_wrap_1 or matchup
-
-    projected_div = scope.find(class_="teamTotalProjected")
-    if not projected_div:
-        return "-"
-
-    text = projected_div.get_text(" ", strip=True)  # e.g. "Proj 111.65"
-    m = re.search(r"([\d.]+)", text)
-    return m.group(1) if m else "-"
-
-def parse_team_name(soup: BeautifulSoup) -> str:
-    """Team name for the current team (teamWrap-1)."""
-    matchup = soup.find("div", id="teamMatchupBoxScore")
-    if not matchup:
-        return "-"
-
-    team_wrap_1 = matchup.find("div", class_=_TEAM_WRAP_1)
-    if not team_wrap_1:
-        return "-"
-
-    h4 = team_wrap_1.find("h4")
-    return h4.get_text(" ", strip=True) if h4 else "-"
-
-
+        side = _wrap_side(tag)
+        if side in (1, 2):
+            (wraps if _inside(tag, matchup) else headers).setdefault(side, tag)
+
+    scans = {side: _scan_wrap(wrap, side) for side, wrap in wraps.items()}
+    header_scans = {side: _scan_header(wrap) for side, wrap in headers.items()}
+
+    pages: list[GamecenterPage] = []
+    for side in (1, 2):
+        if side == 2 and 2 not in scans:
+            break
+        other = 3 - side
+        scan = scans.get(side, _WrapScan())
+        other_scan = scans.get(other)
+        header = header_scans.get(side)
+        other_header = header_scans.get(other, _HeaderScan())
+        for what in ("owner", "total"):
+            if header is None or getattr(header, what) is None:
+                snippet = soup.get_text(" ", strip=True)[:300]
+                raise RuntimeError(f"No {what} in the side {side} header of gamecenter page. Page snippet: {snippet}")
+
+        projected = scan.projected
+        if projected is None:
+            # No teamWrap: the old parser fell back to searching the whole matchup
+            fallback = matchup.find(class_="teamTotalProjected") if matchup and side not in scans else None
+            m = _PROJ_NUM.search(fallback.get_text(" ", strip=True)) if fallback else None
+            projected = m.group(1) if m else "-"
+
+        if other_scan is None:
+            opponent = "-"
+        elif other_scan.h4 is not None:
+            opponent = other_scan.h4 or "-"
+        else:
+            opponent = other_scan.user_name or "-"
+
+        rank_m = _RANK_NUM.search(_text(header.rank)) if header.rank else None
+
+        pages.append(
+            GamecenterPage(
+                side=side,
+                team_id=_team_id_of(header.total),
+                owner=_text(header.owner),
+                team_name=(scan.h4 if scan.h4 is not None else "-"),
+                rank=rank_m.group(1) if rank_m else "-",
+                starter_slots=tuple(scan.slots or ()),
+                starters=tuple(scan.starters or ()),
+                bench=tuple(scan.bench or ()),
+                points=tuple(scan.points or ()),
+                total=_text(header.total),
+                projected=projected,
+                opponent=opponent,
+                opponent_total=_text(other_header.total),
+                opponent_id=_team_id_of(other_header.total),
+            )
+        )
+
+    return pages
@@ -7,6 +7,8 @@ from bs4 import BeautifulSoup, Tag
 
 from src.models import TeamSeasonRow
 
+PARSER_VERSION = 1  # bump when apply_playoffs results change
+
 
 _TEAM_ID_PATTERNS = [
     re.compile(r"/team/(\d+)\b"),
@@ -7,6 +7,9 @@ from bs4 import BeautifulSoup, Tag
 
 from src.models import TeamSeasonRow
 
+# Stamped into the standings manifest; bump when the parsed rows change
+PARSER_VERSION = 1
+
 
 _TEAM_ID_PATTERNS: list[Pattern[str]] = [
     re.compile(r"/team/(\d+)\b"),
@@ -0,0 +1,469 @@
+"""
+SQLite warehouse of the scrape outputs: one row per team-season (standings),
+per team-week (team_weeks) and per roster slot (player_slots), indexed for
+(season, week, manager) and player lookups.
+
+    python -m src.warehouse load                      # pick up new/changed CSVs
+    python -m src.warehouse export                    # rewrite the combined CSVs from it
+    python -m src.warehouse sql "SELECT player, SUM(points) FROM player_weeks GROUP BY player"
+
+Loading is incremental: each source CSV is recorded with its sha256 and
+only reloaded when that changes. The CSV artifacts are views or queries
+over these tables (all_seasons_standings, aggregated_standings,
+combined_rows()).
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import io
+import json
+import sqlite3
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional
+
+from src.combineWeeks import encode_header, encode_week_rows, union_header
+from src.config import BASE_OUTPUT_DIR, WAREHOUSE_PATH, cutoff_playoffs, league_id
+from src.utils.atomic import atomic_open
+from src.utils.normalize import normalize_manager_name
+
+SCHEMA_VERSION = 1  # bump when a table changes; the warehouse is then rebuilt
+
+# Week CSV layout (gamecenterCsvUtils.build_header): these lead and trail
+# every row, with (slot, Points) pairs in between
+_WEEK_LEAD = 9
+_WEEK_TRAIL = 4
+
+_TABLES = """
+CREATE TABLE sources (
+    path TEXT PRIMARY KEY,  -- relative to the output dir
+    kind TEXT NOT NULL,  -- "standings" | "week"
+    league_id TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    week INTEGER NOT NULL,  -- 0 for standings
+    sha256 TEXT NOT NULL,
+    header TEXT NOT NULL  -- JSON list, as in the CSV
+);
+
+CREATE TABLE standings (
+    source TEXT NOT NULL,
+    league_id TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    row_index INTEGER NOT NULL,
+    manager TEXT NOT NULL,  -- normalized
+    team_id TEXT,
+    team_name TEXT,
+    regular_season_rank TEXT,
+    wins TEXT,
+    losses TEXT,
+    ties TEXT,
+    points_for TEXT,
+    points_against TEXT,
+    playoff_rank TEXT,
+    moves TEXT,
+    trades TEXT,
+    extra TEXT  -- JSON object of any other columns
+);
+CREATE INDEX standings_source ON standings (source);
+CREATE INDEX standings_season_manager ON standings (league_id, season, manager);
+CREATE INDEX standings_manager ON standings (manager);
+
+CREATE TABLE team_weeks (
+    source TEXT NOT NULL,
+    league_id TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    week INTEGER NOT NULL,
+    row_index INTEGER NOT NULL,
+    manager TEXT NOT NULL,  -- normalized
+    team TEXT,
+    rank TEXT,
+    result TEXT,
+    diff TEXT,
+    top_starter TEXT,
+    top_starter_points TEXT,
+    low_starter TEXT,
+    low_starter_points TEXT,
+    total TEXT,
+    projected_total TEXT,
+    opponent TEXT,
+    opponent_total TEXT
+);
+CREATE INDEX team_weeks_source ON team_weeks (source);
+CREATE INDEX team_weeks_season_week_manager ON team_weeks (league_id, season, week, manager);
+CREATE INDEX team_weeks_manager ON team_weeks (manager);
+
+CREATE TABLE player_slots (
+    source TEXT NOT NULL,
+    league_id TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    week INTEGER NOT NULL,
+    row_index INTEGER NOT NULL,  -- team_weeks.row_index of the team
+    slot_index INTEGER NOT NULL,
+    manager TEXT NOT NULL,
+    slot TEXT NOT NULL,  -- QB, RB, ..., BN1, BN2, ...
+    bench INTEGER NOT NULL,
+    player TEXT NOT NULL,  -- "-" for an empty or padded slot
+    points TEXT NOT NULL
+);
+CREATE INDEX player_slots_source ON player_slots (source);
+CREATE INDEX player_slots_season_week_manager ON player_slots (league_id, season, week, manager);
+CREATE INDEX player_slots_player ON player_slots (player);
+"""
+
+# Typed views for ad-hoc queries, and the combined CSVs as SQL. Recreated on
+# every connect since aggregated_standings bakes in cutoff_playoffs.
+_VIEWS = """
+DROP VIEW IF EXISTS all_seasons_standings;
+CREATE VIEW all_seasons_standings AS
+SELECT league_id, season, row_index, manager, team_id, team_name, regular_season_rank,
+       CAST(wins AS INTEGER) AS wins, CAST(losses AS INTEGER) AS losses, CAST(ties AS INTEGER) AS ties,
+       CAST(REPLACE(points_for, ',', '') AS REAL) AS points_for,
+       CAST(REPLACE(points_against, ',', '') AS REAL) AS points_against,
+       CAST(playoff_rank AS INTEGER) AS playoff_rank,
+       CAST(moves AS INTEGER) AS moves, CAST(trades AS INTEGER) AS trades
+FROM standings;
+
+DROP VIEW IF EXISTS aggregated_standings;
+CREATE VIEW aggregated_standings AS
+WITH ranked AS (
+    SELECT *,
+           CAST(regular_season_rank AS INTEGER) AS reg_rank,
+           MAX(1, COUNT(*) OVER (PARTITION BY league_id, season) - 3) AS bottom_four_cutoff,
+           ROW_NUMBER() OVER (PARTITION BY league_id ORDER BY season, row_index) AS seen_at
+    FROM all_seasons_standings
+)
+SELECT league_id, manager,
+       MIN(seen_at) AS first_seen,  -- aggregate's order for names equal up to case
+       COUNT(DISTINCT season) AS seasons,
+       SUM(wins) AS wins, SUM(losses) AS losses, SUM(ties) AS ties,
+       SUM(points_for) AS points_for, SUM(points_against) AS points_against,
+       SUM(moves) AS moves, SUM(trades) AS trades,
+       SUM(playoff_rank > 0 AND playoff_rank <= MAX(1, {cutoff})) AS playoffs,
+       SUM(playoff_rank = 1) AS championships,
+       SUM(reg_rank > 0 AND reg_rank >= bottom_four_cutoff) AS toilet_bowls
+FROM ranked
+WHERE manager <> ''
+GROUP BY league_id, manager;
+
+DROP VIEW IF EXISTS weekly_results;
+CREATE VIEW weekly_results AS
+SELECT league_id, season, week, manager, team, rank, result,
+       CAST(total AS REAL) AS total, CAST(projected_total AS REAL) AS projected_total,
+       opponent, CAST(opponent_total AS REAL) AS opponent_total,
+       CASE WHEN diff = '-' THEN NULL ELSE CAST(diff AS REAL) END AS diff
+FROM team_weeks;
+
+DROP VIEW IF EXISTS player_weeks;
+CREATE VIEW player_weeks AS
+SELECT league_id, season, week, manager, slot, bench, player,
+       CASE WHEN points = '-' THEN NULL ELSE CAST(points AS REAL) END AS points
+FROM player_slots
+WHERE player <> '-';
+"""
+
+_STANDINGS_COLUMNS = {
+    "TeamID": "team_id",
+    "TeamName": "team_name",
+    "RegularSeasonRank": "regular_season_rank",
+    "Wins": "wins",
+    "Losses": "losses",
+    "Ties": "ties",
+    "PointsFor": "points_for",
+    "PointsAgainst": "points_against",
+    "PlayoffRank": "playoff_rank",
+    "Moves": "moves",
+    "Trades": "trades",
+}
+
+
+@dataclass
+class LoadStats:
+    loaded: int = 0
+    unchanged: int = 0
+    removed: int = 0
+
+    def describe(self) -> str:
+        return f"{self.loaded} CSV(s) loaded, {self.unchanged} unchanged, {self.removed} removed"
+
+
+@dataclass(frozen=True)
+class _Source:
+    path: Path
+    rel: str
+    kind: str
+    league_id: str
+    season: int
+    week: int
+
+
+def connect(path: Path = WAREHOUSE_PATH) -> sqlite3.Connection:
+    """Open (creating or upgrading) the warehouse."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        # Everything in it comes from the CSVs, so an old layout is just dropped and reloaded
+        with conn:
+            for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall():
+                conn.execute(f'DROP TABLE "{name}"')
+            conn.executescript(_TABLES)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    conn.executescript(_VIEWS.format(cutoff=int(cutoff_playoffs)))
+    return conn
+
+
+def _sources(base_output_dir: Path) -> list[_Source]:
+    """Every per-season standings CSV and week CSV under base_output_dir."""
+    found: list[_Source] = []
+    for standings_dir in sorted(base_output_dir.glob("*-history-standings")):
+        league = standings_dir.name.split("-history-")[0]
+        # all_seasons_standings.csv is derived, not a source
+        for csv_path in sorted(p for p in standings_dir.glob("*.csv") if p.stem.isdigit()):
+            rel = csv_path.relative_to(base_output_dir).as_posix()
+            found.append(_Source(csv_path, rel, "standings", league, int(csv_path.stem), 0))
+    for gamecenter_root in sorted(base_output_dir.glob("*-history-teamgamecenter")):
+        league = gamecenter_root.name.split("-history-")[0]
+        for season_dir in sorted(p for p in gamecenter_root.iterdir() if p.is_dir() and p.name.isdigit()):
+            for csv_path in season_dir.glob(f"{season_dir.name}-*.csv"):
+                week = csv_path.stem.split("-")[1]
+                if not week.isdigit():
+                    continue
+                rel = csv_path.relative_to(base_output_dir).as_posix()
+                found.append(_Source(csv_path, rel, "week", league, int(season_dir.name), int(week)))
+    return found
+
+
+def _load_standings(conn: sqlite3.Connection, source: _Source, header: list[str], rows: list[list[str]]) -> None:
+    if "ManagerName" not in header:
+        raise RuntimeError(f"{source.rel} missing ManagerName column")
+    values = []
+    for row_index, row in enumerate(rows):
+        by_name = dict(zip(header, row))
+        manager = normalize_manager_name(by_name.pop("ManagerName", ""))
+        known = [by_name.pop(col, None) for col in _STANDINGS_COLUMNS]
+        extra = json.dumps(by_name) if by_name else None
+        values.append((source.rel, source.league_id, source.season, row_index, manager, *known, extra))
+    conn.executemany(
+        f"INSERT INTO standings (source, league_id, season, row_index, manager, "
+        f"{', '.join(_STANDINGS_COLUMNS.values())}, extra) VALUES ({', '.join('?' * (6 + len(_STANDINGS_COLUMNS)))})",
+        values,
+    )
+
+
+def _load_week(conn: sqlite3.Connection, source: _Source, header: list[str], rows: list[list[str]]) -> None:
+    slots_end = len(header) - _WEEK_TRAIL
+    if slots_end < _WEEK_LEAD or (slots_end - _WEEK_LEAD) % 2:
+        raise RuntimeError(f"{source.rel}: unexpected week CSV header {header}")
+    slot_names = header[_WEEK_LEAD:slots_end:2]
+
+    teams = []
+    slots = []
+    for row_index, row in enumerate(rows):
+        row = row + [""] * (len(header) - len(row))
+        manager = normalize_manager_name(row[0])
+        teams.append(
+            (source.rel, source.league_id, source.season, source.week, row_index, manager)
+            + tuple(row[1:_WEEK_LEAD])
+            + tuple(row[slots_end : len(header)])
+        )
+        for slot_index, slot in enumerate(slot_names):
+            at = _WEEK_LEAD + 2 * slot_index
+            slots.append(
+                (
+                    source.rel,
+                    source.league_id,
+                    source.season,
+                    source.week,
+                    row_index,
+                    slot_index,
+                    manager,
+                    slot,
+                    int(slot.startswith("BN") and slot[2:].isdigit()),
+                    row[at],
+                    row[at + 1],
+                )
+            )
+    conn.executemany(f"INSERT INTO team_weeks VALUES ({', '.join('?' * 18)})", teams)
+    conn.executemany(f"INSERT INTO player_slots VALUES ({', '.join('?' * 11)})", slots)
+
+
+def _forget(conn: sqlite3.Connection, rel: str) -> None:
+    for table in ("standings", "team_weeks", "player_slots"):
+        conn.execute(f"DELETE FROM {table} WHERE source = ?", (rel,))
+    conn.execute("DELETE FROM sources WHERE path = ?", (rel,))
+
+
+def load(conn: sqlite3.Connection, base_output_dir: Path = BASE_OUTPUT_DIR) -> LoadStats:
+    """Bring the warehouse in line with the CSVs under base_output_dir, in one transaction."""
+    stats = LoadStats()
+    recorded = dict(conn.execute("SELECT path, sha256 FROM sources").fetchall())
+    with conn:
+        current = set()
+        for source in _sources(base_output_dir):
+            current.add(source.rel)
+            raw = source.path.read_bytes()
+            digest = hashlib.sha256(raw).hexdigest()
+            if recorded.get(source.rel) == digest:
+                stats.unchanged += 1
+                continue
+
+            rows = list(csv.reader(io.StringIO(raw.decode("utf-8"), newline="")))
+            header = rows[0] if rows else []
+            data_rows = [row for row in rows[1:] if row]
+            _forget(conn, source.rel)
+            if source.kind == "standings":
+                _load_standings(conn, source, header, data_rows)
+            else:
+                _load_week(conn, source, header, data_rows)
+            conn.execute(
+                "INSERT INTO sources VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (source.rel, source.kind, source.league_id, source.season, source.week, digest, json.dumps(header)),
+            )
+            stats.loaded += 1
+
+        for rel in recorded.keys() - current:
+            _forget(conn, rel)
+            stats.removed += 1
+    return stats
+
+
+def standings_rows(conn: sqlite3.Connection, league_id: str) -> Iterator[list[str]]:
+    """all_seasons_standings.csv (combineStandings), header first."""
+    expected: Optional[list[str]] = None
+    sources = conn.execute(
+        "SELECT path, season, header FROM sources WHERE kind = 'standings' AND league_id = ? ORDER BY path",
+        (league_id,),
+    ).fetchall()
+    for rel, season, header_json in sources:
+        header = json.loads(header_json)
+        if expected is None:
+            expected = header
+            yield ["Season"] + header
+        elif header != expected:
+            raise RuntimeError(f"Header mismatch in {rel}.\nExpected: {expected}\nGot:      {header}")
+
+        columns = ", ".join(["manager", *_STANDINGS_COLUMNS.values(), "extra"])
+        for manager, *known, extra in conn.execute(
+            f"SELECT {columns} FROM standings WHERE source = ? ORDER BY row_index", (rel,)
+        ):
+            by_name = {"ManagerName": manager, **dict(zip(_STANDINGS_COLUMNS, known)), **json.loads(extra or "{}")}
+            values = [by_name.get(col) for col in header]
+            # Missing values are the tail of a short row; combineStandings writes those as they are
+            while values and values[-1] is None:
+                values.pop()
+            yield [str(season)] + values
+
+
+def combined_rows(conn: sqlite3.Connection, league_id: str) -> bytes:
+    """all_seasons_combined.csv (combineWeeks), byte for byte."""
+    sources = conn.execute(
+        "SELECT path, season, week, header FROM sources WHERE kind = 'week' AND league_id = ? ORDER BY season, week",
+        (league_id,),
+    ).fetchall()
+    headers = [json.loads(header_json) for *_, header_json in sources]
+    union_cols = union_header(headers)
+    if not union_cols:
+        raise RuntimeError(f"No week CSVs for league {league_id} in the warehouse")
+
+    chunks = [encode_header(union_cols)]
+    for (rel, season, week, _), header in zip(sources, headers):
+        slots: dict[int, list[str]] = {}
+        for row_index, player, points in conn.execute(
+            "SELECT row_index, player, points FROM player_slots WHERE source = ? ORDER BY row_index, slot_index",
+            (rel,),
+        ):
+            slots.setdefault(row_index, []).extend((player, points))
+        rows = []
+        for row_index, *team in conn.execute(
+            "SELECT row_index, manager, team, rank, result, diff, top_starter, top_starter_points, low_starter, "
+            "low_starter_points, total, projected_total, opponent, opponent_total "
+            "FROM team_weeks WHERE source = ? ORDER BY row_index",
+            (rel,),
+        ):
+            rows.append(team[:_WEEK_LEAD] + slots.get(row_index, []) + team[_WEEK_LEAD:])
+        chunks.append(encode_week_rows(str(season), str(week), header, rows, union_cols))
+    return b"".join(chunks)
+
+
+def aggregated_rows(conn: sqlite3.Connection, league_id: str) -> Iterator[list[object]]:
+    """aggregated_standings_data.csv (aggregate), header first."""
+    yield [
+        "ManagerName",
+        "Seasons",
+        "Wins",
+        "Losses",
+        "Ties",
+        "PointsFor",
+        "PointsAgainst",
+        "Moves",
+        "Trades",
+        "Playoffs",
+        "Championships",
+        "Toilet Bowl",
+    ]
+    rows = conn.execute(
+        "SELECT manager, seasons, wins, losses, ties, points_for, points_against, moves, trades, playoffs, "
+        "championships, toilet_bowls FROM aggregated_standings WHERE league_id = ? ORDER BY first_seen",
+        (league_id,),
+    ).fetchall()
+    # Stable sort from first-seen order, as aggregate sorts its dict
+    for manager, seasons, wins, losses, ties, pf, pa, *rest in sorted(rows, key=lambda r: r[0].casefold()):
+        yield [manager, seasons, wins, losses, ties, f"{pf:.2f}", f"{pa:.2f}", *rest]
+
+
+def export(conn: sqlite3.Connection, league_id: str, base_output_dir: Path = BASE_OUTPUT_DIR) -> list[Path]:
+    """Rewrite the combined/aggregated CSVs of league_id from the warehouse."""
+    standings_csv = base_output_dir / f"{league_id}-history-standings" / "all_seasons_standings.csv"
+    combined_csv = base_output_dir / f"{league_id}-history-teamgamecenter" / "all_seasons_combined.csv"
+    aggregated_csv = base_output_dir / "aggregated_standings_data.csv"
+
+    for path, rows in (
+        (standings_csv, standings_rows(conn, league_id)),
+        (aggregated_csv, aggregated_rows(conn, league_id)),
+    ):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_open(path, "w", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerows(rows)
+
+    combined_csv.parent.mkdir(parents=True, exist_ok=True)
+    with atomic_open(combined_csv, "wb") as f:
+        f.write(combined_rows(conn, league_id))
+    # combineWeeks' sidecar describes the file it wrote; make it start over
+    (combined_csv.parent / ".combined.json").unlink(missing_ok=True)
+    return [standings_csv, combined_csv, aggregated_csv]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load the scrape outputs into SQLite and query or export them.")
+    parser.add_argument("--db", type=Path, default=WAREHOUSE_PATH)
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("load", help="Load new or changed CSVs (the default first step).")
+    export_parser = commands.add_parser("export", help="Load, then rewrite the combined/aggregated CSVs from SQL.")
+    export_parser.add_argument("--league", default=league_id)
+    sql_parser = commands.add_parser("sql", help="Run a query and print the result as CSV.")
+    sql_parser.add_argument("query")
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    try:
+        if args.command == "sql":
+            cursor = conn.execute(args.query)
+            writer = csv.writer(sys.stdout)
+            writer.writerow([d[0] for d in cursor.description or ()])
+            writer.writerows(cursor)
+            return
+
+        stats = load(conn)
+        print(f"Warehouse {args.db}: {stats.describe()}")
+        if args.command == "export":
+            for path in export(conn, args.league):
+                print(f"Wrote {path}")
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
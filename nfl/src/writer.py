@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import Iterable
 
 from src.models import TeamSeasonRow
+from src.utils.atomic import atomic_open
 
 
 CSV_HEADER: list[str] = [
@@ -34,7 +35,7 @@ def write_standings_csv(path: Path, rows: Iterable[TeamSeasonRow]) -> None:
 
     rows_sorted = sorted(rows, key=sort_key)
 
-    with path.open("w", newline="", encoding="utf-8") as f:
+    with atomic_open(path, "w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
         writer.writerow(CSV_HEADER)
 
@@ -0,0 +1,48 @@
+import json
+
+import src.aggregate as aggregate
+from benchmarks.dataset import build_dataset
+from src.aggregate import PARTIALS_NAME, aggregate_stats, write_aggregated_csv
+
+
+def _aggregated_csv(standings_dir, out, **kwargs) -> bytes:
+    write_aggregated_csv(out, aggregate_stats(standings_dir, processes=0, **kwargs))
+    return out.read_bytes()
+
+
+def test_cached_run_matches_cold_run(tmp_path):
+    standings_dir = build_dataset(tmp_path, league_id="7", seasons=4, teams=6, weeks=1).standings_dir
+    cold = _aggregated_csv(standings_dir, tmp_path / "cold.csv", cache=False)
+    assert not (standings_dir / PARTIALS_NAME).exists()
+
+    first = _aggregated_csv(standings_dir, tmp_path / "first.csv")
+    cached = _aggregated_csv(standings_dir, tmp_path / "cached.csv")
+    assert cold == first == cached
+
+
+def test_editing_one_season_recomputes_only_that_season(tmp_path, monkeypatch):
+    standings_dir = build_dataset(tmp_path, league_id="7", seasons=4, teams=6, weeks=1).standings_dir
+    _aggregated_csv(standings_dir, tmp_path / "first.csv")
+    before = set(json.loads((standings_dir / PARTIALS_NAME).read_text(encoding="utf-8"))["partials"])
+
+    edited = sorted(standings_dir.glob("*.csv"))[1]
+    text = edited.read_text(encoding="utf-8")
+    # One team's PointsFor (every one ends in .50)
+    edited.write_text(text.replace(".50,", ".75,", 1), encoding="utf-8")
+    assert edited.read_text(encoding="utf-8") != text
+
+    computed = []
+    season_partial = aggregate.season_partial
+
+    def counting(path, raw=None):
+        computed.append(path.name)
+        return season_partial(path, raw)
+
+    monkeypatch.setattr(aggregate, "season_partial", counting)
+    cached = _aggregated_csv(standings_dir, tmp_path / "cached.csv")
+    assert computed == [edited.name]
+
+    after = set(json.loads((standings_dir / PARTIALS_NAME).read_text(encoding="utf-8"))["partials"])
+    assert len(before - after) == len(after - before) == 1
+    monkeypatch.undo()
+    assert cached == _aggregated_csv(standings_dir, tmp_path / "cold.csv", cache=False)
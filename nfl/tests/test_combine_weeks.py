@@ -0,0 +1,102 @@
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from src.combineWeeks import combine_weeks
+
+LEAGUE = "7"
+HEADER = ["Owner", "TeamName", "Points", "Total"]
+
+
+@pytest.fixture
+def league(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path / "output" / f"{LEAGUE}-history-teamgamecenter"
+
+
+def _write_week(root: Path, season: int, week: int, header: list[str] = HEADER, extra: str = "") -> None:
+    path = root / str(season) / f"{season}-{week}.csv"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rows = [",".join(header)] + [
+        ",".join(f"{col}{team}w{week}{extra}" for col in header) for team in range(1, 4)
+    ]
+    path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+    # Distinct mtimes even on filesystems with coarse timestamps
+    stamp = path.stat().st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(stamp, stamp))
+
+
+def _combine(capsys) -> tuple[bytes, str]:
+    out = combine_weeks(LEAGUE).read_bytes()
+    return out, capsys.readouterr().out
+
+
+def _rebuilt(tmp_path: Path, monkeypatch, capsys) -> bytes:
+    copy = tmp_path / "rebuild"
+    shutil.rmtree(copy, ignore_errors=True)
+    shutil.copytree(tmp_path / "output", copy / "output")
+    with monkeypatch.context() as m:
+        m.chdir(copy)
+        out = combine_weeks(LEAGUE, rebuild=True).read_bytes()
+    capsys.readouterr()
+    return out
+
+
+def test_append_rewrites_only_the_new_week(league, tmp_path, monkeypatch, capsys):
+    for week in (1, 2):
+        _write_week(league, 2020, week)
+    _combine(capsys)
+
+    _write_week(league, 2020, 3)
+    out, log = _combine(capsys)
+    assert "rewrote 1 of 3 week files" in log
+    assert out == _rebuilt(tmp_path, monkeypatch, capsys)
+
+
+def test_changed_middle_week_rewrites_from_it(league, tmp_path, monkeypatch, capsys):
+    for week in (1, 2, 3):
+        _write_week(league, 2020, week)
+    _combine(capsys)
+
+    _write_week(league, 2020, 2, extra="x")
+    out, log = _combine(capsys)
+    assert "rewrote 2 of 3 week files" in log
+    assert b"Owner1w2x" in out
+    assert out == _rebuilt(tmp_path, monkeypatch, capsys)
+
+
+def test_touched_but_unchanged_week_is_kept(league, tmp_path, monkeypatch, capsys):
+    for week in (1, 2, 3):
+        _write_week(league, 2020, week)
+    before, _ = _combine(capsys)
+
+    week_two = league / "2020" / "2020-2.csv"
+    stamp = week_two.stat().st_mtime_ns + 5_000_000_000
+    os.utime(week_two, ns=(stamp, stamp))
+    out, log = _combine(capsys)
+    assert "up to date" in log
+    assert out == before == _rebuilt(tmp_path, monkeypatch, capsys)
+
+    # The new mtime was recorded: the next run doesn't need the hash either
+    _, log = _combine(capsys)
+    assert "up to date" in log
+
+
+def test_header_that_grows_or_shrinks_rewrites_everything(league, tmp_path, monkeypatch, capsys):
+    for week in (1, 2):
+        _write_week(league, 2020, week)
+    _combine(capsys)
+
+    _write_week(league, 2020, 3, header=HEADER + ["Note"])
+    out, log = _combine(capsys)
+    assert "Wrote combined file" in log
+    assert out.splitlines()[0] == b"Season,Week,Owner,TeamName,Points,Total,Note"
+    assert out == _rebuilt(tmp_path, monkeypatch, capsys)
+
+    _write_week(league, 2020, 3)
+    out, log = _combine(capsys)
+    assert "Wrote combined file" in log
+    assert out.splitlines()[0] == b"Season,Week,Owner,TeamName,Points,Total"
+    assert out == _rebuilt(tmp_path, monkeypatch, capsys)
@@ -0,0 +1,20 @@
+from src.html_archive import HtmlArchive
+
+
+def test_torn_index_line_is_skipped_and_ended(tmp_path):
+    archive = HtmlArchive(tmp_path)
+    good = archive.put("https://example.test/a", b"<html>a</html>", encoding="utf-8")
+    # A crash mid-append: half of the next entry, no newline
+    with archive.index_path.open("a", encoding="utf-8") as f:
+        f.write('{"url": "https://example.test/b", "fetched_at": 1.0, "sha2')
+
+    reopened = HtmlArchive(tmp_path)
+    assert reopened.latest("https://example.test/a") == good
+    assert reopened.latest("https://example.test/b") is None
+    assert reopened.read(good) == b"<html>a</html>"
+
+    added = reopened.put("https://example.test/c", b"<html>c</html>")
+    again = HtmlArchive(tmp_path)
+    assert again.latest("https://example.test/a") == good
+    assert again.latest("https://example.test/c") == added
+    assert archive.index_path.read_text(encoding="utf-8").endswith("\n")
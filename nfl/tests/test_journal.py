@@ -0,0 +1,30 @@
+from src.journal import ScrapeJournal
+from src.utils.parse_gamecenter import GamecenterPage
+
+
+def _page(team_id: int, total: str) -> GamecenterPage:
+    return GamecenterPage(
+        side=1, team_id=team_id, owner=f"Owner{team_id}", team_name=f"Team {team_id}", rank="1",
+        starter_slots=("QB",), starters=("A",), bench=(), points=("1.00",), total=total,
+        projected="-", opponent="-", opponent_total="-", opponent_id=None,
+    )
+
+
+def test_pages_for_uses_latest_and_compacts_superseded_entries(tmp_path):
+    path = tmp_path / ".journal.jsonl"
+    journal = ScrapeJournal(path)
+    for total in ("1.00", "2.00", "3.00", "4.00"):
+        journal.record_page(season=2020, week=1, team_id=1, records=[_page(1, total)])
+    journal.record_page(season=2020, week=2, team_id=1, records=[_page(1, "5.00")])
+    assert journal.pages_for(season=2020, week=1) == {1: [_page(1, "4.00")]}
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 5
+
+    # Reopening drops the three refetched copies (3 superseded > 2 live)
+    reopened = ScrapeJournal(path)
+    assert reopened.pages_for(season=2020, week=1) == {1: [_page(1, "4.00")]}
+    assert reopened.pages_for(season=2020, week=2) == {1: [_page(1, "5.00")]}
+    assert reopened.pages_for(season=2020, week=3) == {}
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+
+    reopened.record_page(season=2020, week=3, team_id=2, records=[_page(2, "6.00")])
+    assert ScrapeJournal(path).pages_for(season=2020, week=3) == {2: [_page(2, "6.00")]}
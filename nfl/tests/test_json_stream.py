@@ -0,0 +1,37 @@
+import shutil
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "utils" / "json-converters"))
+
+from json_stream import ShardWriter  # noqa: E402
+
+
+def _write(root, shards, **kwargs):
+    writer = ShardWriter(root, **kwargs)
+    for key, value in shards.items():
+        writer.put(key.split("/"), value, source_digest=repr(value))
+    writer.close()
+    return writer
+
+
+def test_switching_layout_and_format_removes_old_shards(tmp_path):
+    root = tmp_path / "shards"
+    _write(root, {"2006/1": [1], "2006/2": [2], "2007/1": [3]})
+    assert (root / "2006" / "1.json.gz").exists()
+
+    # Another layout in another format: nothing can be reused, everything old goes
+    _write(root, {"2006": [1, 2], "2007": [3]}, indent=None)
+    files = sorted(p.relative_to(root).as_posix() for p in root.rglob("*") if p.is_file())
+    assert files == ["2006.json", "2006.json.gz", "2007.json", "2007.json.gz", "index.json"]
+
+
+def test_unchanged_shards_are_reused_and_missing_directories_tolerated(tmp_path):
+    root = tmp_path / "shards"
+    _write(root, {"2006/1": [1], "2007/1": [3]})
+    again = _write(root, {"2006/1": [1], "2007/1": [3]})
+    assert (again.written, again.unchanged) == (0, 2)
+
+    shutil.rmtree(root / "2007")
+    _write(root, {"2006/1": [1]})
+    assert sorted(p.name for p in root.iterdir()) == ["2006", "index.json"]
@@ -0,0 +1,30 @@
+import pytest
+
+from benchmarks.synthetic import gamecenter_html
+from src.page_parser import parse_html
+from src.utils.parse_gamecenter import extract_gamecenter
+
+
+def _extract(html: str):
+    return extract_gamecenter(parse_html(html.encode(), page_type="gamecenter", strain=False))
+
+
+def test_each_side_reads_its_own_header():
+    # team 2 plays team 3 in week 1; the signed-in user's name sits in the nav,
+    # ahead of both headers, with the same classes as an owner span
+    html = gamecenter_html(team_id=2, week=1, teams=4).replace(
+        '<div class="nav">', '<div class="nav"><span class="userName userId-999">Me</span>'
+    )
+    one, two = _extract(html)
+    assert (one.owner, one.team_id, one.rank, one.opponent_id) == ("Owner2", 2, "2", 3)
+    assert (two.owner, two.team_id, two.rank, two.opponent_id) == ("Owner3", 3, "3", 2)
+    assert one.opponent_total == two.total and two.opponent_total == one.total
+
+
+def test_missing_header_element_raises():
+    html = gamecenter_html(team_id=2, week=1, teams=4)
+    header_two = html.index('<div class="teamWrap teamWrap-2"><span class="userName')
+    total_two = html.index('<div class="teamTotal teamId-3">', header_two)
+    html = html[:total_two] + html[total_two:].replace('class="teamTotal teamId-3"', 'class="other"', 1)
+    with pytest.raises(RuntimeError, match="No total in the side 2 header"):
+        _extract(html)